@@ -0,0 +1,59 @@
+"""
+Time from `AssetLoader` construction until every sprite is ready, and the process's peak RSS, for the per-file path
+(decode 55 PNGs, scale and composite) against the packed atlas, both on a cold raw pixel cache (decode the sheet PNG)
+and a warm one (memory-map it). Each mode runs in a fresh process.
+
+Usage: python benchmarks/asset_loading.py [runs]
+"""
+
+import os, resource, subprocess, sys, tempfile, time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+MODES = ["per-file", "atlas-cold", "atlas-warm"]
+
+
+def run(mode: str) -> None:
+    import pygame as pg
+    from blackjack.sprites import build_sprites
+    from blackjack import atlas
+    from blackjack.state.loading import AssetLoader
+
+    pg.display.set_mode((1920, 1080))
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    loader = AssetLoader(use_atlas=mode != "per-file")
+    results = []
+    while loader.pending:
+        results.extend(loader.collect())
+    if loader.index is not None:
+        sprites = atlas.cut(loader.index, results[0])
+    else:
+        sprites = build_sprites(dict(results))
+    elapsed = time.perf_counter() - start
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before
+    print(f"{mode:11} {elapsed * 1000:8.1f} ms   {len(sprites)} sprites   peak RSS +{peak / 1024:.1f} MiB")
+
+
+def main() -> None:
+    if len(sys.argv) > 2 and sys.argv[1] == "--mode":
+        run(sys.argv[2])
+        return
+
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    with tempfile.TemporaryDirectory() as cache:
+        env = {**os.environ, "BLACKJACK_CACHE_DIR": cache}
+        for _ in range(runs):
+            for mode in MODES:
+                if mode == "atlas-cold":
+                    for name in os.listdir(cache):
+                        os.remove(os.path.join(cache, name))
+                subprocess.run(
+                    [sys.executable, __file__, "--mode", mode], env=env, check=True, stderr=subprocess.DEVNULL
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Frame-time benchmark for drawing every card on a full table.
+
+Compares the old per-frame scale/composite path of `Card.draw` against blitting the sprites built by
+`blackjack.sprites.build_sprites`. Runs headless with the SDL dummy video driver.
+
+Usage: python benchmarks/card_draw.py [frames]
+"""
+
+import os, sys, time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+from blackjack.sprites import build_sprites
+from blackjack.state.loading import AssetLoader
+from blackjack.util import Vec2
+
+
+def legacy_draw(display: pg.Surface, images: dict, image_key: str, pos: Vec2) -> None:
+    """The pre-sprite-cache body of `Card.draw`"""
+    card_front = images["0cardfront"]
+    card_front = pg.transform.scale(card_front, (card_front.get_width() * 0.14, card_front.get_height() * 0.14))
+
+    card = pg.Surface(card_front.get_size(), pg.SRCALPHA)
+    card.blit(card_front, (0, 0))
+    scaled_face = pg.transform.scale(images[image_key], (card.get_width() * 0.7, card.get_height() * 0.7))
+    card.blit(
+        scaled_face,
+        ((card.get_width() - scaled_face.get_width()) // 2, (card.get_height() - scaled_face.get_height()) // 2),
+    )
+    display.blit(card, pg.rect.Rect(pos.x, pos.y, card.get_width(), card.get_height()))
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    pg.init()
+    display = pg.display.set_mode((1920, 1080))
+
+    loader = AssetLoader()
+    images = {}
+    while (t := loader.load_next()) is not None:
+        images[t[0]] = t[1]
+
+    sprites = build_sprites(images)
+
+    # 5 seats x 4 hands x 3 cards
+    keys = [k for k in images if not k.startswith("0") and k != "chip"]
+    cards = [(keys[i % len(keys)], Vec2(100 + (i % 20) * 80, 200 + (i // 20) * 150)) for i in range(5 * 4 * 3)]
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        for key, pos in cards:
+            legacy_draw(display, images, key, pos)
+    legacy = (time.perf_counter() - start) / frames
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        for key, pos in cards:
+            display.blit(sprites[key], (pos.x, pos.y))
+    cached = (time.perf_counter() - start) / frames
+
+    print(f"{len(cards)} cards/frame, {frames} frames")
+    print(f"legacy   {legacy * 1000:8.3f} ms/frame")
+    print(f"cached   {cached * 1000:8.3f} ms/frame  ({legacy / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Bytes allocated per dealt card: the old string-queue deck with one `Card` object per pop, against the compact shoe of
+card codes with interned cards (headless) or `DealtCard` records (table).
+
+Usage: python benchmarks/card_memory.py [shoes]
+"""
+
+import os, sys, itertools, random, tracemalloc
+from queue import LifoQueue
+from typing import Callable, List
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from blackjack.engine import Deck, bare_card
+from blackjack.state.table import DealtCard
+
+
+class LegacyCard:
+    """The pre-flyweight card: every attribute in a per-instance __dict__"""
+
+    def __init__(self, value: int, suit: str, image_key: str) -> None:
+        self.value = value
+        self.suit = suit
+        self.image_key = image_key
+        self.is_ace = value == -1
+        self.is_facedown = False
+
+
+class LegacyDeck:
+    def __init__(self, n_decks: int) -> None:
+        self._card_queue: LifoQueue[str] = LifoQueue()
+        self.n_decks = n_decks
+
+    def new_shuffled_deck(self) -> None:
+        cards = [
+            [
+                "_of_".join(card)
+                for card in itertools.product(
+                    ["2", "3", "4", "5", "6", "7", "8", "9", "10", "ace", "jack", "queen", "king"],
+                    ["diamonds", "clubs", "hearts", "spades"],
+                )
+            ]
+            for _ in range(0, self.n_decks)
+        ]
+        flattened = list(itertools.chain(*cards))
+        random.shuffle(flattened)
+        self._card_queue.queue = flattened
+
+    def poptop(self) -> LegacyCard:
+        top = self._card_queue.get()
+        value, suit = (parts := top.split("_"))[0], parts[-1]
+        val = 10 if value in ["jack", "queen", "king"] else -1 if value == "ace" else int(value)
+        return LegacyCard(val, suit, top)
+
+
+def bytes_per_card(make_deck: Callable[[], object], shoes: int) -> float:
+    """Shuffles and deals `shoes` full shoes, keeping every dealt card alive as hands on the table would"""
+    tracemalloc.start()
+    dealt: List[object] = []
+    deck = make_deck()
+    for _ in range(shoes):
+        deck.new_shuffled_deck()  # type: ignore[attr-defined]
+        dealt.extend(deck.poptop() for _ in range(6 * 52))  # type: ignore[attr-defined]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(dealt)
+
+
+def main() -> None:
+    shoes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    for name, make_deck in [
+        ("legacy (str queue + Card)", lambda: LegacyDeck(6)),
+        ("codes + DealtCard", lambda: Deck(6, card_type=DealtCard)),
+        ("codes + interned Card", lambda: Deck(6, card_type=bare_card)),
+    ]:
+        print(f"{name:28} {bytes_per_card(make_deck, shoes):8.1f} bytes/dealt card")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Queries per second of `blackjack.odds.dealer_outcomes` on a 6 deck shoe: cold (a fresh cache for every composition)
+and warm (the same compositions asked again, as happens during play and simulation).
+
+Usage: python benchmarks/dealer_odds.py [queries]
+"""
+
+import random, sys, time
+
+from blackjack import odds
+
+
+def compositions(n: int, rng: random.Random):
+    """Shoes with a random handful of cards already dealt, and an upcard drawn from what is left"""
+    shoe = [rank for rank in odds.RANKS for _ in range(odds.full_shoe(6)[rank])]
+    for _ in range(n):
+        rng.shuffle(shoe)
+        dealt, upcard = shoe[: rng.randrange(0, 60)], shoe[60]
+        counts = list(odds.full_shoe(6))
+        for rank in dealt + [upcard]:
+            counts[rank] -= 1
+        yield counts, upcard
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    queries = list(compositions(n, random.Random(1)))
+
+    odds.cache_clear()
+    start = time.perf_counter()
+    for counts, upcard in queries:
+        odds.dealer_outcomes(counts, upcard)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(100):
+        for counts, upcard in queries:
+            odds.dealer_outcomes(counts, upcard)
+    warm = (time.perf_counter() - start) / 100
+
+    print(f"cold  {n / cold:>12,.0f} queries/s")
+    print(f"warm  {n / warm:>12,.0f} queries/s")
+    print(odds.cache_info())
+
+
+if __name__ == "__main__":
+    main()
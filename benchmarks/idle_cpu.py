@@ -0,0 +1,53 @@
+"""
+CPU usage of a table sitting in the bet prompt (`UIState.Bet`, nothing moving), with the fixed 60 fps loop against
+the adaptive pacing of `App.pace`. Reported as CPU seconds per wall second, i.e. the fraction of a core in use.
+
+Usage: python benchmarks/idle_cpu.py [seconds]
+"""
+
+import os, sys, time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from blackjack import App
+from blackjack.state.loading import Loading
+from blackjack.state.table import Table
+from blackjack.ui import UIState
+
+
+def measure(app: App, seconds: float, adaptive: bool) -> float:
+    idle = type(app.state).is_idle
+    if not adaptive:
+        type(app.state).is_idle = lambda self: False  # type: ignore[method-assign]
+
+    frames = 0
+    wall, cpu = time.perf_counter(), time.process_time()
+    while time.perf_counter() - wall < seconds:
+        app.update()
+        app.render()
+        app.present()
+        app.pace()
+        frames += 1
+    usage = (time.process_time() - cpu) / (time.perf_counter() - wall)
+
+    type(app.state).is_idle = idle  # type: ignore[method-assign]
+    print(f"{'adaptive' if adaptive else 'fixed 60'}  {usage * 100:5.1f}% of a core   {frames} frames")
+    return usage
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    app = App(Loading)
+    while not (isinstance(app.state, Table) and app.ui_state == UIState.Bet and app.state.is_idle()):
+        app.update()
+        app.render()
+        app.present()
+        app.pace()
+
+    measure(app, seconds, adaptive=False)
+    measure(app, seconds, adaptive=True)
+
+
+if __name__ == "__main__":
+    main()
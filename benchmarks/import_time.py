@@ -0,0 +1,47 @@
+"""
+Time to import each of the package's entry points in a fresh interpreter, parent packages included, and whether it
+pulls in pygame. The best of a few runs is kept, since the first one also pays for a cold disk cache. For a breakdown,
+run `python -X importtime -c "import <module>"`.
+
+Usage: python benchmarks/import_time.py [runs]
+"""
+
+import subprocess, sys
+
+MODULES = [
+    "blackjack",
+    "blackjack.engine",
+    "blackjack.sim",
+    "blackjack.odds",
+    "blackjack.state.table",
+    "blackjack.app",
+]
+
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start, "pygame" in sys.modules)
+"""
+
+
+def import_time(module: str) -> tuple:
+    """(seconds, whether pygame was imported)"""
+    stdout = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(module=module)], capture_output=True, text=True, check=True
+    ).stdout
+    seconds, pygame = stdout.split()[-2:]
+    return float(seconds), pygame == "True"
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    for module in MODULES:
+        times, pygame = zip(*(import_time(module) for _ in range(runs)))
+        print(f"{module:24} {min(times) * 1000:8.1f} ms   {'pygame' if pygame[0] else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Cost of handling input: replays a recorded burst of mouse motion (a sweep back and forth over the turn buttons, as a
+player hesitating between actions produces) through `App.handle_events` during the player's turn, first with the
+stock UI and then with extra buttons spread over the screen.
+
+Usage: python benchmarks/input_dispatch.py [events]
+"""
+
+import math, os, random, sys, time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+from blackjack import App
+from blackjack.engine import ActionType
+from blackjack.state.loading import Loading
+from blackjack.state.table import Table
+from blackjack.ui import TurnButton, UIState
+
+
+def record_burst(app: App, n: int) -> list:
+    """Mouse motion events at 1000 Hz, sweeping over the row of turn buttons with a little jitter"""
+    rng = random.Random(1)
+    buttons = [u for u in app.ui_objects if type(u) == TurnButton]
+    left = min(b.rect.left for b in buttons) - 50
+    right = max(b.rect.right for b in buttons) + 50
+    y = buttons[0].rect.centery
+
+    events, last = [], (left, y)
+    for i in range(n):
+        x = left + (right - left) * (0.5 - 0.5 * math.cos(i / 400))
+        pos = (int(x), int(y + 60 * math.sin(i / 97) + rng.randint(-3, 3)))
+        rel = (pos[0] - last[0], pos[1] - last[1])
+        events.append(pg.event.Event(pg.MOUSEMOTION, pos=pos, rel=rel, buttons=(0, 0, 0), touch=False))
+        last = pos
+    return events
+
+
+def replay(app: App, burst: list) -> float:
+    """Seconds per event"""
+    start = time.perf_counter()
+    for i in range(0, len(burst), 100):
+        app.waited_events = burst[i : i + 100]
+        app.handle_events()
+    return (time.perf_counter() - start) / len(burst)
+
+
+def add_widgets(app: App, n: int) -> None:
+    """`n` more (small) turn buttons on a grid over the whole screen"""
+    w, h = app.display.get_size()
+    cols = math.ceil(math.sqrt(n * w / h))
+    for i in range(n):
+        button = TurnButton(app, ActionType.Hit, UIState.Turn)
+        button.radius = 20
+        button.rect = pg.Rect(0, 0, 40, 40)
+        button.rect.center = (int((i % cols + 0.5) * w / cols), int((i // cols + 0.5) * h / math.ceil(n / cols)))
+        app.add_ui_object(button)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    app = App(Loading)
+    while not isinstance(app.state, Table):
+        app.update()
+        app.render()
+    app.ui_state = UIState.Turn
+
+    burst = record_burst(app, n)
+    replay(app, burst[:1000])
+
+    widgets = 4
+    for extra in [0, 4, 28, 124]:
+        add_widgets(app, extra - (widgets - 4))
+        widgets = 4 + extra
+        print(f"{widgets:4} widgets: {replay(app, burst) * 1e6:6.2f} us/event")
+
+
+if __name__ == "__main__":
+    main()
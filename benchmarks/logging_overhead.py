@@ -0,0 +1,59 @@
+"""
+What logging costs the game thread: per simulated round (`blackjack.sim.simulate`, where every bot decision logs a
+line) and per frame of a headless table playing itself in instant turbo mode, with logging off and on.
+
+Usage: python benchmarks/logging_overhead.py [rounds] [frames]
+"""
+
+import math, os, sys, tempfile, time
+
+import pygame as pg
+
+from blackjack import App, log
+from blackjack.headless import Autoplayer, drive
+from blackjack.sim import simulate
+from blackjack.state.loading import Loading
+from blackjack.state.table import Table
+
+
+def per_round(rounds: int) -> float:
+    simulate(rounds // 10, seed=1)
+    start = time.perf_counter()
+    stats = simulate(rounds, seed=1)
+    return (time.perf_counter() - start) / stats.rounds
+
+
+def per_frame(app: App, frames: int) -> float:
+    script = Autoplayer(seed=1)
+    drive(app, script, frames // 10)
+
+    start = time.perf_counter()
+    drive(app, script, frames)
+    return (time.perf_counter() - start) / frames
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+
+    # Created first, as creating an App sets logging up from BLACKJACK_ENABLE_LOGGING
+    app = App(Loading, headless=True, resolution=(1280, 720), animation_speed=math.inf)
+    while not isinstance(app.state, Table):
+        app.update()
+        app.render()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for enabled in [False, True]:
+            path = os.path.join(directory, "bench.log")
+            log.setup(enabled, path)
+            round_s, frame_s = per_round(rounds), per_frame(app, frames)
+            log.setup(False)
+            lines = sum(1 for _ in open(path)) if enabled else 0
+            name = "on" if enabled else "off"
+            print(f"{name:4} {round_s * 1e6:8.2f} µs/round {frame_s * 1e3:8.3f} ms/frame {lines:>10,} lines")
+
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
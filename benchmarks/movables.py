@@ -0,0 +1,84 @@
+"""
+Cost of one animation tick with hundreds of cards in flight (a mass burn), for the old per-object `Movable.move`
+built on `Vec2` arithmetic against the batched `Movables.step`. Reports time and net new memory blocks per tick.
+
+Usage: python benchmarks/movables.py [cards]
+"""
+
+import os, sys, time, tracemalloc
+from typing import List
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from blackjack.engine import CARDS
+from blackjack.state.table import DealtCard, Movable, Movables
+from blackjack.util import Vec2
+
+DT = 1 / 120
+
+
+class LegacyMovable:
+    """The pre-batching `Movable`"""
+
+    def __init__(self, obj: DealtCard, dest: Vec2, speed: int) -> None:
+        self.obj, self.dest, self.speed = obj, dest, speed
+
+    def move(self, dt: float) -> None:
+        direction = (self.dest - self.obj.pos).unit()
+        scaled_direction = direction * self.speed * dt
+        if (self.dest - self.obj.pos).magn() < scaled_direction.magn():
+            self.obj.pos = self.dest
+        else:
+            self.obj.pos += Vec2(direction.x * self.speed * dt, direction.y * self.speed * dt)
+
+    def is_done(self) -> bool:
+        return self.obj.pos.x == self.dest.x and self.obj.pos.y == self.dest.y
+
+
+def cards(n: int) -> List[DealtCard]:
+    out = []
+    for i in range(n):
+        card = DealtCard(CARDS[i % 52])
+        card.pos = Vec2(100 + i % 40 * 40, 700 + i // 40 * 20)
+        out.append(card)
+    return out
+
+
+def legacy_tick(flying: List[LegacyMovable]) -> None:
+    for movable in list(flying):
+        movable.move(DT)
+        if movable.is_done():
+            flying.remove(movable)
+
+
+def measure(name: str, tick, ticks: int = 20) -> None:
+    start = time.perf_counter()
+    for _ in range(ticks):
+        tick()
+    elapsed = (time.perf_counter() - start) / ticks
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tick()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    print(f"{name:8} {elapsed * 1e6:9.1f} us/tick   {blocks:6} net new blocks per tick")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    burn = Vec2(30, 30)
+
+    legacy = [LegacyMovable(card, Vec2(burn.x, burn.y), 550) for card in cards(n)]
+    measure("legacy", lambda: legacy_tick(legacy))
+
+    batched = Movables()
+    for card in cards(n):
+        batched.append(Movable(card, Vec2(burn.x, burn.y), 550))
+    measure("batched", lambda: batched.step(DT))
+    print(f"{n} cards in flight")
+
+
+if __name__ == "__main__":
+    main()
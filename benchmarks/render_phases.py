@@ -0,0 +1,70 @@
+"""
+Frame times of every phase of a round, in a headless app with an offscreen display and the human player driven by
+`blackjack.headless.Autoplayer`. Prints JSON, so build servers can track it.
+
+Usage: python benchmarks/render_phases.py [frames] [resolution, e.g. 1920x1080]
+Set BLACKJACK_DIRTY_RECTS=no to measure full redraws.
+"""
+
+import json, statistics, sys, time
+
+import pygame as pg
+
+from blackjack import App
+from blackjack.app import DIRTY_RECTS, parse_resolution
+from blackjack.headless import Autoplayer
+from blackjack.state.loading import Loading
+from blackjack.state.table import Table
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    resolution = parse_resolution(sys.argv[2] if len(sys.argv) > 2 else "1920x1080")
+
+    app = App(Loading, headless=True, resolution=resolution)
+    script = Autoplayer(seed=1)
+    frame_time = 1 / 60
+
+    updates: dict = {}
+    renders: dict = {}
+    for _ in range(frames):
+        for event in script(app):
+            pg.event.post(event)
+
+        app.frame_time = frame_time
+        start = time.perf_counter()
+        app.update()
+        updated = time.perf_counter()
+        app.render()
+        app.present()
+        rendered = time.perf_counter()
+
+        phase = app.state.game_phase.name if isinstance(app.state, Table) else type(app.state).__name__
+        updates.setdefault(phase, []).append(updated - start)
+        renders.setdefault(phase, []).append(rendered - updated)
+
+    def ms(seconds: float) -> float:
+        return round(seconds * 1000, 4)
+
+    report = {
+        "resolution": list(resolution),
+        "dirty_rects": DIRTY_RECTS == "yes",
+        "frames": frames,
+        "game_seconds_per_frame": round(frame_time, 6),
+        "phases": {
+            phase: {
+                "frames": len(times),
+                "update_mean_ms": ms(statistics.fmean(updates[phase])),
+                "render_mean_ms": ms(statistics.fmean(times)),
+                "render_p50_ms": ms(statistics.median(times)),
+                "render_p95_ms": ms(sorted(times)[int(len(times) * 0.95)]),
+                "render_max_ms": ms(max(times)),
+            }
+            for phase, times in renders.items()
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+Single-process throughput of the object engine (`blackjack.sim.simulate`) against the numpy batch backend
+(`blackjack.vectorized.simulate_vectorized`).
+
+Usage: python benchmarks/sim_backends.py [rounds]
+"""
+
+import sys, time
+
+from blackjack.sim import simulate
+from blackjack.vectorized import simulate_vectorized
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    for name, fn in [("object", simulate), ("numpy", simulate_vectorized)]:
+        start = time.perf_counter()
+        stats = fn(rounds, seed=1)
+        elapsed = time.perf_counter() - start
+        print(f"{name:8} {stats.rounds / elapsed:>12,.0f} rounds/s   house edge {stats.house_edge * 100:+.3f}%")
+
+
+if __name__ == "__main__":
+    main()
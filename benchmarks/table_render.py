@@ -0,0 +1,91 @@
+"""
+Per-frame cost of drawing a dealt table: the old `Table.render` (zones redrawn and the deck card loaded from disk
+every frame), the full redraw over the cached background, and dirty-rect rendering while idle and while one card is
+moving. Runs headless with the SDL dummy video driver, so presenting the frame costs next to nothing here; on a real
+display the full-frame flip is saved as well.
+
+Usage: python benchmarks/table_render.py [frames]
+"""
+
+import os, sys, time
+from importlib import resources as impresources
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+from blackjack import App
+from blackjack.engine import CARDS
+from blackjack.state.loading import Loading
+from blackjack.state.table import DealtCard, Table
+from blackjack.util import Vec2
+
+
+def legacy_render(table: Table) -> None:
+    """The zone and deck part of the pre-background `Table.render`; the objects and text are drawn as now"""
+    table.ctx.display.fill((20, 20, 20))
+    for zone_name, rect in table.ctx.zones.items():
+        if "hand" in zone_name:
+            pg.draw.rect(table.ctx.display, (80, 140, 60), rect)
+        if "stat" in zone_name:
+            pg.draw.rect(table.ctx.display, (80, 80, 80), rect)
+        if "bet" in zone_name:
+            pg.draw.rect(table.ctx.display, (30, 30, 30), rect)
+        if zone_name == "deck":
+            card = pg.image.load(str(impresources.files("blackjack").joinpath("assets/0cardback.png")))
+            card = pg.transform.scale(card, (card.get_width() * 0.14, card.get_height() * 0.14))
+            table.ctx.display.blit(card, rect)
+    table.ctx.display.blits(table.scene(), doreturn=False)
+
+
+def time_frames(frames: int, frame) -> float:
+    start = time.perf_counter()
+    for n in range(frames):
+        frame(n)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+
+    app = App(Loading)
+    while not isinstance(app.state, Table):
+        app.update()
+        app.render()
+    table = app.state
+
+    for idx, zone in enumerate(z for name, z in app.zones.items() if name.startswith("hand_")):
+        card = DealtCard(CARDS[idx % 52])
+        card.pos = Vec2(*zone.topleft)
+        table.game_objects.append(card)
+
+    def legacy(_: int) -> None:
+        legacy_render(table)
+        pg.display.flip()
+
+    # Every call is a new frame, whose scene `Table.frame_scene` mustn't reuse from the last one
+    def full(_: int) -> None:
+        app.frame += 1
+        table.render()
+        pg.display.flip()
+
+    def dirty(_: int) -> None:
+        app.frame += 1
+        rects = table.render_dirty([])
+        if rects:
+            pg.display.update(rects)
+
+    moving = table.game_objects[-1]
+
+    def dirty_moving(n: int) -> None:
+        moving.pos = Vec2(100 + n % 800, 300)
+        dirty(n)
+
+    for name, frame in [("legacy", legacy), ("full", full), ("dirty idle", dirty), ("dirty moving", dirty_moving)]:
+        table.last_scene = None
+        frame(0)
+        print(f"{name:13} {time_frames(frames, frame):7.3f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Logic cost per tick of a table playing itself (player auto-bets and stands, instant animations, no rendering), with a
+cProfile breakdown of where the time goes.
+
+Usage: python benchmarks/table_ticks.py [ticks]
+"""
+
+import cProfile, math, os, pstats, sys, time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+from blackjack import App
+from blackjack.state.loading import Loading
+from blackjack.state.table import Table
+from blackjack.ui import TurnButton, UIState
+
+
+def play(app: App, ticks: int) -> None:
+    for _ in range(ticks):
+        if app.ui_state == UIState.Bet:
+            app.ui_objects[1].bet_val = "500"
+            app.ui_objects[1].handle_key_update(pg.event.Event(pg.KEYDOWN, key=pg.K_RETURN))
+        if app.ui_state == UIState.Turn:
+            for u in app.ui_objects:
+                if type(u) == TurnButton and u.action_type.name == "Stand" and not u.is_disabled:
+                    u.is_clicked = True
+        app.tick()
+
+
+def main() -> None:
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    app = App(Loading, animation_speed=math.inf)
+    while not isinstance(app.state, Table):
+        app.update()
+        app.render()
+
+    play(app, 1000)
+    start = time.perf_counter()
+    play(app, ticks)
+    print(f"{(time.perf_counter() - start) / ticks * 1e6:.1f} us/tick")
+
+    profile = cProfile.Profile()
+    profile.runcall(play, app, ticks)
+    pstats.Stats(profile).sort_stats("tottime").print_stats(8)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Rounds per minute through the real GUI loop (headless, 60 fps cap) at each animation speed of `App.animation_speed`,
+with the human player auto-betting 500 and standing. Each mode runs in a fresh process.
+
+Usage: python benchmarks/turbo.py [seconds per mode]
+"""
+
+import math, os, subprocess, sys, time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+def run(animation_speed: float, seconds: float) -> None:
+    import pygame as pg
+    from blackjack import App
+    from blackjack.state.loading import Loading
+    from blackjack.state.table import GamePhase, Table
+    from blackjack.ui import TurnButton, UIState
+
+    app = App(Loading, animation_speed=animation_speed)
+    while not isinstance(app.state, Table):
+        app.update()
+        app.render()
+        app.present()
+        app.pace()
+
+    rounds, last_phase = 0, None
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        if app.ui_state == UIState.Bet:
+            for key in (pg.K_5, pg.K_0, pg.K_0, pg.K_RETURN):
+                pg.event.post(pg.event.Event(pg.KEYDOWN, key=key))
+        if app.ui_state == UIState.Turn:
+            for u in app.ui_objects:
+                if type(u) == TurnButton and u.action_type.name == "Stand" and not u.is_disabled:
+                    u.is_clicked = True
+                    pg.event.post(pg.event.Event(pg.USEREVENT))
+
+        app.update()
+        app.render()
+        app.present()
+        app.pace()
+
+        phase = app.state.game_phase
+        if phase != last_phase and phase == GamePhase.EndRound:
+            rounds += 1
+        last_phase = phase
+
+    elapsed = time.perf_counter() - start
+    name = "instant" if animation_speed == math.inf else f"{animation_speed:g}x"
+    print(f"{name:8} {rounds / elapsed * 60:8.1f} rounds/min   ({rounds} rounds in {elapsed:.0f}s)")
+
+
+def main() -> None:
+    if len(sys.argv) > 2 and sys.argv[1] == "--mode":
+        run(float(sys.argv[2]), float(sys.argv[3]))
+        return
+
+    seconds = sys.argv[1] if len(sys.argv) > 1 else "30"
+    for speed in ["1", "4", "inf"]:
+        subprocess.run([sys.executable, __file__, "--mode", speed, seconds], check=True, stderr=subprocess.DEVNULL)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,18 @@
 """Blackjack made with pygame"""
 
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.1"
+__all__ = ["App"]
+
+if TYPE_CHECKING:
+    from .app import App
+
+
+def __getattr__(name: str) -> object:
+    # `App` is only imported when asked for, so the engine and the simulator can be imported without pygame
+    if name == "App":
+        from .app import App
 
-from .app import App
+        return App
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,41 +1,62 @@
 from __future__ import annotations
-from typing import Dict, List, Optional, Type
+from typing import Dict, List, Optional, Tuple, Type
 
-import os, sys, pygame as pg
+import math, os, sys, pygame as pg
 
 from abc import ABC, abstractmethod
 
-from loguru import logger
-
-from blackjack.ui.turn_buttons import ActionType
+from blackjack.engine import ActionType
 
+from . import log
+from .log import logger
 from .util import Vec2
-from .ui import UIState, UIObject, FadeOverlay, BetBox, TurnButton
+from .profiler import Profiler
+from .trace import Tracer
+from .ui import UIState, UIObject, Dispatcher, FadeOverlay, BetBox, ProfilerHud, TextCache, TurnButton
 
 # Setup logging
 ENABLE_LOGGING = os.environ.get("BLACKJACK_ENABLE_LOGGING", "no")
-
-if ENABLE_LOGGING == "yes":
-    logger.remove(0)
-    logger.add(
-        "log/{time:YYYY-MMM-D@H:mm:ss}.log",
-        format="{time:HH:mm:ss} | {level} | {file}:{function}:{line} -> {message}",
-        level="TRACE",
-    )
-else:
-    logger.disable("blackjack")
+DIRTY_RECTS = os.environ.get("BLACKJACK_DIRTY_RECTS", "yes")
+MAX_FPS = int(os.environ.get("BLACKJACK_MAX_FPS", "60"))
+IDLE_TIMEOUT_MS = 500
+"""Longest an idle `App.run` blocks waiting for input before drawing another frame"""
+INPUT_GRACE_MS = 250
+"""How long `App.run` keeps running at full rate after any event, so the state can react to it"""
+TICK_RATE = 120
+"""Fixed game logic ticks per second of game time"""
+MAX_FRAME_TIME = 0.25
+"""Longest real time a single frame can advance the logic by, so a stall doesn't turn into a burst of ticks"""
+ANIMATION_SPEEDS = [1.0, 4.0, math.inf]
+"""Turbo modes cycled with F2: normal, 4x, and instant (every Movable arrives on the tick it is created)"""
+ANIMATION_SPEED = os.environ.get("BLACKJACK_ANIMATION_SPEED", "1")
+HEADLESS = os.environ.get("BLACKJACK_HEADLESS", "no")
+"""Draw into an offscreen surface with SDL's dummy video driver, for machines without a display"""
+RESOLUTION = os.environ.get("BLACKJACK_RESOLUTION", "1920x1080")
+PROFILE = os.environ.get("BLACKJACK_PROFILE", "no")
+"""Start with the profiler and its HUD on, which F3 toggles anyway"""
+TRACE = os.environ.get("BLACKJACK_TRACE", "no")
+"""Record the session's timeline into log/traces/, see `blackjack.trace`"""
 
 
-pg.init()
+def parse_resolution(resolution: str) -> Tuple[int, int]:
+    """Parses "<width>x<height>", e.g. "1280x720" -> (1280, 720)"""
+    width, height = resolution.lower().split("x")
+    return int(width), int(height)
 
 
 class Drawable(ABC):
+    __slots__ = ("pos",)
+
     pos: Vec2
     image_key: str
 
+    def sprite(self, ctx: App) -> pg.Surface:
+        """The surface drawn at `pos` this frame"""
+        return ctx.sprites[self.image_key]
+
     def draw(self, ctx: App) -> None:
         """"""
-        image = ctx.images[self.image_key]
+        image = self.sprite(ctx)
         blit_rect = pg.rect.Rect(self.pos.x, self.pos.y, image.get_width(), image.get_height())
         ctx.display.blit(image, blit_rect)
 
@@ -53,79 +74,226 @@ class State(ABC):
     def render(self) -> None:
         """"""
 
+    def render_dirty(self, overlay: List[Tuple[pg.Surface, Tuple[float, float]]]) -> Optional[List[pg.Rect]]:
+        """
+        Redraws only what changed since the last frame, with the blits of `overlay` (the UI) on top, and returns the
+        changed rects (empty if nothing did). States that can't track their changes return None, and are drawn with a
+        full `render` instead.
+        """
+        return None
+
+    def is_idle(self) -> bool:
+        """True while nothing will change until the player provides input"""
+        return False
+
     def pend(self, state: Type[State]) -> None:
         """"""
         self.ctx.state = state(self.ctx)
 
-        logger.debug(f"[DEBUG] State transitioned to {type(self.ctx.state).__name__}")
+        logger.debug("[DEBUG] State transitioned to {}", type(self.ctx.state).__name__)
 
 
 class App:
-    def __init__(self, state: Type[State]) -> None:
+    def __init__(
+        self,
+        state: Type[State],
+        max_fps: int = MAX_FPS,
+        speed: float = 1.0,
+        animation_speed: float = math.inf if ANIMATION_SPEED == "instant" else float(ANIMATION_SPEED),
+        headless: bool = HEADLESS == "yes",
+        resolution: Tuple[int, int] = parse_resolution(RESOLUTION),
+        trace: bool = TRACE == "yes",
+    ) -> None:
+        # Nothing is set up on import, so tools using the engine or the states don't pay for SDL
+        log.setup(ENABLE_LOGGING == "yes")
+        if headless:
+            if pg.display.get_init() and pg.display.get_driver() != "dummy":
+                pg.display.quit()
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pg.init()
+
+        self.tracer: Optional[Tracer] = Tracer() if trace else None
+        """Set before anything else, so every state can trace from its constructor on"""
         self.state = state(self)
         self.ui_state = UIState.Normal
         self.clock = pg.time.Clock()
-        self.dt: float
+        self.max_fps = max_fps
+
+        self.dt = 1 / TICK_RATE
+        """Game time advanced by every `State.update`, in seconds. Fixed, so the game plays out the same at any fps."""
+        self.speed = speed
+        """Game seconds per real second"""
+        self.frame_time = self.dt
+        """Real time the last frame took, which the next `update` catches the game logic up on"""
+        self.animation_speed = animation_speed
+        """Multiplier on every Movable's speed, `math.inf` to resolve them instantly"""
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        """How far real time is between the last tick and the next one, [0, 1), for interpolating what is drawn"""
+        self.last_event_ms = 0
+        self.waited_events: List[pg.event.Event] = []
+        """The event that woke up an idle wait, handled by the next `update`"""
+        self.dirty_rects: Optional[List[pg.Rect]] = None
+        """The regions the last `render` changed, or None if it redrew the whole frame"""
+        self.frame = 0
+        """Frames rendered so far, which whatever is cached for a single frame is keyed on"""
 
-        self.display = pg.display.set_mode((1920, 1080), pg.FULLSCREEN)
+        self.headless = headless
+        if headless:
+            # Surfaces can only be converted once there is a video mode, even if nothing is ever shown
+            pg.display.set_mode((1, 1))
+            self.display = pg.Surface(resolution).convert()
+        else:
+            self.display = pg.display.set_mode(resolution, pg.FULLSCREEN)
         pg.display.set_caption("Blackjack")
 
         self.images: Dict[str, pg.Surface] = {}
+        """Full size source assets, only held while loading without a packed atlas"""
+        self.sprites: Dict[str, pg.Surface] = {}
+        """Pre-scaled and pre-composited surfaces, cut from the atlas or built from `images`, see `blackjack.sprites`"""
+        self.profiler = Profiler(enabled=PROFILE == "yes", tracer=self.tracer)
+        """Frame times and timing scopes, see `blackjack.profiler`. F3 toggles it with its HUD, F4 dumps it."""
+        self.text_cache = TextCache(profiler=self.profiler)
+        """Every label drawn by the states and UI objects, see `TextCache`"""
         self.zones: Dict[str, pg.Rect] = {}
         """
         <d> = 0|1|2|3
         keys: ["deck", "burn", "hand_bl_<d>", "hand_br_<d>", "hand_tl_<d>", "hand_tr_<d>", "stat_<d>", "bet_<d>"]
         """
 
+        self.hud = ProfilerHud(self)
+
+        self.dispatcher = Dispatcher()
+        """Routes input to whoever subscribed to it in the current `ui_state`, see `UIObject.subscribe`"""
+        self.dispatcher.subscribe(pg.QUIT, self.handle_quit)
+        self.dispatcher.subscribe(pg.KEYDOWN, self.handle_hotkey)
+
         self.ui_objects: List[UIObject] = []
-        self.ui_objects.append(FadeOverlay(self, UIState.Bet))
-        self.ui_objects.append(BetBox(self, UIState.Bet))
+        self.add_ui_object(FadeOverlay(self, UIState.Bet))
+        self.add_ui_object(BetBox(self, UIState.Bet))
 
         for action_type in ActionType:
-            self.ui_objects.append(b := TurnButton(self, action_type, UIState.Turn))
-            logger.debug(f"Appended {action_type} Button {repr(b)}")
+            self.add_ui_object(b := TurnButton(self, action_type, UIState.Turn))
+            logger.debug("Appended {} Button {!r}", action_type, b)
+
+    def add_ui_object(self, obj: UIObject) -> None:
+        self.ui_objects.append(obj)
+        obj.subscribe(self.dispatcher)
 
     def update(self) -> None:
-        self.state.update()
-
-        for event in pg.event.get():
-            if event.type == pg.QUIT:
-                pg.quit()
-                sys.exit()
-            if event.type == pg.KEYDOWN:
-                match self.ui_state:
-                    case UIState.Normal:
-                        pass
-                    case UIState.Bet:
-                        # Filter out the bet box object
-                        [u for u in self.ui_objects if type(u) == BetBox][0].handle_key_update(event)
-            if event.type == pg.MOUSEMOTION:
-                match self.ui_state:
-                    case UIState.Turn:
-                        [u.handle_mouse_hover(event) for u in self.ui_objects if type(u) == TurnButton]
-            if event.type == pg.MOUSEBUTTONDOWN:
-                match self.ui_state:
-                    case UIState.Turn:
-                        [u.handle_mouse_click(event) for u in self.ui_objects if type(u) == TurnButton]
+        """Handles this frame's input, then runs as many fixed logic ticks as the time since the last frame covers"""
+        self.profiler.next_frame()
+        with self.profiler.scope("events"):
+            self.handle_events()
+
+        self.accumulator += min(self.frame_time, MAX_FRAME_TIME) * self.speed
+        while self.accumulator >= self.dt:
+            self.tick()
+            self.accumulator -= self.dt
+        self.alpha = self.accumulator / self.dt
+
+    def tick(self) -> None:
+        """Advances the game logic by `dt`"""
+        with self.profiler.scope("update.state"):
+            self.state.update()
 
         # Only update UI Objects during the correct UI State
-        for obj in self.ui_objects:
-            if obj.target_state == self.ui_state:
-                obj.update()
+        with self.profiler.scope("update.ui"):
+            for obj in self.ui_objects:
+                if obj.target_state == self.ui_state:
+                    obj.update()
+
+    def handle_events(self) -> None:
+        events = self.waited_events + pg.event.get()
+        self.waited_events = []
+        if events:
+            self.last_event_ms = pg.time.get_ticks()
+
+        for event in events:
+            self.dispatcher.dispatch(self.ui_state, event)
+
+    def handle_quit(self, event: pg.event.Event) -> None:
+        pg.quit()
+        sys.exit()
+
+    def handle_hotkey(self, event: pg.event.Event) -> None:
+        if event.key == pg.K_F2:
+            self.cycle_animation_speed()
+        elif event.key == pg.K_F3:
+            self.profiler.toggle()
+        elif event.key == pg.K_F4 and self.profiler.enabled:
+            logger.info("Profile dumped to {}", self.profiler.dump())
+
+    def cycle_animation_speed(self) -> None:
+        later = [s for s in ANIMATION_SPEEDS if s > self.animation_speed]
+        self.animation_speed = later[0] if later else ANIMATION_SPEEDS[0]
+        logger.info("Animation speed {}x", self.animation_speed)
 
     def render(self) -> None:
-        self.display.fill((0, 0, 0))
-        self.state.render()
+        self.frame += 1
+        # Some UI objects (the translucent overlays) cover the whole screen, so a frame can only be partially redrawn
+        # when every UI object shown can be drawn as plain blits
+        if DIRTY_RECTS == "yes" and (overlay := self.ui_blits()) is not None:
+            with self.profiler.scope("render.dirty"):
+                self.dirty_rects = self.state.render_dirty(overlay + self.hud.blits())
+            if self.dirty_rects is not None:
+                return
+
+        self.dirty_rects = None
+        with self.profiler.scope("render.state"):
+            self.display.fill((0, 0, 0))
+            self.state.render()
 
         # Overlayed UI renders
+        with self.profiler.scope("render.ui"):
+            for obj in self.ui_objects:
+                if obj.target_state == self.ui_state:
+                    obj.render()
+            self.hud.render()
+
+    def ui_blits(self) -> Optional[List[Tuple[pg.Surface, Tuple[float, float]]]]:
+        """The blits of every UI object shown in the current `ui_state`, or None if one can't be drawn as blits"""
+        overlay: List[Tuple[pg.Surface, Tuple[float, float]]] = []
         for obj in self.ui_objects:
             if obj.target_state == self.ui_state:
-                obj.render()
+                if (blits := obj.blits()) is None:
+                    return None
+                overlay += blits
+        return overlay
+
+    def present(self) -> None:
+        """Pushes the last `render` to the screen"""
+        if self.headless:
+            return
+        with self.profiler.scope("present"):
+            if self.dirty_rects is None:
+                pg.display.flip()
+            elif self.dirty_rects:
+                pg.display.update(self.dirty_rects)
 
     def run(self) -> None:
         while 1:
             self.update()
             self.render()
 
-            self.dt = self.clock.tick(60) / 1000
-            pg.display.flip()
+            self.present()
+            with self.profiler.scope("pace"):
+                self.pace()
+
+    def pace(self) -> None:
+        """
+        Caps the frame rate at `max_fps` and measures `frame_time`. While the state is idle and no input arrived
+        recently, blocks until an event (or `IDLE_TIMEOUT_MS`) instead, so a table waiting on the player costs next to
+        no CPU.
+        """
+        if self.state.is_idle() and pg.time.get_ticks() - self.last_event_ms > INPUT_GRACE_MS:
+            event = pg.event.wait(IDLE_TIMEOUT_MS)
+            if event.type != pg.NOEVENT:
+                self.waited_events.append(event)
+
+            # Nothing was moving, so the time spent waiting is dropped: one tick is enough to react to the event
+            self.clock.tick()
+            self.frame_time = 0.0
+            self.accumulator = self.dt
+        else:
+            self.frame_time = self.clock.tick(self.max_fps) / 1000
@@ -0,0 +1,154 @@
+"""
+Packed sprite atlas: every sprite of `blackjack.sprites`, pre-scaled and packed into one sheet with a JSON index
+
+Build step (run again whenever the source PNGs or the scales in `blackjack.sprites` change):
+
+    python -m blackjack.atlas
+
+At startup `AssetLoader` reads the index, and the sheet is decoded from PNG once per machine into a raw RGBA cache
+under `util.cache_dir()`. Later starts memory-map that cache instead of inflating a PNG, and cut it into subsurfaces.
+An index built with other scales is treated as missing, and the loader falls back to decoding every source PNG.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple, TypedDict
+
+from importlib import resources as impresources
+import hashlib
+import json
+import mmap
+import os
+
+import pygame as pg
+
+from .sprites import CARD_SCALE, CHIP_SCALE, FACE_SCALE, compose_sprites
+from .util import cache_dir
+
+VERSION = 1
+MAX_WIDTH = 2048
+PADDING = 1
+"""Transparent pixels between sprites, so scaled or rotated blits never pick up a neighbour"""
+
+
+class Index(TypedDict):
+    version: int
+    scales: List[float]
+    size: List[int]
+    sha256: str
+    """Of the sheet PNG, which names its raw pixel cache"""
+    sprites: Dict[str, List[int]]
+    """key -> [x, y, w, h]"""
+
+
+def atlas_dir() -> str:
+    return str(impresources.files("blackjack").joinpath("assets/atlas"))
+
+
+def _scales() -> List[float]:
+    return [CARD_SCALE, FACE_SCALE, CHIP_SCALE]
+
+
+def pack(sprites: Dict[str, pg.Surface], max_width: int = MAX_WIDTH) -> Tuple[pg.Surface, Dict[str, List[int]]]:
+    """Shelf packing, tallest first. Every sprite here is one of three sizes, so shelves come out full."""
+    rects: Dict[str, List[int]] = {}
+    x = y = shelf_h = 0
+    for key in sorted(sprites, key=lambda k: (-sprites[k].get_height(), k)):
+        w, h = sprites[key].get_size()
+        if x + w > max_width:
+            x, y, shelf_h = 0, y + shelf_h + PADDING, 0
+        rects[key] = [x, y, w, h]
+        x += w + PADDING
+        shelf_h = max(shelf_h, h)
+
+    width = max(r[0] + r[2] for r in rects.values())
+    height = max(r[1] + r[3] for r in rects.values())
+    sheet = pg.Surface((width, height), pg.SRCALPHA)
+    sheet.fill((0, 0, 0, 0))
+    for key, (x, y, _, _) in rects.items():
+        sheet.blit(sprites[key], (x, y))
+
+    return sheet, rects
+
+
+def build(out_dir: Optional[str] = None) -> Index:
+    """Decodes every source asset, composes the sprites and writes sheet.png and index.json into `out_dir`"""
+    from .state.loading import AssetLoader
+
+    out_dir = out_dir or atlas_dir()
+    images = dict(AssetLoader.load(path) for path in AssetLoader.all_assets())
+    sheet, rects = pack(compose_sprites(images))
+
+    os.makedirs(out_dir, exist_ok=True)
+    sheet_path = os.path.join(out_dir, "sheet.png")
+    pg.image.save(sheet, sheet_path)
+    with open(sheet_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+
+    index: Index = {
+        "version": VERSION,
+        "scales": _scales(),
+        "size": list(sheet.get_size()),
+        "sha256": digest,
+        "sprites": rects,
+    }
+    with open(os.path.join(out_dir, "index.json"), "w") as f:
+        json.dump(index, f, indent=1)
+    return index
+
+
+def read_index(directory: Optional[str] = None) -> Optional[Index]:
+    """The shipped index, or None if there is none or it was built for other scales"""
+    try:
+        with open(os.path.join(directory or atlas_dir(), "index.json")) as f:
+            index: Index = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if index.get("version") != VERSION or index.get("scales") != _scales():
+        return None
+    return index
+
+
+def raw_cache_path(index: Index) -> str:
+    return os.path.join(cache_dir(), f"atlas-{index['sha256'][:16]}.rgba")
+
+
+def load_pixels(index: Index, directory: Optional[str] = None) -> bytes | mmap.mmap:
+    """
+    RGBA pixels of the sheet. Memory-maps the raw cache if it exists, otherwise decodes the PNG and writes the cache.
+    Safe to call off the main thread: nothing here needs the display.
+    """
+    w, h = index["size"]
+    path = raw_cache_path(index)
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == w * h * 4:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError:
+        pass
+
+    sheet = pg.image.load(os.path.join(directory or atlas_dir(), "sheet.png"))
+    pixels = pg.image.tobytes(sheet, "RGBA")
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(pixels)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return pixels
+
+
+def cut(index: Index, pixels: bytes | mmap.mmap) -> Dict[str, pg.Surface]:
+    """Converts the sheet once and returns a subsurface per sprite. Must be called after the display mode is set."""
+    with memoryview(pixels) as view:
+        sheet = pg.image.frombuffer(view, tuple(index["size"]), "RGBA").convert_alpha()
+    if isinstance(pixels, mmap.mmap):
+        pixels.close()
+    return {key: sheet.subsurface(pg.Rect(rect)) for key, rect in index["sprites"].items()}
+
+
+if __name__ == "__main__":
+    built = build()
+    print(f"{len(built['sprites'])} sprites packed into {built['size'][0]}x{built['size'][1]} at {atlas_dir()}")
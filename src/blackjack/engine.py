@@ -0,0 +1,515 @@
+"""
+Headless blackjack rules shared by the `Table` state and the simulator.
+
+Nothing in here may import pygame. `Table` drives these same functions frame by frame and animates the cards they
+return, while `play_round` runs a whole round of bot play in one call for bulk simulation.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Protocol, SupportsIndex, Tuple, TypeVar
+
+from array import array
+from enum import Enum, auto
+from math import ceil
+import itertools
+import random
+
+from .log import logger
+
+from .strategy import DOUBLE, HIT, Strategy, load as load_strategy
+
+
+class ActionType(Enum):
+    Hit = auto()
+    Stand = auto()
+    Split = auto()
+    Double = auto()
+
+
+class Card:
+    """
+    The rank and suit of a card. Immutable: the deck deals the 52 interned instances in `CARDS`, and anything that
+    varies per dealt card (position, face down...) lives in a wrapper such as `blackjack.state.table.DealtCard`.
+    """
+
+    __slots__ = ("value", "suit", "image_key", "is_ace")
+
+    def __init__(self, value: int, suit: str, image_key: str) -> None:
+        self.value = value
+        self.suit = suit
+        self.image_key = image_key
+        """
+        Usage within a State class:
+
+        ```
+        self.ctx.sprites[card.image_key]
+        ```
+        """
+        self.is_ace = value == -1
+
+
+class CardLike(Protocol):
+    """Anything a hand can hold: a `Card` or a per-deal wrapper around one"""
+
+    @property
+    def value(self) -> int: ...
+
+    @property
+    def is_ace(self) -> bool: ...
+
+
+C = TypeVar("C", bound=CardLike)
+
+RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "ace", "jack", "queen", "king"]
+SUITS = ["diamonds", "clubs", "hearts", "spades"]
+
+
+def _rank_value(rank: str) -> int:
+    match rank:
+        case s if s in ["jack", "queen", "king"]:
+            return 10
+        case "ace":
+            return -1
+        case _:
+            return int(rank)
+
+
+CARDS: Tuple[Card, ...] = tuple(
+    Card(_rank_value(rank), suit, f"{rank}_of_{suit}") for rank, suit in itertools.product(RANKS, SUITS)
+)
+"""The interned card of every code 0-51"""
+CARD_CODES: Dict[str, int] = {card.image_key: code for code, card in enumerate(CARDS)}
+"""Image key ("<value>_of_<suit>") -> card code"""
+
+
+def bare_card(card: Card) -> Card:
+    """`Deck` card_type for headless play: deals the interned cards themselves, allocating nothing"""
+    return card
+
+
+def _hard_value(card: CardLike) -> int:
+    """Value of a card with an ace counted as 1"""
+    return 1 if card.is_ace else card.value
+
+
+class HandCards(List[C]):
+    """
+    The cards of a hand, keeping a running hard total (aces as 1) and ace count as cards are added or removed.
+    All the usual list mutations keep the counters in sync, so `hand.cards` can be used as a plain list.
+    """
+
+    __slots__ = ("hard_total", "n_aces")
+
+    def __init__(self, cards: Iterable[C] = ()) -> None:
+        super().__init__(cards)
+        self.hard_total = 0
+        self.n_aces = 0
+        if len(self) > 0:
+            self._recount()
+
+    def _recount(self) -> None:
+        self.hard_total = sum(_hard_value(card) for card in self)
+        self.n_aces = sum(1 for card in self if card.is_ace)
+
+    def _added(self, card: C) -> None:
+        self.hard_total += _hard_value(card)
+        self.n_aces += card.is_ace
+
+    def _removed(self, card: C) -> None:
+        self.hard_total -= _hard_value(card)
+        self.n_aces -= card.is_ace
+
+    def append(self, card: C) -> None:
+        # Inlined rather than calling _added, this is the hot path of every deal
+        list.append(self, card)
+        if card.is_ace:
+            self.hard_total += 1
+            self.n_aces += 1
+        else:
+            self.hard_total += card.value
+
+    def insert(self, index: SupportsIndex, card: C) -> None:
+        super().insert(index, card)
+        self._added(card)
+
+    def extend(self, cards: Iterable[C]) -> None:
+        for card in cards:
+            self.append(card)
+
+    def __iadd__(self, cards: Iterable[C]) -> HandCards[C]:  # type: ignore[override,misc]
+        self.extend(cards)
+        return self
+
+    def remove(self, card: C) -> None:
+        super().remove(card)
+        self._removed(card)
+
+    def pop(self, index: SupportsIndex = -1) -> C:
+        card = super().pop(index)
+        self._removed(card)
+        return card
+
+    def clear(self) -> None:
+        super().clear()
+        self.hard_total = self.n_aces = 0
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._recount()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._recount()
+
+
+class Hand(Generic[C]):
+    def __init__(self) -> None:
+        self.cards: HandCards[C] = HandCards()
+
+        self.is_doubled = False
+
+        self.is_blackjack = False
+        self.is_bust = False
+        self.is_done = False
+        """
+        A hand is done if ONE of:
+            - The hand is blackjack or 21
+            - The hand is stood
+            - The hand is bust
+        """
+
+        self.result: int = 0
+        """
+        0 - loss
+        1 - win
+        2 - draw
+        """
+        self.net_return: int = 0
+
+    def calculate_value(self) -> int:
+        """O(1) from the running counters of `cards`"""
+        hard_total = self.cards.hard_total
+        # At most ONE ace can ever be valued at 11, and only if that doesn't bust the hand
+        if self.cards.n_aces > 0 and hard_total <= 11:
+            return hard_total + 10
+        return hard_total
+
+    def is_soft(self) -> bool:
+        """Whether an ace is currently being counted as 11"""
+        return self.cards.n_aces > 0 and self.cards.hard_total <= 11
+
+    def is_natural(self) -> bool:
+        """A two card 21"""
+        return len(self.cards) == 2 and self.calculate_value() == 21
+
+    def is_over(self) -> bool:
+        """Whether the value is over 21 - `is_bust` is only set once this has been acted upon"""
+        return self.cards.hard_total > 21
+
+    def get_word(self, is_end_round: Optional[bool] = False) -> str:
+        if is_end_round:
+            if self.result == 0:
+                return "BET LOST"
+            elif self.result == 1:
+                return "WIN"
+            else:
+                return "DRAW"
+
+        # Check for blackjack here because I forgot to put it elsewhere
+        mark_blackjack(self)
+
+        if self.is_blackjack:
+            return "B.J."
+        if self.is_bust:
+            return "Bust"
+        if self.is_doubled:
+            return "Double"
+        return "Bet"
+
+    def allowed_to_split(self) -> bool:
+        if len(self.cards) != 2:
+            return False
+        # Won't get IndexOutOfBounds error
+        return self.cards[0].value == self.cards[1].value
+
+    def allowed_to_double(self) -> bool:
+        # Only allowed to double on the initial deal
+        return len(self.cards) == 2
+
+
+class Player(Generic[C]):
+    """C | the type of the cards dealt to the player, see `Deck`"""
+
+    def __init__(self, id: int) -> None:
+        self.hands: List[Hand[C]] = [Hand(), Hand(), Hand(), Hand()]
+        self.id = id
+        self.balance = 100000
+
+        self.round_bets: List[int] = [0, 0, 0, 0]
+        """Index corresponds to the bet per each hand in self.hands"""
+
+    def add_card(self, hand_idx: int, card: C) -> None:
+        self.hands[hand_idx].cards.append(card)
+
+    def allowed_to_potentially_split(self) -> bool:
+        """The player is only allowed to split if there is an empty hand available"""
+        return any(len(hand.cards) == 0 for hand in self.hands)
+
+    def reset_hands(self) -> None:
+        self.hands = [Hand(), Hand(), Hand(), Hand()]
+        self.round_bets = [0, 0, 0, 0]
+
+
+class Bot(Player[C]):
+    def __init__(self, id: int, rng: Optional[random.Random] = None, strategy: Optional[Strategy] = None) -> None:
+        """
+        rng      | the random stream bets are drawn from; a fresh unseeded one if not given
+        strategy | the basic strategy played; the (cached) one for the default `strategy.Rules` if not given
+        """
+        super().__init__(id)
+        self.rng = rng if rng is not None else random.Random()
+        self.strategy = strategy if strategy is not None else load_strategy()
+
+    def decide_bet(self) -> None:
+        # Not going to add heuristics for betting - just random value
+        # Check blackjack.ui.bet_box for min/max bet values
+        min_bet, max_bet = 100, 5000
+        self.round_bets[0] = self.rng.randrange(min_bet, max_bet + 1)
+        self.balance -= self.round_bets[0]
+
+    def decide(self, hand_idx: int, dealer: Dealer[Any]) -> ActionType:
+        """
+        Only decides - the bookkeeping of the chosen action is done by `hit`/`double`/`split`.
+        Marks the hand as bust/done when standing.
+        """
+        hand = self.hands[hand_idx]
+        hand_value = hand.calculate_value()
+        if hand_value == 0:
+            # Empty hand should be "passed"
+            return ActionType.Stand
+
+        if hand_value > 21:
+            # Checked before is_done so that a doubled hand which busts is still marked as bust
+            hand.is_bust = True
+            hand.is_done = True
+            return ActionType.Stand
+
+        if hand.is_done:
+            return ActionType.Stand
+
+        # Basic strategy, based on the revealed card of the Dealer
+        upcard = dealer.hands[0].cards[0]
+        up_rank = 1 if upcard.is_ace else upcard.value
+        first_two = len(hand.cards) == 2
+
+        if first_two and hand.allowed_to_split() and self.allowed_to_potentially_split():
+            pair = hand.cards[0]
+            if self.strategy.should_split(1 if pair.is_ace else pair.value, up_rank):
+                logger.debug("Bot {} Splitted!", self.id)
+                return ActionType.Split
+
+        decision = self.strategy.decide(hand_value, hand.is_soft(), first_two, up_rank)
+
+        if decision == DOUBLE:
+            logger.debug("Bot {} Doubled!", self.id)
+            return ActionType.Double
+
+        if decision == HIT:
+            logger.debug("Bot {} Hit!", self.id)
+            return ActionType.Hit
+
+        hand.is_done = True
+        logger.debug("Bot {} Stood!", self.id)
+        return ActionType.Stand
+
+
+class Dealer(Player[C]):
+    def __init__(self, id: int) -> None:
+        super().__init__(id)
+
+
+class Deck(Generic[C]):
+    def __init__(self, n_decks: int, card_type: Callable[[Card], C], rng: Optional[random.Random] = None) -> None:
+        """
+        card_type | called with the interned `Card` of every card popped off the deck, see `bare_card`
+        rng       | the random stream used for shuffling; a fresh unseeded one if not given
+        """
+        self._shoe = array("b")
+        """Card codes (indices into `CARDS`), dealt from the end"""
+        self.n_decks = n_decks
+        self.card_type = card_type
+        self.rng = rng if rng is not None else random.Random()
+
+    def new_shuffled_deck(self) -> None:
+        self._shoe = _ONE_DECK * self.n_decks
+        self.rng.shuffle(self._shoe)
+
+    def put(self, image_key: str) -> None:
+        """Places a specific card on top of the deck"""
+        self._shoe.append(CARD_CODES[image_key])
+
+    def poptop(self) -> C:
+        # Reshuffle rather than fail on an empty shoe when a round runs past the end of it
+        if self.is_exhausted():
+            self.new_shuffled_deck()
+
+        return self.card_type(CARDS[self._shoe.pop()])
+
+    def is_exhausted(self) -> bool:
+        return len(self._shoe) == 0
+
+
+_ONE_DECK = array("b", range(len(CARDS)))
+
+
+def mark_blackjack(hand: Hand[Any]) -> bool:
+    """A two card 21 is a blackjack, including on a split hand"""
+    if hand.is_natural():
+        hand.is_blackjack = True
+    return hand.is_blackjack
+
+
+def dealer_should_hit(dealer_hand: Hand[Any]) -> bool:
+    """Dealer keeps hitting until reaching 17 (stands on soft 17)"""
+    return dealer_hand.calculate_value() < 17
+
+
+def hit(player: Player[C], hand_idx: int, deck: Deck[C]) -> C:
+    card = deck.poptop()
+    player.add_card(hand_idx, card)
+    return card
+
+
+def double(player: Player[C], hand_idx: int, deck: Deck[C]) -> C:
+    hand = player.hands[hand_idx]
+    hand.is_doubled = True
+    hand.is_done = True
+    player.balance -= player.round_bets[hand_idx]
+    player.round_bets[hand_idx] *= 2
+
+    return hit(player, hand_idx, deck)
+
+
+def split(player: Player[C], hand_idx: int, deck: Deck[C]) -> Tuple[int, C, C, C]:
+    """
+    Moves the second card of the hand into the first free hand, places the same bet on it and deals one card onto
+    each of the two hands.
+
+    Returns (index of the new hand, the moved card, the card dealt to hand_idx, the card dealt to the new hand)
+    """
+    hand = player.hands[hand_idx]
+    free_hand = next(hand for hand in player.hands if len(hand.cards) == 0)
+    second_card = hand.cards[1]
+    hand.cards.remove(second_card)
+    free_hand.cards.append(second_card)
+
+    free_hand_idx = player.hands.index(free_hand)
+    # All split hands will always have the same bet as the initial bet
+    player.round_bets[free_hand_idx] = player.round_bets[0]
+    player.balance -= player.round_bets[free_hand_idx]
+
+    card_1, card_2 = hit(player, hand_idx, deck), hit(player, free_hand_idx, deck)
+    return free_hand_idx, second_card, card_1, card_2
+
+
+def settle(hand: Hand[Any], dealer_hand: Hand[Any], hand_bet: int) -> None:
+    """
+    Sets the result and the value which will be returned back to the balance of a hand
+    Dealer BJ + You BJ -> Draw (Net return of bet)
+    Dealer BJ + You No BJ -> Lose (Net return of 0)
+    Dealer No BJ + You BJ -> Win (Net return of 2.5x bet)
+    Dealer Bust + You Bust -> Draw (Net return of bet)
+    Dealer No Bust + You Bust -> Lose (Net return of 0)
+    Dealer Bust + You Don't -> Win (Net return of 2x bet)
+    Dealer > You -> Lose (Net return of 0)
+    Dealer = You -> Draw (Net return of bet)
+    Dealer < You -> Win (Net return of 2x bet)
+    """
+    dealer_value = dealer_hand.calculate_value()
+    hand_value = hand.calculate_value()
+
+    if dealer_value > 21:
+        dealer_hand.is_bust = True
+    if hand.is_over():
+        hand.is_bust = True
+    mark_blackjack(hand)
+
+    if dealer_hand.is_blackjack and hand.is_blackjack:
+        hand.result = 2
+        hand.net_return = hand_bet
+    elif dealer_hand.is_blackjack and not hand.is_blackjack:
+        hand.result = 0
+        hand.net_return = 0
+    elif not dealer_hand.is_blackjack and hand.is_blackjack:
+        hand.result = 1
+        hand.net_return = ceil(2.5 * hand_bet)
+    elif dealer_hand.is_bust and hand.is_bust:
+        hand.result = 2
+        hand.net_return = hand_bet
+    elif not dealer_hand.is_bust and hand.is_bust:
+        hand.result = 0
+        hand.net_return = 0
+    elif dealer_hand.is_bust and not hand.is_bust:
+        hand.result = 1
+        hand.net_return = 2 * hand_bet
+    elif dealer_value > hand_value:
+        hand.result = 0
+        hand.net_return = 0
+    elif dealer_value == hand_value:
+        hand.result = 2
+        hand.net_return = hand_bet
+    elif dealer_value < hand_value:
+        hand.result = 1
+        hand.net_return = 2 * hand_bet
+
+
+def play_turn(bot: Bot[C], dealer: Dealer[C], deck: Deck[C]) -> None:
+    """Plays every hand of a bot, from the first hand to the last, the same way `Table` does"""
+    for hand_idx in range(len(bot.hands)):
+        while (action := bot.decide(hand_idx, dealer)) != ActionType.Stand:
+            match action:
+                case ActionType.Hit:
+                    hit(bot, hand_idx, deck)
+                case ActionType.Double:
+                    double(bot, hand_idx, deck)
+                case ActionType.Split:
+                    split(bot, hand_idx, deck)
+
+
+def play_round(dealer: Dealer[C], bots: List[Bot[C]], deck: Deck[C]) -> None:
+    """
+    Plays a full round without any animation: burn, bets, deal, bot turns (rightmost seat first), dealer draw and
+    settlement. Balances are updated with the net returns, and hands are left in place to be inspected until the
+    next round.
+
+    bots | seated from left to right, i.e. bots[i] sits in seat i
+    """
+    for player in [dealer, *bots]:
+        player.reset_hands()
+
+    # Burn card
+    deck.poptop()
+
+    for bot in bots:
+        bot.decide_bet()
+
+    # Deal two cards to everyone, starting with the dealer
+    for _ in range(2):
+        for player in [dealer, *bots]:
+            hit(player, 0, deck)
+
+    dealer_hand = dealer.hands[0]
+
+    # If the dealer gets a blackjack, the round ends
+    if not mark_blackjack(dealer_hand):
+        for bot in reversed(bots):
+            play_turn(bot, dealer, deck)
+
+    while dealer_should_hit(dealer_hand):
+        hit(dealer, 0, deck)
+
+    for bot in bots:
+        for idx, hand in enumerate(bot.hands):
+            if len(hand.cards) > 0:
+                settle(hand, dealer_hand, bot.round_bets[idx])
+                bot.balance += hand.net_return
@@ -0,0 +1,106 @@
+"""
+Running the game without a display or a player, for benchmarks and smoke tests on machines with no screen
+
+    app = App(Loading, headless=True, resolution=(1280, 720))
+    drive(app, Autoplayer(seed=1), frames=3000)
+
+`Autoplayer` presses the same keys and clicks the same buttons a player would, so the input goes through the
+dispatcher and the UI objects like real input does.
+"""
+
+from __future__ import annotations
+from typing import Callable, Iterator, List, Optional, Sequence
+
+from itertools import cycle
+
+import pygame as pg
+
+from .app import App
+from .engine import ActionType
+from .state.table import Table
+from .ui import BetBox, TurnButton, UIState
+
+Script = Callable[[App], List[pg.event.Event]]
+"""Returns the events to post before the next frame"""
+
+
+def seed_table(table: Table, seed: int) -> None:
+    """Reshuffles the shoe and reseeds the bots' bets, so every run with the same script plays the same rounds"""
+    table.deck.rng.seed(seed)
+    table.deck.new_shuffled_deck()
+    for bot in table.bots:
+        bot.rng.seed(seed + bot.id)
+
+
+class Autoplayer:
+    """
+    Bets `bet` every round, then plays its hands taking `actions` in turn, clicking Stand instead whenever the next
+    action's button is disabled.
+    """
+
+    def __init__(
+        self,
+        bet: int = 500,
+        actions: Sequence[ActionType] = (ActionType.Hit, ActionType.Stand),
+        seed: Optional[int] = None,
+    ) -> None:
+        self.bet = bet
+        self.actions: Iterator[ActionType] = cycle(actions)
+        self.seed = seed
+        self.seeded: Optional[Table] = None
+
+    def __call__(self, app: App) -> List[pg.event.Event]:
+        table = app.state
+        if type(table) != Table:
+            return []
+        if self.seed is not None and self.seeded is not table:
+            seed_table(table, self.seed)
+            self.seeded = table
+
+        if app.ui_state == UIState.Bet:
+            bet_box = [u for u in app.ui_objects if type(u) == BetBox][0]
+            if table.player.round_bets[0] != 0 or bet_box.bet_val:
+                return []
+            keys = [getattr(pg, f"K_{digit}") for digit in str(self.bet)] + [pg.K_RETURN]
+            return [pg.event.Event(pg.KEYDOWN, key=key) for key in keys]
+
+        if app.ui_state == UIState.Turn:
+            buttons = {u.action_type: u for u in app.ui_objects if type(u) == TurnButton}
+            # Every button is disabled while cards are moving, and Stand only then
+            if buttons[ActionType.Stand].is_disabled or any(u.is_clicked for u in buttons.values()):
+                return []
+            button = buttons[next(self.actions)]
+            if button.is_disabled:
+                button = buttons[ActionType.Stand]
+            pos = button.rect.center
+            return [
+                pg.event.Event(pg.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)),
+                pg.event.Event(pg.MOUSEBUTTONDOWN, pos=pos, button=1),
+            ]
+
+        return []
+
+
+def drive(
+    app: App,
+    script: Script,
+    frames: int,
+    frame_time: float = 1 / 60,
+    on_frame: Optional[Callable[[App], None]] = None,
+) -> None:
+    """
+    Runs `frames` frames as fast as possible, each advancing the game by `frame_time` seconds
+
+    on_frame | called after every frame has been rendered
+    """
+    for _ in range(frames):
+        for event in script(app):
+            pg.event.post(event)
+
+        app.frame_time = frame_time
+        app.update()
+        app.render()
+        app.present()
+
+        if on_frame is not None:
+            on_frame(app)
@@ -0,0 +1,168 @@
+"""
+Logging cheap enough to leave on while playing
+
+    from .log import logger
+
+    logger.debug("Bot {} Hit!", self.id)
+
+Messages are `str.format` templates with their arguments passed separately. A call only queues the time, its call site
+and the arguments; a background `LogWriter` thread formats the lines and appends them to a file in log/ in batches.
+With logging off (the default, see BLACKJACK_ENABLE_LOGGING) a call returns straight away.
+
+Arguments are formatted on the writer thread, up to `FLUSH_INTERVAL` seconds after the call, so an object changed in
+the meantime is logged with its later value: pass values (a balance, a phase) rather than objects about to change.
+"""
+
+from __future__ import annotations
+from typing import Any, Deque, List, Optional, Tuple
+
+from collections import deque
+from types import CodeType, FrameType
+import atexit
+import os
+import sys
+import threading
+import time
+
+FLUSH_INTERVAL = 0.5
+"""Longest a record waits in the queue before being written, in seconds"""
+BATCH_SIZE = 256
+"""Records queued before the writer is woken up early"""
+QUEUE_CAPACITY = 65536
+"""Records the queue holds before new ones are dropped, so a stalled disk can't grow memory or block a frame"""
+
+Record = Tuple[float, str, CodeType, int, str, Tuple[Any, ...]]
+"""(wall clock time, level, code of the calling function, line, message, arguments)"""
+
+
+def default_path() -> str:
+    return os.path.join("log", time.strftime("%Y-%b-%d@%H:%M:%S.log"))
+
+
+def format_record(record: Record) -> str:
+    """Formats a record as "HH:MM:SS | LEVEL | file:function:line -> message" and a newline"""
+    created, level, code, line, message, args = record
+    try:
+        text = message.format(*args)
+    except Exception as e:
+        # A bad template or a failing __repr__ mustn't kill the writer thread
+        text = f"{message!r} % {args!r} ({type(e).__name__}: {e})"
+    clock = time.strftime("%H:%M:%S", time.localtime(created))
+    return f"{clock} | {level} | {os.path.basename(code.co_filename)}:{code.co_name}:{line} -> {text}\n"
+
+
+class LogWriter:
+    """
+    Appends records to `path` from a background thread, every `flush_interval` seconds or every `batch_size`
+    records, whichever comes first. Records arriving while `capacity` are already queued are counted and dropped.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_interval: float = FLUSH_INTERVAL,
+        batch_size: int = BATCH_SIZE,
+        capacity: int = QUEUE_CAPACITY,
+    ) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.file = open(path, "a")
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.capacity = capacity
+
+        self.records: Deque[Record] = deque()
+        self.dropped = 0
+        """Records refused since the last write"""
+        self.dropped_lock = threading.Lock()
+        """Guards `dropped`, which both the callers and the writer thread change. Only taken once the queue is full."""
+        self.written = 0
+        self.wake = threading.Event()
+        self.stopped = False
+        self.thread = threading.Thread(target=self.run, name="log writer", daemon=True)
+        self.thread.start()
+
+    def put(self, level: str, message: str, args: Tuple[Any, ...], caller: FrameType) -> None:
+        records = self.records
+        if len(records) >= self.capacity:
+            with self.dropped_lock:
+                self.dropped += 1
+            return
+        records.append((time.time(), level, caller.f_code, caller.f_lineno, message, args))
+        if len(records) == self.batch_size:
+            self.wake.set()
+
+    def run(self) -> None:
+        while not self.stopped:
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self.drain()
+
+    def drain(self) -> None:
+        """Formats and writes everything queued so far"""
+        records = self.records
+        lines: List[str] = [format_record(records.popleft()) for _ in range(len(records))]
+        if self.dropped:
+            with self.dropped_lock:
+                dropped, self.dropped = self.dropped, 0
+            lines.append(f"{dropped} log records dropped, the writer fell behind\n")
+        if lines:
+            self.file.write("".join(lines))
+            self.file.flush()
+            self.written += len(lines)
+
+    def stop(self) -> None:
+        """Writes what is left and closes the file"""
+        if self.stopped:
+            return
+        self.stopped = True
+        self.wake.set()
+        self.thread.join()
+        self.drain()
+        self.file.close()
+
+
+class Logger:
+    """The logging methods the game calls. Each queues a record on the `writer` if there is one."""
+
+    def __init__(self) -> None:
+        self.writer: Optional[LogWriter] = None
+
+    def trace(self, message: str, *args: Any) -> None:
+        if self.writer is not None:
+            self.writer.put("TRACE", message, args, sys._getframe(1))
+
+    def debug(self, message: str, *args: Any) -> None:
+        if self.writer is not None:
+            self.writer.put("DEBUG", message, args, sys._getframe(1))
+
+    def info(self, message: str, *args: Any) -> None:
+        if self.writer is not None:
+            self.writer.put("INFO", message, args, sys._getframe(1))
+
+    def warning(self, message: str, *args: Any) -> None:
+        if self.writer is not None:
+            self.writer.put("WARNING", message, args, sys._getframe(1))
+
+    def error(self, message: str, *args: Any) -> None:
+        if self.writer is not None:
+            self.writer.put("ERROR", message, args, sys._getframe(1))
+
+
+logger = Logger()
+
+
+def setup(enabled: bool, path: Optional[str] = None) -> Optional[LogWriter]:
+    """
+    Stops the current writer, if any, then starts logging to `path` (by default a new file in log/) if `enabled`.
+    Returns the new writer.
+    """
+    if logger.writer is not None:
+        logger.writer.stop()
+        logger.writer = None
+    if not enabled:
+        return None
+
+    writer = logger.writer = LogWriter(path or default_path())
+    atexit.register(writer.stop)
+    return writer
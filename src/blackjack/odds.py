@@ -0,0 +1,112 @@
+"""
+Exact dealer outcome probabilities for a given upcard and shoe composition
+
+Every card the dealer draws is removed from the shoe before the next draw, so the result is exact for the cards left,
+not an infinite deck approximation. States are (remaining counts, hard total, has ace) and are memoized in a bounded
+LRU cache shared by every query, so asking again during play or simulation costs a dictionary lookup.
+
+The dealer rule is the one `Table` plays in `TurnPhase.Dealer`: hit below 17, stand on soft 17 (optionally hit it).
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from functools import _CacheInfo
+
+from functools import lru_cache
+
+BUST, BLACKJACK = 5, 6
+OUTCOMES = ("17", "18", "19", "20", "21", "bust", "blackjack")
+"""Indices of a distribution: 0-4 for a final total of 17-21, then BUST and BLACKJACK (two card 21)"""
+
+RANKS = range(1, 11)
+CACHE_SIZE = 1 << 18
+"""Memoized dealer states. A cold 6 deck query visits a few thousand."""
+
+Counts = Tuple[int, ...]
+Distribution = Tuple[float, ...]
+
+
+def best_total(hard: int, has_ace: bool) -> Tuple[int, bool]:
+    """(best total, is soft)"""
+    if has_ace and hard <= 11:
+        return hard + 10, True
+    return hard, False
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _finish(counts: Counts, hard: int, has_ace: bool, hit_soft_17: bool) -> Distribution:
+    """Distribution over 17-21 and bust for a dealer holding at least two cards"""
+    total, soft = best_total(hard, has_ace)
+    if total > 21:
+        return (0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+    if total >= 17 and not (hit_soft_17 and soft and total == 17):
+        out = [0.0] * 6
+        out[total - 17] = 1.0
+        return tuple(out)
+
+    n = sum(counts)
+    out = [0.0] * 6
+    for rank in RANKS:
+        c = counts[rank]
+        if c == 0:
+            continue
+        rest = counts[:rank] + (c - 1,) + counts[rank + 1 :]
+        sub = _finish(rest, hard + rank, has_ace or rank == 1, hit_soft_17)
+        p = c / n
+        for i in range(6):
+            out[i] += p * sub[i]
+    return tuple(out)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _outcomes(counts: Counts, upcard: int, hit_soft_17: bool) -> Distribution:
+    n = sum(counts)
+    out = [0.0] * 7
+    for rank in RANKS:
+        c = counts[rank]
+        if c == 0:
+            continue
+        p = c / n
+        hard, has_ace = upcard + rank, upcard == 1 or rank == 1
+        if best_total(hard, has_ace)[0] == 21:
+            out[BLACKJACK] += p
+            continue
+
+        rest = counts[:rank] + (c - 1,) + counts[rank + 1 :]
+        sub = _finish(rest, hard, has_ace, hit_soft_17)
+        for i in range(6):
+            out[i] += p * sub[i]
+    return tuple(out)
+
+
+def dealer_outcomes(counts: Sequence[int], upcard: int, hit_soft_17: bool = False) -> Distribution:
+    """
+    Probabilities of every entry of `OUTCOMES`
+
+    counts | cards left in the shoe by rank (ace = 1, index 0 unused), with the upcard already removed
+    upcard | rank of the dealer upcard, ace = 1
+    """
+    return _outcomes(tuple(counts), upcard, hit_soft_17)
+
+
+def given_no_blackjack(dist: Distribution) -> Distribution:
+    """`dist` conditioned on the dealer not having a blackjack, as seen by players once the dealer has peeked"""
+    norm = 1.0 - dist[BLACKJACK]
+    return tuple(p / norm for p in dist[:BLACKJACK]) + (0.0,)
+
+
+def full_shoe(n_decks: int) -> Counts:
+    """Counts of every rank in a fresh shoe, in the layout `dealer_outcomes` takes"""
+    return (0,) + (4 * n_decks,) * 9 + (16 * n_decks,)
+
+
+def cache_info() -> _CacheInfo:
+    """Hits, misses and size of the dealer state cache"""
+    return _finish.cache_info()
+
+
+def cache_clear() -> None:
+    _finish.cache_clear()
+    _outcomes.cache_clear()
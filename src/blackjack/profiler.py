@@ -0,0 +1,141 @@
+"""
+Frame-time instrumentation: named timing scopes, a ring buffer of the last frames, and the numbers the HUD shows
+
+    with ctx.profiler.scope("table.scene"):
+        ...
+
+While disabled (the default, see BLACKJACK_PROFILE) and not tracing (see `blackjack.trace`), `scope` hands back a shared
+no-op context manager and nothing is timed or stored. Scope times are inclusive and add up over a frame, so a scope
+entered on every tick reports the frame's total. A frame runs from one `App.update` to the next, so its time includes
+waiting in `App.pace`.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Tuple, TypedDict
+
+if TYPE_CHECKING:
+    from .trace import Tracer
+
+from collections import deque
+from time import perf_counter
+import json
+import os
+import time
+
+FRAMES_KEPT = 600
+"""Frames in the ring buffer, 10 seconds at 60 fps"""
+
+Frame = Tuple[float, Dict[str, float]]
+"""(frame seconds, scope -> seconds)"""
+
+
+class Summary(TypedDict):
+    frames: int
+    fps: float
+    p50_ms: float
+    p99_ms: float
+    scopes: List[Tuple[str, float]]
+    """(scope, mean milliseconds per frame), slowest first"""
+
+
+class Scope:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: Profiler, name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *_: object) -> None:
+        end = perf_counter()
+        profiler = self.profiler
+        profiler.current[self.name] = profiler.current.get(self.name, 0.0) + end - self.start
+        if profiler.tracer is not None:
+            profiler.tracer.complete(self.name, self.start, end)
+
+
+class NullScope:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *_: object) -> None:
+        pass
+
+
+NULL_SCOPE = NullScope()
+
+
+class Profiler:
+    def __init__(self, enabled: bool = False, capacity: int = FRAMES_KEPT, tracer: Optional[Tracer] = None) -> None:
+        self.enabled = enabled
+        """Whether the HUD is shown. Scopes are also timed while there is a `tracer`."""
+        self.tracer = tracer
+        self.frames: Deque[Frame] = deque(maxlen=capacity)
+        self.current: Dict[str, float] = {}
+        """Scope times of the frame in progress"""
+        self.frame_start: Optional[float] = None
+        self.scopes: Dict[str, Scope] = {}
+        """One reusable `Scope` per name, so timing allocates nothing"""
+
+    def scope(self, name: str) -> Scope | NullScope:
+        """A context manager timing its body under `name`. Not reentrant: a scope can't be nested in itself."""
+        if not self.enabled and self.tracer is None:
+            return NULL_SCOPE
+        scope = self.scopes.get(name)
+        if scope is None:
+            scope = self.scopes[name] = Scope(self, name)
+        return scope
+
+    def next_frame(self) -> None:
+        """Closes the frame in progress, if any, and starts the next one"""
+        if not self.enabled and self.tracer is None:
+            return
+        now = perf_counter()
+        if self.frame_start is not None:
+            self.frames.append((now - self.frame_start, self.current))
+            if self.tracer is not None:
+                self.tracer.complete("frame", self.frame_start, now)
+        self.current = {}
+        self.frame_start = now
+
+    def toggle(self) -> None:
+        self.enabled = not self.enabled
+        self.current = {}
+        self.frame_start = None
+
+    def summary(self, top: int = 6) -> Summary:
+        """FPS, median and 99th percentile frame times, and the `top` slowest scopes, over the buffered frames"""
+        times = sorted(frame for frame, _ in self.frames)
+        totals: Dict[str, float] = {}
+        for _, scopes in self.frames:
+            for name, seconds in scopes.items():
+                totals[name] = totals.get(name, 0.0) + seconds
+
+        n = len(times)
+        if n == 0:
+            return {"frames": 0, "fps": 0.0, "p50_ms": 0.0, "p99_ms": 0.0, "scopes": []}
+        slowest = sorted(totals.items(), key=lambda item: -item[1])[:top]
+        return {
+            "frames": n,
+            "fps": n / sum(times) if sum(times) > 0 else 0.0,
+            "p50_ms": times[n // 2] * 1000,
+            "p99_ms": times[min(n - 1, int(n * 0.99))] * 1000,
+            "scopes": [(name, total / n * 1000) for name, total in slowest],
+        }
+
+    def dump(self, path: Optional[str] = None) -> str:
+        """Writes the buffered frames and their summary as JSON, by default into log/profiles/, and returns the path"""
+        path = path or os.path.join("log", "profiles", time.strftime("profile-%Y%m%d-%H%M%S.json"))
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        frames = [
+            {"ms": frame * 1000, "scopes_ms": {name: seconds * 1000 for name, seconds in scopes.items()}}
+            for frame, scopes in self.frames
+        ]
+        with open(path, "w") as f:
+            json.dump({"summary": self.summary(), "frames": frames}, f)
+        return path
@@ -0,0 +1,176 @@
+"""
+Bulk simulation of bot-only rounds using the headless engine
+
+Usage: python -m blackjack.sim [--rounds N] [--workers W] [--seed S] [--decks D] [--backend object|numpy]
+
+Every worker plays its own table with its own random stream derived from (seed, worker index), so the merged result
+is bit-identical for a given seed, worker count and backend. The numpy backend (`blackjack.vectorized`) plays many
+tables per worker at once instead of one.
+"""
+
+from __future__ import annotations
+from typing import List, Optional, Tuple
+
+from dataclasses import dataclass, field
+import argparse
+import os
+import random
+import time
+
+from .engine import Bot, Card, Dealer, Deck, bare_card, play_round
+
+
+@dataclass
+class SimStats:
+    rounds: int = 0
+    hands: int = 0
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+    wagered: int = 0
+    returned: int = 0
+    trajectories: List[List[Tuple[int, ...]]] = field(default_factory=list)
+    """One trajectory per simulated table, each a list of the bots' balances sampled every `sample_every` rounds"""
+
+    def record(self, bots: List[Bot[Card]]) -> None:
+        """Adds the settled hands of a finished round"""
+        self.rounds += 1
+        for bot in bots:
+            for idx, hand in enumerate(bot.hands):
+                if len(hand.cards) == 0:
+                    continue
+
+                self.hands += 1
+                self.wagered += bot.round_bets[idx]
+                self.returned += hand.net_return
+                if hand.result == 1:
+                    self.wins += 1
+                elif hand.result == 2:
+                    self.draws += 1
+                else:
+                    self.losses += 1
+
+    def merge(self, other: SimStats) -> None:
+        """Folds the aggregates of another (independent) simulation into this one"""
+        self.rounds += other.rounds
+        self.hands += other.hands
+        self.wins += other.wins
+        self.draws += other.draws
+        self.losses += other.losses
+        self.wagered += other.wagered
+        self.returned += other.returned
+        self.trajectories.extend(other.trajectories)
+
+    @property
+    def house_edge(self) -> float:
+        """Fraction of every unit wagered that the house keeps"""
+        return (self.wagered - self.returned) / self.wagered if self.wagered else 0.0
+
+    def summary(self) -> str:
+        hands = max(self.hands, 1)
+        return "\n".join(
+            [
+                f"rounds      {self.rounds}",
+                f"hands       {self.hands}",
+                f"win/draw/loss  {self.wins / hands:.4f} / {self.draws / hands:.4f} / {self.losses / hands:.4f}",
+                f"house edge  {self.house_edge * 100:.3f}%",
+            ]
+        )
+
+
+def simulate(
+    rounds: int, n_bots: int = 4, n_decks: int = 6, seed: Optional[int | str] = None, sample_every: int = 1000
+) -> SimStats:
+    """Plays `rounds` rounds on a single table, with the deck and the bots drawing from one stream seeded by `seed`"""
+    rng = random.Random(seed)
+
+    dealer: Dealer[Card] = Dealer(-1)
+    bots: List[Bot[Card]] = [Bot(i, rng=rng) for i in range(n_bots)]
+    deck = Deck(n_decks=n_decks, card_type=bare_card, rng=rng)
+    deck.new_shuffled_deck()
+
+    stats = SimStats()
+    trajectory = [tuple(bot.balance for bot in bots)]
+    for n in range(1, rounds + 1):
+        play_round(dealer, bots, deck)
+        stats.record(bots)
+        if n % sample_every == 0:
+            trajectory.append(tuple(bot.balance for bot in bots))
+
+    stats.trajectories.append(trajectory)
+    return stats
+
+
+def worker_seed(seed: int, worker: int) -> str:
+    """Independent per-worker streams: string seeds are hashed with SHA-512 by `random.Random`"""
+    return f"{seed}/{worker}"
+
+
+BACKENDS = ["object", "numpy"]
+
+
+def _simulate_worker(args: Tuple[int, int, int, str, int, str]) -> SimStats:
+    rounds, n_bots, n_decks, seed, sample_every, backend = args
+    if backend == "numpy":
+        from .vectorized import simulate_vectorized
+
+        return simulate_vectorized(rounds, n_bots, n_decks, seed, sample_every)
+    return simulate(rounds, n_bots, n_decks, seed, sample_every)
+
+
+def simulate_parallel(
+    rounds: int,
+    workers: Optional[int] = None,
+    n_bots: int = 4,
+    n_decks: int = 6,
+    seed: int = 0,
+    sample_every: int = 1000,
+    backend: str = "object",
+) -> SimStats:
+    """
+    Splits `rounds` across a process pool and merges the results in worker order.
+    The result only depends on (rounds, workers, n_bots, n_decks, seed, sample_every, backend).
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = [rounds // workers + (1 if w < rounds % workers else 0) for w in range(workers)]
+    jobs = [(chunk, n_bots, n_decks, worker_seed(seed, w), sample_every, backend) for w, chunk in enumerate(chunks)]
+
+    stats = SimStats()
+    if workers == 1:
+        stats.merge(_simulate_worker(jobs[0]))
+        return stats
+
+    # Imported here, as they take longer to import than the single process simulation takes to start
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+
+    # Spawn rather than fork: the parent may already have SDL threads running
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        for result in pool.map(_simulate_worker, jobs):
+            stats.merge(result)
+
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m blackjack.sim", description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=None, help="defaults to a random seed, which is printed")
+    parser.add_argument("--decks", type=int, default=6)
+    parser.add_argument("--backend", choices=BACKENDS, default="object", help="numpy requires the [sim] extra")
+    args = parser.parse_args(argv)
+
+    seed = args.seed if args.seed is not None else random.randrange(2**32)
+
+    start = time.perf_counter()
+    stats = simulate_parallel(args.rounds, args.workers, n_decks=args.decks, seed=seed, backend=args.backend)
+    elapsed = time.perf_counter() - start
+
+    print(f"seed        {seed} ({args.workers} workers, {args.backend} backend)")
+    print(stats.summary())
+    print(f"elapsed     {elapsed:.2f}s ({stats.rounds / elapsed:,.0f} rounds/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+from typing import Dict
+
+import pygame as pg
+
+CARD_SCALE = 0.14
+"""Scale applied to the 0cardfront/0cardback assets for every card on the table"""
+FACE_SCALE = 0.7
+"""Scale of a card face relative to the (already scaled) card front it is composited onto"""
+CHIP_SCALE = 0.25
+
+
+def scale_by(surface: pg.Surface, factor: float) -> pg.Surface:
+    return pg.transform.scale(surface, (surface.get_width() * factor, surface.get_height() * factor))
+
+
+def compose_sprites(images: Dict[str, pg.Surface], card_scale: float = CARD_SCALE) -> Dict[str, pg.Surface]:
+    """
+    Pre-composites every sprite the table draws, keyed by the same image keys as `App.images`.
+
+    Card faces are scaled and blitted onto the scaled card front once here, so that `Card.draw` only has to blit.
+    Needs no display, which lets `blackjack.atlas` run it as a build step.
+    """
+    sprites: Dict[str, pg.Surface] = {}
+
+    card_front = scale_by(images["0cardfront"], card_scale)
+    sprites["0cardback"] = scale_by(images["0cardback"], card_scale)
+    sprites["0cardfront"] = card_front
+    sprites["chip"] = scale_by(images["chip"], CHIP_SCALE)
+
+    face_size = (card_front.get_width() * FACE_SCALE, card_front.get_height() * FACE_SCALE)
+
+    for key, image in images.items():
+        if key.startswith("0") or key == "chip":
+            continue
+
+        card = pg.Surface(card_front.get_size(), pg.SRCALPHA)
+        card.blit(card_front, (0, 0))
+        scaled_face = pg.transform.scale(image, face_size)
+        card.blit(
+            scaled_face,
+            ((card.get_width() - scaled_face.get_width()) // 2, (card.get_height() - scaled_face.get_height()) // 2),
+        )
+        sprites[key] = card
+
+    return sprites
+
+
+def build_sprites(images: Dict[str, pg.Surface], card_scale: float = CARD_SCALE) -> Dict[str, pg.Surface]:
+    """`compose_sprites`, converted for fast blitting. Must be called after the display mode is set."""
+    return {key: sprite.convert_alpha() for key, sprite in compose_sprites(images, card_scale).items()}
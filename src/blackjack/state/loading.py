@@ -1,10 +1,12 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from ..app import App
 
+from .. import atlas
 from ..app import State
+from ..sprites import build_sprites
 from ..util import get_evenly_spaced_points
 from .table import Table
 
@@ -13,15 +15,38 @@ from importlib import resources as impresources
 
 import pygame as pg
 import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from ..log import logger
 from math import floor
 
 
 class AssetLoader:
-    def __init__(self) -> None:
+    """
+    Decodes the assets on a thread pool as soon as it is constructed. SDL_image releases the GIL while decoding, so
+    the main loop keeps drawing the progress bar and only collects finished results.
+
+    With a packed atlas (`blackjack.atlas`) there is a single job producing the sheet's pixels. Without one, there is
+    a job per asset producing (key, surface).
+    """
+
+    def __init__(self, workers: Optional[int] = None, use_atlas: bool = True) -> None:
         all_assets = self.all_assets()
 
-        self.to_load = iter(all_assets)
         self.expected_files = len(all_assets)
+        self.index = atlas.read_index() if use_atlas else None
+        """The atlas to load instead of the individual assets, if one was built for the current scales"""
+        self.started = time.perf_counter()
+        self.elapsed: Optional[float] = None
+        """Wall-clock seconds from construction until the last job was collected"""
+
+        self.pool = ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1))
+        self.pending: List[Future[Any]]
+        if self.index is not None:
+            self.pending = [self.pool.submit(atlas.load_pixels, self.index)]
+        else:
+            self.pending = [self.pool.submit(self.load, path) for path in all_assets]
+        self.jobs = len(self.pending)
 
     @staticmethod
     def all_assets() -> List[str]:
@@ -41,28 +66,59 @@ class AssetLoader:
         # Flattened list of all asset paths
         return [res for sub in [cards, other_assets] for res in sub]
 
-    def load_next(self) -> Tuple[str, pg.Surface] | None:
-        path = next(self.to_load, None)
-
-        if path is None:
-            return None
-
+    @staticmethod
+    def load(path: str) -> Tuple[str, pg.Surface]:
         filename = os.path.basename(path)
         key = os.path.splitext(filename)[0]
 
         return key, pg.image.load(path)
 
+    @property
+    def progress(self) -> float:
+        return 1 - len(self.pending) / self.jobs
+
+    def collect(self) -> List[Any]:
+        """Returns the results finished since the last call, without waiting for the rest"""
+        done: List[Future[Any]] = []
+        pending: List[Future[Any]] = []
+        for future in self.pending:
+            (done if future.done() else pending).append(future)
+        self.pending = pending
+
+        if not pending and self.elapsed is None:
+            self.elapsed = time.perf_counter() - self.started
+            self.pool.shutdown(wait=False)
+
+        return [future.result() for future in done]
+
 
 class Loading(State):
     def __init__(self, ctx: App) -> None:
         self.loader = AssetLoader()
+        self.font = pg.font.Font(str(impresources.files("blackjack").joinpath("fonts/KozGoPro-Bold.otf")), 30)
 
         super().__init__(ctx)
 
     def update(self) -> None:
-        if (t := self.loader.load_next()) is not None:
-            key, surface = t
-            self.ctx.images[key] = surface
+        if self.loader.pending:
+            if self.loader.index is not None:
+                for pixels in self.loader.collect():
+                    self.ctx.sprites.update(atlas.cut(self.loader.index, pixels))
+            else:
+                for key, surface in self.loader.collect():
+                    self.ctx.images[key] = surface
+
+                if not self.loader.pending:
+                    self.ctx.sprites.update(build_sprites(self.ctx.images))
+                    # Only the sprites are drawn, the full size images would just hold memory
+                    self.ctx.images.clear()
+
+            if not self.loader.pending:
+                source = "atlas" if self.loader.index is not None else f"{self.loader.expected_files} assets"
+                logger.info("Loaded sprites from {} in {:.3f}s", source, self.loader.elapsed)
+                if self.ctx.tracer is not None and self.loader.elapsed is not None:
+                    started = self.loader.started
+                    self.ctx.tracer.complete("assets", started, started + self.loader.elapsed, "loading", source=source)
 
         if len(self.ctx.zones) == 0:
             # Load all zone positions
@@ -103,7 +159,7 @@ class Loading(State):
             self.ctx.zones["hand_dealer"] = dealer_zone
 
     def render(self) -> None:
-        loaded = len(self.ctx.images) / self.loader.expected_files
+        loaded = self.loader.progress
 
         screen_w, screen_h = self.ctx.display.get_width(), self.ctx.display.get_height()
         rect_w, rect_h = (screen_w // 2.5), screen_h // 30
@@ -112,8 +168,7 @@ class Loading(State):
         progress_rect = pg.Rect(x, y, rect_w * loaded, rect_h)
         pg.draw.rect(self.ctx.display, (80, 230, 80), progress_rect, border_radius=45)
 
-        font = pg.font.Font(str(impresources.files("blackjack").joinpath("fonts/KozGoPro-Bold.otf")), 30)
-        text = font.render(f"{floor(loaded * 100)}%", True, (255, 255, 255))
+        text = self.ctx.text_cache.render(self.font, f"{floor(loaded * 100)}%", (255, 255, 255))
         text_rect = text.get_rect()
         text_rect.right = progress_rect.right
         text_rect.y = progress_rect.y + floor(text_rect.height * 1.8)
@@ -121,4 +176,5 @@ class Loading(State):
         self.ctx.display.blit(text, text_rect)
 
         if loaded == 1:
+            logger.info("First table frame {:.3f}s after loading started", time.perf_counter() - self.loader.started)
             self.pend(Table)
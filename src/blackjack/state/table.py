@@ -1,275 +1,56 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple
 from typing_extensions import override
 
-from loguru import logger
+from ..log import logger
 
-from blackjack.ui.turn_buttons import ActionType, TurnButton
+from blackjack import engine
+from blackjack.engine import CARDS, CARD_CODES, ActionType, Bot, Card, Dealer, Deck, Hand, Player
+from blackjack.ui.turn_buttons import TurnButton
 
 if TYPE_CHECKING:
     from ..app import App
 
 from ..app import Drawable, State
+from ..trace import Tracer
 from ..ui import UIState
 from ..util import Vec2
 
 from enum import Enum, auto
+from time import perf_counter
+import math
 from importlib import resources as impresources
-from math import ceil
 import pygame as pg
-import itertools
-import random
-from queue import LifoQueue
-
-
-class Player:
-    def __init__(self, id: int) -> None:
-        self.hands: List[Hand] = [Hand(), Hand(), Hand(), Hand()]
-        self.id = id
-        self.balance = 100000
-
-        # self.round_bet = 0
-        self.round_bets: List[int] = [0, 0, 0, 0]
-        """Index corresponds to the bet per each hand in self.hands"""
-
-        # self.current_hand = 0
-
-    def add_card(self, hand_idx: int, card: Card) -> None:
-        # self.hands[self.current_hand].cards.append(card)
-        self.hands[hand_idx].cards.append(card)
-
-    def allowed_to_potentially_split(self) -> bool:
-        """The player is only allowed to split if there is an empty hand available"""
-        return any(len(hand.cards) == 0 for hand in self.hands)
-
-
-class Bot(Player):
-    def __init__(self, id: int) -> None:
-        super().__init__(id)
-
-    def decide_bet(self) -> None:
-        # Not going to add heuristics for betting - just random value
-        # Check blackjack.ui.bet_box for min/max bet values
-        min_bet, max_bet = 100, 5000
-        self.round_bets[0] = random.randrange(min_bet, max_bet + 1)
-        self.balance -= self.round_bets[0]
-
-    def decide(self, hand_idx: int, dealer: Dealer) -> ActionType:
-        # TODO: Make decisions based on the revealed card of the Dealer based on this strategy chart:
-        # https://www.blackjackapprenticeship.com/blackjack-strategy-charts/
-        # For now, it'll be a very simple set of rules:
-        # > Hit if card total is less than 16
-        # TODO: > Split pair 7/8/A
-        # > Double on a hard ORIGINAL DEAL total of 10/11 (no ace)
-
-        hand = self.hands[hand_idx]
-        if hand.is_done:
-            return ActionType.Stand
-
-        hand_value = hand.calculate_value()
-        if hand_value == 0:
-            # Empty hand should be "passed"
-            return ActionType.Stand
-
-        if hand_value > 21:
-            hand.is_bust = True
-            return ActionType.Stand
-
-        if len(hand.cards) == 2 and hand.cards[0].value == hand.cards[1].value and hand.cards[0].value in [7, 8, -1]:
-            logger.debug(f"Bot {id} Splitted!")
-            # All split hands will always have the same bet as the initial bet, thus subtract index 0
-            self.balance -= self.round_bets[0]
-            return ActionType.Split
-
-        if (
-            all([not card.is_ace for card in hand.cards])
-            and (hand_value == 10 or hand_value == 11)
-            and len(hand.cards) == 2
-        ):
-            hand.is_done = True
-            hand.is_doubled = True
-            self.balance -= self.round_bets[hand_idx]
-            self.round_bets[hand_idx] *= 2
-            logger.debug(f"Bot {id} Doubled!")
-            return ActionType.Double
-
-        if hand_value < 16:
-            logger.debug(f"Bot {id} Hit!")
-            return ActionType.Hit
-
-        hand.is_done = True
-        logger.debug(f"Bot {id} Stood!")
-        return ActionType.Stand
-
-
-# class Action:
-#     def __init__(self, action_type: ActionType) -> None:
-#         self.action_type = action_type
-
-
-class Dealer(Player):
-    def __init__(self, id: int) -> None:
-        super().__init__(id)
-
-
-class Card(Drawable):
-    def __init__(self, value: int, suit: str, image_key: str) -> None:
-        self.value = value
-        self.suit = suit
-        self.image_key = image_key
-        """
-        Usage within a State class:
-
-        ```
-        self.ctx.images[card.image_key]
-        ```
-        """
-        self.is_ace = value == -1
-        self.is_facedown = False
-
-    @override
-    def draw(self, ctx: App) -> None:
-        if self.is_facedown or self.image_key == "0cardback":
-            card = ctx.images["0cardback"]
-            card = pg.transform.scale(card, (card.get_width() * 0.14, card.get_height() * 0.14))
-            blit_rect = pg.rect.Rect(self.pos.x, self.pos.y, card.get_width(), card.get_height())
-            ctx.display.blit(card, blit_rect)
-            return
-
-        card_front = ctx.images["0cardfront"]
-        card_front = pg.transform.scale(card_front, (card_front.get_width() * 0.14, card_front.get_height() * 0.14))
-
-        card = pg.Surface(card_front.get_size(), pg.SRCALPHA)
-        card.blit(card_front, (0, 0))
-        scaled_face = pg.transform.scale(ctx.images[self.image_key], (card.get_width() * 0.7, card.get_height() * 0.7))
-
-        card.blit(
-            scaled_face,
-            ((card.get_width() - scaled_face.get_width()) // 2, (card.get_height() - scaled_face.get_height()) // 2),
-        )
-
-        blit_rect = pg.rect.Rect(self.pos.x, self.pos.y, card.get_width(), card.get_height())
-        ctx.display.blit(card, blit_rect)
-
-
-class Hand:
-    def __init__(self) -> None:
-        self.cards: List[Card] = []
-
-        self.is_doubled = False
-
-        self.is_blackjack = False
-        self.is_bust = False
-        self.is_done = False
-        """
-        A hand is done if ONE of:
-            - The hand is blackjack or 21
-            - The hand is stood
-            - The hand is bust
-        """
 
-        self.result: int = 0
-        """
-        0 - loss
-        1 - win
-        2 - draw
-        """
-        self.net_return: int = 0
 
-    def calculate_value(self) -> int:
-        cum = 0
-        non_aces = [card for card in self.cards if not card.is_ace]
+class DealtCard(Drawable):
+    """The per-deal state of a card on the table, wrapping one of the interned `engine.CARDS`"""
 
-        for card in non_aces:
-            cum += card.value
+    __slots__ = ("card", "is_facedown")
 
-        aces = set(self.cards) - set(non_aces)
-        no_aces = len(aces)
-        # If there are more than 1 ace, then you can at most have ONE ace that is valued at 11. Thus, if we have n > 1
-        # aces, we add n-1 to the cumulative value and then check whether the last ace can be valued at 11.
-        if no_aces > 0:
-            if no_aces > 1:
-                cum += no_aces - 1
+    def __init__(self, card: Card) -> None:
+        self.card = card
+        self.is_facedown = False
 
-            try_plus_11 = cum + 11
+    @property
+    def value(self) -> int:
+        return self.card.value
 
-            if try_plus_11 > 21:
-                cum += 1
-            else:
-                cum += 11
+    @property
+    def is_ace(self) -> bool:
+        return self.card.is_ace
 
-        return cum
+    @property
+    def image_key(self) -> str:  # type: ignore[override]
+        return self.card.image_key
 
-    def get_word(self, is_end_round: Optional[bool] = False) -> str:
-        if is_end_round:
-            if self.result == 0:
-                return "BET LOST"
-            elif self.result == 1:
-                return "WIN"
-            else:
-                return "DRAW"
-
-        # Check for blackjack here because I forgot to put it elsewhere
-        value = self.calculate_value()
-        if value == 21 and len(self.cards) == 2:
-            self.is_blackjack = True
-
-        if self.is_blackjack:
-            return "B.J."
-        if self.is_bust:
-            return "Bust"
-        if self.is_doubled:
-            return "Double"
-        return "Bet"
-
-    def allowed_to_split(self) -> bool:
-        if len(self.cards) != 2:
-            return False
-        # Won't get IndexOutOfBounds error
-        return self.cards[0].value == self.cards[1].value
-
-    def allowed_to_double(self) -> bool:
-        # Only allowed to double on the initial deal
-        return len(self.cards) == 2
-
-
-class Deck:
-    def __init__(self, n_decks: int) -> None:
-        self._card_queue: LifoQueue[str] = LifoQueue()
-        self.n_decks = n_decks
-
-    def new_shuffled_deck(self) -> None:
-        cards = [
-            [
-                "_of_".join(card)
-                for card in itertools.product(
-                    ["2", "3", "4", "5", "6", "7", "8", "9", "10", "ace", "jack", "queen", "king"],
-                    ["diamonds", "clubs", "hearts", "spades"],
-                )
-            ]
-            for _ in range(0, self.n_decks)
-        ]
-        flattened = list(itertools.chain(*cards))
-        random.shuffle(flattened)
-        self._card_queue.queue = flattened
-
-    def poptop(self) -> Card:
-        top = self._card_queue.get()
-        # String format is "<value>_of_<suit>"
-        value, suit = (parts := top.split("_"))[0], parts[-1]
-
-        match value:
-            case s if s in ["jack", "queen", "king"]:
-                val = 10
-            case "ace":
-                val = -1
-            case _:
-                val = int(value)
-
-        return Card(val, suit, top)
+    @override
+    def sprite(self, ctx: App) -> pg.Surface:
+        return ctx.sprites["0cardback" if self.is_facedown else self.image_key]
 
-    def is_exhausted(self) -> bool:
-        return self._card_queue.empty()
+    @override
+    def draw(self, ctx: App) -> None:
+        ctx.display.blit(self.sprite(ctx), (self.pos.x, self.pos.y))
 
 
 class GamePhase(Enum):
@@ -288,31 +69,85 @@ class TurnPhase(Enum):
 
 
 class Movable:
+    """
+    One card (or chip) in flight, as a slotted record that `Movables.step` updates in place without allocating.
+
+    The object gets its own `pos` on launch (cards dealt together used to share one `Vec2`), which is then moved in
+    place every tick.
+    """
+
+    __slots__ = ("obj", "pos", "dest", "speed", "prev_x", "prev_y", "trace_id")
+
     def __init__(self, obj: Drawable, dest: Vec2, speed: int) -> None:
-        """speed | how long (ms) the object should take to reach its destination"""
+        """speed | pixels per second of game time"""
         self.obj = obj
+        self.pos = obj.pos = Vec2(obj.pos.x, obj.pos.y)
         self.dest = dest
         self.speed = speed
+        self.prev_x, self.prev_y = self.pos.x, self.pos.y
+        """Position before the last step, the start of the interpolation drawn until the next one"""
+        self.trace_id = 0
 
-    def move(self, dt: float) -> None:
-        """
-        Returns
-            - True  | The object has reached its destination
-            - False | It has not
-        """
-        direction = (self.dest - self.obj.pos).unit()
-        scaled_direction = direction * self.speed * dt
-
-        # If the distance between the destination and position is less than the to be added vector, then we're done!
-        # This check is necessary for locking the object to the destination because of adding non-constant floats
-        if (self.dest - self.obj.pos).magn() < scaled_direction.magn():
-            self.obj.pos = self.dest
-        else:
-            self.obj.pos += Vec2(direction.x * self.speed * dt, direction.y * self.speed * dt)
+    def interpolated_pos(self, alpha: float) -> Tuple[float, float]:
+        """Where to draw the object `alpha` of the way from the last tick to the next"""
+        pos = self.pos
+        return (self.prev_x + (pos.x - self.prev_x) * alpha, self.prev_y + (pos.y - self.prev_y) * alpha)
 
     def is_done(self) -> bool:
         """Check if the object has arrived at its destination"""
-        return self.obj.pos.x == self.dest.x and self.obj.pos.y == self.dest.y
+        return self.pos.x == self.dest.x and self.pos.y == self.dest.y
+
+
+class Movables:
+    """Every `Movable` in flight, stepped together once per tick, with each flight traced if there is a `tracer`"""
+
+    __slots__ = ("flying", "tracer")
+
+    def __init__(self, tracer: Optional[Tracer] = None) -> None:
+        self.flying: List[Movable] = []
+        self.tracer = tracer
+
+    def append(self, movable: Movable) -> None:
+        if self.tracer is not None:
+            obj = movable.obj
+            movable.trace_id = self.tracer.begin_async(type(obj).__name__, "movables", sprite=obj.image_key)
+        self.flying.append(movable)
+
+    def __len__(self) -> int:
+        return len(self.flying)
+
+    def __iter__(self) -> Iterator[Movable]:
+        return iter(self.flying)
+
+    def step(self, dt: float, speed_scale: float = 1.0) -> List[Drawable]:
+        """
+        Advances every flight by `dt` seconds at `speed_scale` times its speed (`math.inf` to land them all now).
+        Returns the objects that arrived, in the order they were launched, with their `pos` at the destination.
+        """
+        arrived: List[Drawable] = []
+        flying: List[Movable] = []
+
+        for m in self.flying:
+            pos, dest = m.pos, m.dest
+            m.prev_x, m.prev_y = pos.x, pos.y
+            dx, dy = dest.x - pos.x, dest.y - pos.y
+            dist = math.hypot(dx, dy)
+            step = m.speed * speed_scale * dt
+
+            # Snapping once the remaining distance is within a step also covers a flight that starts at its
+            # destination, which used to divide by zero
+            if dist <= step:
+                pos.x, pos.y = dest.x, dest.y
+                arrived.append(m.obj)
+                if self.tracer is not None:
+                    self.tracer.end_async(type(m.obj).__name__, "movables", m.trace_id)
+            else:
+                pos.x += dx / dist * step
+                pos.y += dy / dist * step
+                flying.append(m)
+
+        self.flying = flying
+        return arrived
 
 
 class Chip(Drawable):
@@ -323,31 +158,85 @@ class Chip(Drawable):
 
     @override
     def draw(self, ctx: App) -> None:
-        chip = ctx.images[self.image_key]
-        chip = pg.transform.scale(chip, (chip.get_width() * 0.25, chip.get_height() * 0.25))
-        blit_rect = pg.rect.Rect(self.pos.x, self.pos.y, chip.get_width(), chip.get_height())
-        ctx.display.blit(chip, blit_rect)
+        ctx.display.blit(ctx.sprites[self.image_key], (self.pos.x, self.pos.y))
+
+
+HAND_CORNERS = ("bl", "br", "tl", "tr")
+"""Zone of each hand index of a seat, as named in `ctx.zones`"""
+CARD_STEP = (20, 10)
+"""Offset between consecutive cards of a hand, so a hand fans out diagonally"""
+PRECOMPUTED_SLOTS = 12
+"""Card slots precomputed per hand. Longer hands need a run of low cards and are computed on the spot."""
+
+Point = Tuple[float, float]
+
+
+class ZoneGrid:
+    """
+    The zones of `ctx.zones` resolved once into lists indexed by seat, so the game loop never builds a zone key.
+
+    A seat is a player id. The dealer (-1) comes last and has a single hand, so `hands[-1][0]` is the dealer zone.
+    """
+
+    __slots__ = ("hands", "slots", "bets", "stats", "deck", "burn")
+
+    def __init__(self, zones: Dict[str, pg.Rect], n_seats: int) -> None:
+        self.hands: List[List[pg.Rect]] = [
+            [zones[f"hand_{corner}_{seat}"] for corner in HAND_CORNERS] for seat in range(n_seats)
+        ]
+        self.hands.append([zones["hand_dealer"]])
+
+        dx, dy = CARD_STEP
+        self.slots: List[List[List[Point]]] = [
+            [[(rect.x + slot * dx, rect.y + slot * dy) for slot in range(PRECOMPUTED_SLOTS)] for rect in seat]
+            for seat in self.hands
+        ]
+        self.bets: List[pg.Rect] = [zones[f"bet_{seat}"] for seat in range(n_seats)]
+        self.stats: List[pg.Rect] = [zones[f"stat_{seat}"] for seat in range(n_seats)]
+        self.deck: Point = zones["deck"].topleft
+        self.burn: Point = zones["burn"].topleft
+
+    def card(self, seat: int, hand: int, slot: int) -> Vec2:
+        """Where the `slot`th card (from 0) of a hand lands"""
+        slots = self.slots[seat][hand]
+        if slot < PRECOMPUTED_SLOTS:
+            return Vec2(*slots[slot])
+        return Vec2(slots[0][0] + slot * CARD_STEP[0], slots[0][1] + slot * CARD_STEP[1])
+
+    def top_card(self, player: Player[Any], hand: int) -> Vec2:
+        """Where the card just added to a hand of `player` lands"""
+        return self.card(player.id, hand, len(player.hands[hand].cards) - 1)
 
 
 class Table(State):
     def __init__(self, ctx: App) -> None:
-        # Dealer will always have the id 0, and the player will always have the id 1
-        self.players: List[Player] = [Dealer(-1), Player(0), Bot(1), Bot(2), Bot(3)]
-        self.deck = Deck(n_decks=6)
+        self.dealer: Dealer[DealtCard] = Dealer(-1)
+        self.player: Player[DealtCard] = Player(0)
+        self.bots: List[Bot[DealtCard]] = [Bot(1), Bot(2), Bot(3)]
+        self.players: List[Player[DealtCard]] = [self.dealer, self.player, *self.bots]
+        self.seated: List[Player[DealtCard]] = [self.player, *self.bots]
+        """Everyone but the dealer, in seat order"""
+        self.player_by_id: Dict[int, Player[DealtCard]] = {player.id: player for player in self.players}
+        self.zone_grid = ZoneGrid(ctx.zones, len(self.seated))
+
+        self.deck = Deck(n_decks=6, card_type=DealtCard)
         self.deck.new_shuffled_deck()
         self.game_phase: GamePhase = GamePhase.Initial
         self.turn_phase: TurnPhase = TurnPhase.MoveChip
-        self.movables: List[Movable] = []
+        self.movables = Movables(ctx.tracer)
         self.game_objects: List[Drawable] = []
+        self.on_table: Set[Drawable] = set()
+        """The members of `game_objects`, for constant time membership tests"""
 
         # Spawn in the turn chip and set its initial position to be just below the dealer zone
         chip = Chip()
-        dealer_zone = ctx.zones["hand_dealer"].copy()
+        dealer_zone = self.zone_grid.hands[-1][0]
         chip.pos = Vec2(
-            dealer_zone.centerx - ctx.images[chip.image_key].get_width() * 0.125,
+            dealer_zone.centerx - ctx.sprites[chip.image_key].get_width() * 0.5,
             dealer_zone.centery + dealer_zone.height * 0.5,
         )
         self.game_objects.append(chip)
+        self.on_table.add(chip)
 
         self.deal_counter: int = 0
 
@@ -375,7 +264,7 @@ class Table(State):
                 "queen_of_clubs",
                 "ace_of_spades",
             ]:
-                self.deck._card_queue.put(card)
+                self.deck.put(card)
 
         self.current_turn: Tuple[int, int] = (3, 0)
         """
@@ -385,63 +274,67 @@ class Table(State):
 
         super().__init__(ctx)
 
-    def filter_players(self, condition: Callable[[Player], bool]) -> List[Player]:
-        return [player for player in self.players if condition(player)]
+        self.background = self.build_background()
+        self.highlight = pg.Surface(ctx.zones["hand_tl_0"].size).convert()
+        self.highlight.fill((247, 213, 39))  # f7d527
+        self.last_scene: Optional[List[Tuple[pg.Surface, Tuple[float, float]]]] = None
+        """The scene `render_dirty` last drew, or None to redraw the whole frame"""
+        self.frame_scenes: Tuple[int, List[Tuple[pg.Surface, Tuple[float, float]]]] = (-1, [])
+        """(`App.frame`, its scene), shared by the UI drawn over the table and the table itself, see `frame_scene`"""
+        self.traced_phases: Dict[str, Tuple[Enum, float]] = {}
+        """Track -> (phase, `perf_counter` time it started), see `trace_phases`"""
 
     def update(self) -> None:
         if self.deck.is_exhausted():
             self.deck.new_shuffled_deck()
 
+        grid = self.zone_grid
+
         match self.game_phase:
             case GamePhase.Initial:
                 # Dummy phase for now, but implemented like this so it's easier to write any events
                 # that could happen before the deal phase in the future
-                deck_zone = self.ctx.zones["deck"].topleft
-
                 burn_card = self.deck.poptop()
-                burn_card.pos = Vec2(deck_zone[0], deck_zone[1])
-                burn_card.image_key = "0cardback"
-                burn_zone = self.ctx.zones["burn"].topleft
-                self.movables.append(Movable(burn_card, dest=Vec2(burn_zone[0], burn_zone[1]), speed=1500))
+                burn_card.pos = Vec2(*grid.deck)
+                burn_card.is_facedown = True
+                self.movables.append(Movable(burn_card, dest=Vec2(*grid.burn), speed=1500))
 
                 self.game_phase = GamePhase.Bet
             case GamePhase.Bet:
                 self.ctx.ui_state = UIState.Bet
 
-                player = self.filter_players(lambda player: type(player) == Player)[0]
+                player = self.player
                 if player.round_bets[0] != 0:
-                    logger.debug(f"PLAYER BET {player.round_bets[0]}")
+                    logger.debug("PLAYER BET {}", player.round_bets[0])
                     player.balance -= player.round_bets[0]
                     self.game_phase = GamePhase.Deal
                     self.ctx.ui_state = UIState.Normal
 
                     # This will only run once
-                    [x.decide_bet() for x in self.players if type(x) == Bot]
+                    for bot in self.bots:
+                        bot.decide_bet()
 
             case GamePhase.Deal:
                 if self.deal_counter < 2 and len(self.movables) == 0:
-                    for i in range(-1, 4):
-                        target = self.filter_players(lambda player: player.id == i)[0]
-
-                        if i == -1 and self.DEBUG_FORCE_DEALER_BLACKJACK:
+                    for target in self.players:
+                        if target is self.dealer and self.DEBUG_FORCE_DEALER_BLACKJACK:
                             if self.deal_counter == 0:
-                                top_card = Card(10, suit="spades", image_key="jack_of_spades")
+                                top_card = DealtCard(CARDS[CARD_CODES["jack_of_spades"]])
                             else:
-                                top_card = Card(-1, suit="spades", image_key="ace_of_spades")
+                                top_card = DealtCard(CARDS[CARD_CODES["ace_of_spades"]])
                         else:
                             top_card = self.deck.poptop()
 
-                        top_card.pos = Vec2(*self.ctx.zones["deck"].topleft)
+                        top_card.pos = Vec2(*grid.deck)
 
                         # Second card for the dealer is face down
-                        if self.deal_counter == 1 and i == -1:
+                        if self.deal_counter == 1 and target is self.dealer:
                             top_card.is_facedown = True
 
                         target.add_card(0, top_card)
-
-                        zone = self.ctx.zones[f"hand_{'dealer' if i == -1 else f'bl_{i}'}"].topleft
-                        zone = (zone[0] + self.deal_counter * 20, zone[1] + self.deal_counter * 10)
-                        self.movables.append(Movable(top_card, dest=Vec2(zone[0], zone[1]), speed=1500))
+                        self.movables.append(
+                            Movable(top_card, dest=grid.card(target.id, 0, self.deal_counter), speed=1500)
+                        )
 
                     self.deal_counter += 1
 
@@ -451,9 +344,8 @@ class Table(State):
 
             case GamePhase.Play:
                 # If the dealer gets a blackjack, the round ends
-                dealer = self.filter_players(lambda player: type(player) == Dealer)[0]
-                if dealer.hands[0].calculate_value() == 21:
-                    dealer.hands[0].is_blackjack = True
+                dealer = self.dealer
+                if engine.mark_blackjack(dealer.hands[0]):
                     for card in dealer.hands[0].cards:
                         card.is_facedown = False
 
@@ -461,20 +353,19 @@ class Table(State):
 
                 # Temporary for developing the ui
                 # self.ctx.ui_state = UIState.Turn
-                target_player = self.filter_players(lambda player: player.id == self.current_turn[0])[0]
-                dealer = self.filter_players(lambda player: type(player) == Dealer)[0]
-                assert type(dealer) == Dealer
+                target_player = self.player_by_id[self.current_turn[0]]
 
                 if self.turn_phase == TurnPhase.MoveChip:
                     chip = [x for x in self.game_objects if type(x) == Chip][0]
                     self.game_objects.remove(chip)
+                    self.on_table.discard(chip)
 
-                    target_zone = self.ctx.zones[f"hand_tl_{target_player.id}"]
-                    dealer_zone = self.ctx.zones["hand_dealer"]
+                    target_zone = grid.hands[target_player.id][HAND_CORNERS.index("tl")]
+                    dealer_zone = grid.hands[-1][0]
                     y = dealer_zone.centery + dealer_zone.height * 0.5
 
                     if self.current_turn == (0, 3):
-                        dest = Vec2(dealer_zone.centerx - self.ctx.images[chip.image_key].get_width() * 0.125, y)
+                        dest = Vec2(dealer_zone.centerx - self.ctx.sprites[chip.image_key].get_width() * 0.5, y)
                         self.turn_phase = TurnPhase.Dealer
                     else:
                         dest = Vec2(target_zone.centerx, y)
@@ -495,91 +386,34 @@ class Table(State):
                         match action:
                             case ActionType.Hit:
                                 # TODO: Refactor out the drawing card code
-                                top_card = self.deck.poptop()
-                                top_card.pos = Vec2(*self.ctx.zones["deck"].topleft)
-                                target_player.add_card(self.current_turn[1], top_card)
-
-                                if target_hand == 0:
-                                    hand_zone = "bl"
-                                elif target_hand == 1:
-                                    hand_zone = "br"
-                                elif target_hand == 2:
-                                    hand_zone = "tl"
-                                else:
-                                    hand_zone = "tr"
-
-                                zone = self.ctx.zones[f"hand_{hand_zone}_{target_player.id}"].topleft
-                                x_offset = (len(target_player.hands[target_hand].cards) - 1) * 20
-                                y_offset = (len(target_player.hands[target_hand].cards) - 1) * 10
-                                zone = (zone[0] + x_offset, zone[1] + y_offset)
-                                self.movables.append(Movable(top_card, dest=Vec2(zone[0], zone[1]), speed=1500))
-                                pass
+                                top_card = engine.hit(target_player, target_hand, self.deck)
+                                top_card.pos = Vec2(*grid.deck)
+                                self.movables.append(
+                                    Movable(top_card, dest=grid.top_card(target_player, target_hand), speed=1500)
+                                )
                             case ActionType.Double:
                                 # TODO: Refactor out the drawing card code
-                                top_card = self.deck.poptop()
-                                top_card.pos = Vec2(*self.ctx.zones["deck"].topleft)
-                                target_player.add_card(self.current_turn[1], top_card)
-
-                                if target_hand == 0:
-                                    hand_zone = "bl"
-                                elif target_hand == 1:
-                                    hand_zone = "br"
-                                elif target_hand == 2:
-                                    hand_zone = "tl"
-                                else:
-                                    hand_zone = "tr"
-
-                                zone = self.ctx.zones[f"hand_{hand_zone}_{target_player.id}"].topleft
-                                x_offset = (len(target_player.hands[target_hand].cards) - 1) * 20
-                                y_offset = (len(target_player.hands[target_hand].cards) - 1) * 10
-                                zone = (zone[0] + x_offset, zone[1] + y_offset)
-                                self.movables.append(Movable(top_card, dest=Vec2(zone[0], zone[1]), speed=1500))
+                                top_card = engine.double(target_player, target_hand, self.deck)
+                                top_card.pos = Vec2(*grid.deck)
+                                self.movables.append(
+                                    Movable(top_card, dest=grid.top_card(target_player, target_hand), speed=1500)
+                                )
                             case ActionType.Split:
-                                free_hand = next(hand for hand in target_player.hands if len(hand.cards) == 0)
-                                current_hand = target_player.hands[target_hand]
-                                second_card = current_hand.cards[1]
-                                current_hand.cards.remove(second_card)
-                                free_hand.cards.append(second_card)
-
-                                free_hand_idx = target_player.hands.index(free_hand)
-                                target_player.round_bets[free_hand_idx] = target_player.round_bets[0]
-                                if free_hand_idx == 1:
-                                    hand_zone = "br"
-                                elif free_hand_idx == 2:
-                                    hand_zone = "tl"
-                                else:
-                                    hand_zone = "tr"
-
-                                new_zone = self.ctx.zones[f"hand_{hand_zone}_{target_player.id}"].topleft
-                                x_offset = (len(target_player.hands[target_hand].cards) - 1) * 20
-                                y_offset = (len(target_player.hands[target_hand].cards) - 1) * 10
-                                zone = (new_zone[0] + x_offset, new_zone[1] + y_offset)
+                                free_hand_idx, second_card, top_card_1, top_card_2 = engine.split(
+                                    target_player, target_hand, self.deck
+                                )
+                                seat = target_player.id
                                 self.movables.append(
-                                    Movable(second_card, dest=Vec2(new_zone[0], new_zone[1]), speed=400)
+                                    Movable(second_card, dest=grid.card(seat, free_hand_idx, 0), speed=400)
                                 )
 
                                 # Hit 2 cards onto each split
-                                top_card_1, top_card_2 = self.deck.poptop(), self.deck.poptop()
-                                top_card_1.pos = top_card_2.pos = Vec2(*self.ctx.zones["deck"].topleft)
-
-                                target_player.add_card(self.current_turn[1], top_card_1)
-                                target_player.add_card(free_hand_idx, top_card_2)
-
-                                if target_hand == 0:
-                                    hand_zone = "bl"
-                                elif target_hand == 1:
-                                    hand_zone = "br"
-                                elif target_hand == 2:
-                                    hand_zone = "tl"
-                                else:
-                                    hand_zone = "tr"
-
-                                zone = self.ctx.zones[f"hand_{hand_zone}_{target_player.id}"].topleft
+                                top_card_1.pos = top_card_2.pos = Vec2(*grid.deck)
                                 self.movables.append(
-                                    Movable(top_card_1, dest=Vec2(zone[0] + 20, zone[1] + 10), speed=1100)
+                                    Movable(top_card_1, dest=grid.card(seat, target_hand, 1), speed=1100)
                                 )
                                 self.movables.append(
-                                    Movable(top_card_2, dest=Vec2(new_zone[0] + 20, new_zone[1] + 10), speed=1100)
+                                    Movable(top_card_2, dest=grid.card(seat, free_hand_idx, 1), speed=1100)
                                 )
                             case ActionType.Stand:
                                 # Check if the next hand is available
@@ -600,11 +434,9 @@ class Table(State):
                         hand = target_player.hands[target_hand]
 
                         if hand.calculate_value() == 21:
-                            if len(hand.cards) == 2:
-                                # 2 cards implies that there must be an Ace, thus a blackjack
-                                hand.is_blackjack = True
+                            engine.mark_blackjack(hand)
                             hand.is_done = True
-                        elif hand.calculate_value() > 21:
+                        elif hand.is_over():
                             hand.is_bust = True
                             hand.is_done = True
 
@@ -623,179 +455,61 @@ class Table(State):
                         action = [u.action_type for u in turn_buttons if u.is_clicked]
                         if len(action) == 1 and not hand.is_done:
                             # The player has clicked a button! Disable all buttons until Movable animation is over
-                            for u in [u for u in self.ctx.ui_objects if type(u) == TurnButton]:
+                            for u in turn_buttons:
                                 u.is_disabled = True
                                 u.is_clicked = False
 
                             match action[0]:
                                 case ActionType.Hit:
-                                    top_card = self.deck.poptop()
-                                    top_card.pos = Vec2(*self.ctx.zones["deck"].topleft)
-                                    target_player.add_card(self.current_turn[1], top_card)
-
-                                    if target_hand == 0:
-                                        hand_zone = "bl"
-                                    elif target_hand == 1:
-                                        hand_zone = "br"
-                                    elif target_hand == 2:
-                                        hand_zone = "tl"
-                                    else:
-                                        hand_zone = "tr"
-
-                                    zone = self.ctx.zones[f"hand_{hand_zone}_{target_player.id}"].topleft
-                                    x_offset = (len(target_player.hands[target_hand].cards) - 1) * 20
-                                    y_offset = (len(target_player.hands[target_hand].cards) - 1) * 10
-                                    zone = (zone[0] + x_offset, zone[1] + y_offset)
-                                    self.movables.append(Movable(top_card, dest=Vec2(zone[0], zone[1]), speed=1100))
+                                    top_card = engine.hit(target_player, target_hand, self.deck)
+                                    top_card.pos = Vec2(*grid.deck)
+                                    self.movables.append(
+                                        Movable(top_card, dest=grid.top_card(target_player, target_hand), speed=1100)
+                                    )
                                 case ActionType.Double:
-                                    hand.is_doubled = True
-                                    hand.is_done = True
-                                    target_player.balance -= target_player.round_bets[target_hand]
-                                    target_player.round_bets[target_hand] *= 2
-
-                                    top_card = self.deck.poptop()
-                                    top_card.pos = Vec2(*self.ctx.zones["deck"].topleft)
-                                    target_player.add_card(self.current_turn[1], top_card)
-
-                                    if target_hand == 0:
-                                        hand_zone = "bl"
-                                    elif target_hand == 1:
-                                        hand_zone = "br"
-                                    elif target_hand == 2:
-                                        hand_zone = "tl"
-                                    else:
-                                        hand_zone = "tr"
-
-                                    zone = self.ctx.zones[f"hand_{hand_zone}_{target_player.id}"].topleft
-                                    x_offset = (len(target_player.hands[target_hand].cards) - 1) * 20
-                                    y_offset = (len(target_player.hands[target_hand].cards) - 1) * 10
-                                    zone = (zone[0] + x_offset, zone[1] + y_offset)
-                                    self.movables.append(Movable(top_card, dest=Vec2(zone[0], zone[1]), speed=1100))
+                                    top_card = engine.double(target_player, target_hand, self.deck)
+                                    top_card.pos = Vec2(*grid.deck)
+                                    self.movables.append(
+                                        Movable(top_card, dest=grid.top_card(target_player, target_hand), speed=1100)
+                                    )
                                 case ActionType.Split:
-                                    free_hand = next(hand for hand in target_player.hands if len(hand.cards) == 0)
-                                    second_card = hand.cards[1]
-                                    hand.cards.remove(second_card)
-                                    free_hand.cards.append(second_card)
-
-                                    free_hand_idx = target_player.hands.index(free_hand)
-                                    target_player.round_bets[free_hand_idx] = target_player.round_bets[0]
-                                    target_player.balance -= target_player.round_bets[free_hand_idx]
-                                    if free_hand_idx == 1:
-                                        free_hand_zone = "br"
-                                    elif free_hand_idx == 2:
-                                        free_hand_zone = "tl"
-                                    else:
-                                        free_hand_zone = "tr"
-
-                                    new_zone = self.ctx.zones[f"hand_{free_hand_zone}_{target_player.id}"].topleft
-                                    x_offset = (len(target_player.hands[target_hand].cards) - 1) * 20
-                                    y_offset = (len(target_player.hands[target_hand].cards) - 1) * 10
-                                    new_zone = (new_zone[0] + x_offset, new_zone[1] + y_offset)
+                                    free_hand_idx, second_card, top_card_1, top_card_2 = engine.split(
+                                        target_player, target_hand, self.deck
+                                    )
+                                    seat = target_player.id
                                     self.movables.append(
-                                        Movable(second_card, dest=Vec2(new_zone[0], new_zone[1]), speed=400)
+                                        Movable(second_card, dest=grid.card(seat, free_hand_idx, 0), speed=400)
                                     )
 
                                     # Hit 2 cards onto each split
-                                    top_card_1, top_card_2 = self.deck.poptop(), self.deck.poptop()
-                                    top_card_1.pos = top_card_2.pos = Vec2(*self.ctx.zones["deck"].topleft)
-
-                                    target_player.add_card(self.current_turn[1], top_card_1)
-                                    target_player.add_card(free_hand_idx, top_card_2)
-
-                                    if target_hand == 0:
-                                        hand_zone = "bl"
-                                    elif target_hand == 1:
-                                        hand_zone = "br"
-                                    elif target_hand == 2:
-                                        hand_zone = "tl"
-                                    else:
-                                        hand_zone = "tr"
-
-                                    zone = self.ctx.zones[f"hand_{hand_zone}_{target_player.id}"].topleft
+                                    top_card_1.pos = top_card_2.pos = Vec2(*grid.deck)
                                     self.movables.append(
-                                        Movable(top_card_1, dest=Vec2(zone[0] + 20, zone[1] + 10), speed=1100)
+                                        Movable(top_card_1, dest=grid.card(seat, target_hand, 1), speed=1100)
                                     )
                                     self.movables.append(
-                                        Movable(top_card_2, dest=Vec2(new_zone[0] + 20, new_zone[1] + 10), speed=1100)
+                                        Movable(top_card_2, dest=grid.card(seat, free_hand_idx, 1), speed=1100)
                                     )
 
                                 case ActionType.Stand:
                                     hand.is_done = True
 
                 if self.turn_phase == TurnPhase.Dealer:
-                    dealer = self.filter_players(lambda player: type(player) == Dealer)[0]
-                    dealer_zone = self.ctx.zones["hand_dealer"]
                     dealer_hand = dealer.hands[0]
                     dealer_hand.cards[1].is_facedown = False
 
                     if len(self.movables) == 0:
-                        if dealer_hand.calculate_value() < 17:
-                            # Dealer keeps hitting until reaches 17
-                            top_card = self.deck.poptop()
-                            top_card.pos = Vec2(*self.ctx.zones["deck"].topleft)
-                            # dealer_hand.cards.append(top_card)
-                            x_offset = (len(dealer_hand.cards)) * 20
-                            y_offset = (len(dealer_hand.cards)) * 10
-                            zone = (dealer_zone[0] + x_offset, dealer_zone[1] + y_offset)
-                            self.movables.append(Movable(top_card, dest=Vec2(zone[0], zone[1]), speed=1100))
-                            dealer_hand.cards.append(top_card)
+                        if engine.dealer_should_hit(dealer_hand):
+                            top_card = engine.hit(dealer, 0, self.deck)
+                            top_card.pos = Vec2(*grid.deck)
+                            self.movables.append(Movable(top_card, dest=grid.top_card(dealer, 0), speed=1100))
                         else:
                             self.game_phase = GamePhase.EndRound
-                            for player in self.filter_players(lambda player: type(player) != Dealer):
+                            for player in self.seated:
                                 for idx, hand in enumerate(player.hands):
-                                    hand_bet = player.round_bets[idx]
-                                    # hand.result = 1
-                                    # hand.net_return = 5000
                                     for card in hand.cards:
-                                        burn_zone = self.ctx.zones["burn"].topleft
-                                        self.movables.append(Movable(card, dest=Vec2(*burn_zone), speed=550))
-
-                                    # Calculate a value which will be returned back to the balance
-                                    # Dealer BJ + You BJ -> Draw (Net return of bet)
-                                    # Dealer BJ + You No BJ -> Lose (Net return of 0)
-                                    # Dealer No BJ + You BJ -> Win (Net return of 2.5x bet)
-                                    # Dealer Bust + You Bust -> Draw (Net return of bet)
-                                    # Dealer No Bust + You Bust -> Lose (Net return of 0)
-                                    # Dealer Bust + You Don't -> Win (Net return of 2x bet)
-                                    # Dealer > You -> Lose (Net return of 0)
-                                    # Dealer = You -> Draw (Net return of bet)
-                                    # Dealer < You -> Win (Net return of 2x bet)
-
-                                    hand_bet = player.round_bets[idx]
-                                    dealer_value = dealer_hand.calculate_value()
-
-                                    hand_value = hand.calculate_value()
-
-                                    if dealer_value > 21:
-                                        dealer_hand.is_bust = True
-
-                                    if dealer_hand.is_blackjack and hand.is_blackjack:
-                                        hand.result = 2
-                                        hand.net_return = hand_bet
-                                    elif dealer_hand.is_blackjack and not hand.is_blackjack:
-                                        hand.result = 0
-                                        hand.net_return = 0
-                                    elif not dealer_hand.is_blackjack and hand.is_blackjack:
-                                        hand.result = 1
-                                        hand.net_return = ceil(2.5 * hand_bet)
-                                    elif dealer_hand.is_bust and hand.is_bust:
-                                        hand.result = 2
-                                        hand.net_return = hand_bet
-                                    elif not dealer_hand.is_bust and hand.is_bust:
-                                        hand.result = 0
-                                        hand.net_return = 0
-                                    elif dealer_hand.is_bust and not hand.is_bust:
-                                        hand.result = 1
-                                        hand.net_return = 2 * hand_bet
-                                    elif dealer_value > hand_value:
-                                        hand.result = 0
-                                        hand.net_return = 0
-                                    elif dealer_value == hand_value:
-                                        hand.result = 2
-                                        hand.net_return = hand_bet
-                                    elif dealer_value < hand_value:
-                                        hand.result = 1
-                                        hand.net_return = 2 * hand_bet
+                                        self.movables.append(Movable(card, dest=Vec2(*grid.burn), speed=550))
+
+                                    engine.settle(hand, dealer_hand, player.round_bets[idx])
 
             case GamePhase.EndRound:
                 for player in self.players:
@@ -803,7 +517,7 @@ class Table(State):
                     self.current_turn = (3, 0)
 
                 if len(self.movables) == 0:
-                    for player in self.filter_players(lambda player: type(player) != Dealer):
+                    for player in self.seated:
                         for hand in player.hands:
                             player.balance += hand.net_return
 
@@ -812,163 +526,195 @@ class Table(State):
                 if len(self.movables) == 0:
                     for player in self.players:
                         player.hands = [Hand(), Hand(), Hand(), Hand()]
-                    for card in [o for o in self.game_objects if type(o) == Card]:
-                        self.game_objects.remove(card)
+                    self.game_objects = [o for o in self.game_objects if type(o) != DealtCard]
+                    self.on_table = set(self.game_objects)
 
                     self.turn_phase = TurnPhase.MoveChip
                     self.game_phase = GamePhase.Initial
             case _:
                 pass
 
-        for movable in self.movables:
-            movable.move(self.ctx.dt)
-            if movable.is_done():
-                self.game_objects.append(movable.obj)
-                self.movables.remove(movable)
+        for obj in self.movables.step(self.ctx.dt, self.ctx.animation_speed):
+            # Cards already on the table (split, burnt at the end of a round) fly from there, and only land once
+            if obj not in self.on_table:
+                self.on_table.add(obj)
+                self.game_objects.append(obj)
+
+        if self.ctx.tracer is not None:
+            self.trace_phases(self.ctx.tracer)
+
+    def trace_phases(self, tracer: Tracer) -> None:
+        """Closes the span of each phase that changed since the last tick"""
+        now = perf_counter()
+        for track, phase in [("game phase", self.game_phase), ("turn phase", self.turn_phase)]:
+            traced, since = self.traced_phases.get(track, (phase, now))
+            if traced != phase:
+                tracer.complete(traced.name, since, now, track)
+                since = now
+            self.traced_phases[track] = (phase, since)
 
-    def render(self) -> None:
-        self.ctx.display.fill((20, 20, 20))
+    @override
+    def is_idle(self) -> bool:
+        # Waiting on the player's bet or action, with every card already in place
+        if len(self.movables) != 0:
+            return False
+        if self.game_phase == GamePhase.Bet:
+            return self.player.round_bets[0] == 0
+        return self.ctx.ui_state == UIState.Turn and self.awaits_action()
+
+    def awaits_action(self) -> bool:
+        """
+        Whether the player's current hand waits for a turn button. A hand that is empty, done, bust or at 21 doesn't:
+        the table moves past it on the next tick by itself.
+        """
+        seat, hand_idx = self.current_turn
+        if self.game_phase != GamePhase.Play or self.turn_phase != TurnPhase.TurnStart or seat != self.player.id:
+            return False
+        hand = self.player.hands[hand_idx]
+        return len(hand.cards) > 0 and not hand.is_done and not hand.is_over() and hand.calculate_value() != 21
+
+    def build_background(self) -> pg.Surface:
+        """The felt, every zone in its unhighlighted colour and the deck, none of which change during a game"""
+        background = pg.Surface(self.ctx.display.get_size()).convert()
+        background.fill((20, 20, 20))
 
         for zone_name, rect in self.ctx.zones.items():
             if "hand" in zone_name:
-                match self.current_turn[1]:
-                    case 0:
-                        zone = "bl"
-                    case 1:
-                        zone = "br"
-                    case 2:
-                        zone = "tl"
-                    case _:
-                        zone = "tr"
-
-                if zone_name == f"hand_{zone}_{self.current_turn[0]}":
-                    pg.draw.rect(self.ctx.display, (247, 213, 39), rect)  # f7d527
-                else:
-                    pg.draw.rect(self.ctx.display, (80, 140, 60), rect)
-
+                pg.draw.rect(background, (80, 140, 60), rect)
             if "stat" in zone_name:
-                pg.draw.rect(self.ctx.display, (80, 80, 80), rect)
+                pg.draw.rect(background, (80, 80, 80), rect)
             if "bet" in zone_name:
-                pg.draw.rect(self.ctx.display, (30, 30, 30), rect)
+                pg.draw.rect(background, (30, 30, 30), rect)
             if zone_name == "deck":
-                card = pg.image.load(str(impresources.files("blackjack").joinpath("assets/0cardback.png")))
-                card = pg.transform.scale(card, (card.get_width() * 0.14, card.get_height() * 0.14))
-                self.ctx.display.blit(card, rect)
+                background.blit(self.ctx.sprites["0cardback"], rect)
+
+        return background
+
+    def text(self, font: pg.font.Font, text: str) -> pg.Surface:
+        return self.ctx.text_cache.render(font, text, (255, 255, 255))
+
+    def scene(self) -> List[Tuple[pg.Surface, Tuple[float, float]]]:
+        """Everything drawn over the background this frame, in drawing order"""
+        scene: List[Tuple[pg.Surface, Tuple[float, float]]] = []
+
+        grid = self.zone_grid
+        seat, hand_idx = self.current_turn
+        scene.append((self.highlight, grid.hands[seat][hand_idx].topleft))
 
         # Draw the stack of cards in each hand to each corresponding zone / partitioned zone
         # Generalise the spacing for a diagonal vector
 
         # Draw all game objects
         for movable in self.movables:
-            movable.obj.draw(self.ctx)
+            scene.append((movable.obj.sprite(self.ctx), movable.interpolated_pos(self.ctx.alpha)))
 
+        flying = {movable.obj for movable in self.movables}
         for game_object in self.game_objects:
-            game_object.draw(self.ctx)
+            if game_object in flying:
+                continue
+            scene.append((game_object.sprite(self.ctx), (game_object.pos.x, game_object.pos.y)))
 
         text_pad = self.ctx.zones["bet_0"].height // 4
 
-        if self.game_phase in [GamePhase.Bet, GamePhase.Deal, GamePhase.Play]:
-            # Draw the bet text
-            for player in self.players:
-                id = player.id
-                if id == -1:
-                    # Dealer
-                    continue
-
-                ####################################
-                # TODO: Refactor this duplicated code
-                bet_0 = player.round_bets[0]
-                bet_1 = player.round_bets[1]
-                bet_2 = player.round_bets[2]
-                bet_3 = player.round_bets[3]
-
-                bet_0_text = self.bet_font.render(
-                    "" if bet_0 == 0 else f"{player.hands[0].get_word()} ${bet_0}", True, (255, 255, 255)
-                )
-                bet_1_text = self.bet_font.render(
-                    "" if bet_1 == 0 else f"{player.hands[1].get_word()} ${bet_1}", True, (255, 255, 255)
-                )
-                bet_2_text = self.bet_font.render(
-                    "" if bet_2 == 0 else f"{player.hands[2].get_word()} ${bet_2}", True, (255, 255, 255)
-                )
-                bet_3_text = self.bet_font.render(
-                    "" if bet_3 == 0 else f"{player.hands[3].get_word()} ${bet_3}", True, (255, 255, 255)
-                )
+        if self.game_phase in [GamePhase.Bet, GamePhase.Deal, GamePhase.Play, GamePhase.EndRound, GamePhase.Reset]:
+            # Draw the bet text, or the returns once the round has been settled
+            settled = self.game_phase in [GamePhase.EndRound, GamePhase.Reset]
+            for player in self.seated:
+                left_zone, right_zone = grid.hands[player.id][:2]
+                bet_rect = grid.bets[player.id]
+
+                for idx, hand in enumerate(player.hands):
+                    if settled:
+                        if len(hand.cards) == 0:
+                            continue
+                        text = self.text(self.bet_font, f"{hand.get_word(True)} ${hand.net_return}")
+                    else:
+                        if player.round_bets[idx] == 0:
+                            continue
+                        text = self.text(self.bet_font, f"{hand.get_word()} ${player.round_bets[idx]}")
+
+                    # Hands 0 and 2 are centred under the left zone, 1 and 3 end at the centre of the right zone
+                    x = (
+                        left_zone.centerx - text.get_width() // 2
+                        if idx % 2 == 0
+                        else right_zone.centerx - text.get_width()
+                    )
+                    y = bet_rect.centery if idx < 2 else bet_rect.centery - text.get_height()
+                    scene.append((text, (x, y)))
 
-                left_zone = self.ctx.zones[f"hand_bl_{id}"]
-                right_zone = self.ctx.zones[f"hand_br_{id}"]
-                bet_rect = self.ctx.zones[f"bet_{id}"]
+        for player in self.seated:
+            # Draw stats text (name and balance)
+            name = "Player" if player is self.player else f"Bot {player.id}"
+            name_text = self.text(self.stats_font, name)
+            bal_text = self.text(self.stats_font, f"Bal: ${player.balance}")
+            rect = grid.stats[player.id]
+            scene.append((name_text, (rect.left + text_pad, rect.top + text_pad)))
+            scene.append((bal_text, (rect.left + text_pad, rect.top + text_pad + bal_text.get_height())))
+
+        return scene
+
+    def frame_scene(self) -> List[Tuple[pg.Surface, Tuple[float, float]]]:
+        """`scene` for the frame being rendered, built once however many times it is asked for. Don't modify it."""
+        frame, scene = self.frame_scenes
+        if frame != self.ctx.frame:
+            with self.ctx.profiler.scope("table.scene"):
+                scene = self.scene()
+            self.frame_scenes = (self.ctx.frame, scene)
+        return scene
 
-                self.ctx.display.blit(bet_0_text, (left_zone.centerx - bet_0_text.get_width() // 2, bet_rect.centery))
-                self.ctx.display.blit(bet_1_text, (right_zone.centerx - bet_1_text.get_width(), bet_rect.centery))
-                self.ctx.display.blit(
-                    bet_2_text,
-                    (left_zone.centerx - bet_2_text.get_width() // 2, bet_rect.centery - bet_2_text.get_height()),
-                )
-                self.ctx.display.blit(
-                    bet_3_text,
-                    (right_zone.centerx - bet_3_text.get_width(), bet_rect.centery - bet_3_text.get_height()),
-                )
-                ####################################
-
-        if self.game_phase in [GamePhase.EndRound, GamePhase.Reset]:
-            for player in self.players:
-                id = player.id
-                if id == -1:
-                    # Dealer
-                    continue
-
-                ret_0 = player.hands[0].net_return
-                ret_1 = player.hands[1].net_return
-                ret_2 = player.hands[2].net_return
-                ret_3 = player.hands[3].net_return
-
-                ret_0_text = self.bet_font.render(
-                    "" if len(player.hands[0].cards) == 0 else f"{player.hands[0].get_word(True)} ${ret_0}",
-                    True,
-                    (255, 255, 255),
-                )
-                ret_1_text = self.bet_font.render(
-                    "" if len(player.hands[1].cards) == 0 else f"{player.hands[1].get_word(True)} ${ret_1}",
-                    True,
-                    (255, 255, 255),
-                )
-                ret_2_text = self.bet_font.render(
-                    "" if len(player.hands[2].cards) == 0 else f"{player.hands[2].get_word(True)} ${ret_2}",
-                    True,
-                    (255, 255, 255),
-                )
-                ret_3_text = self.bet_font.render(
-                    "" if len(player.hands[3].cards) == 0 else f"{player.hands[3].get_word(True)} ${ret_3}",
-                    True,
-                    (255, 255, 255),
-                )
+    def render(self) -> None:
+        profiler = self.ctx.profiler
+        scene = self.frame_scene()
+        with profiler.scope("table.blit"):
+            self.ctx.display.blit(self.background, (0, 0))
+            self.ctx.display.blits(scene, doreturn=False)
 
-                left_zone = self.ctx.zones[f"hand_bl_{id}"]
-                right_zone = self.ctx.zones[f"hand_br_{id}"]
-                bet_rect = self.ctx.zones[f"bet_{id}"]
+        # Whatever was drawn over this frame (overlays) is unknown, so the next partial redraw starts from scratch
+        self.last_scene = None
 
-                self.ctx.display.blit(ret_0_text, (left_zone.centerx - ret_0_text.get_width() // 2, bet_rect.centery))
-                self.ctx.display.blit(ret_1_text, (right_zone.centerx - ret_1_text.get_width(), bet_rect.centery))
-                self.ctx.display.blit(
-                    ret_2_text,
-                    (left_zone.centerx - ret_2_text.get_width() // 2, bet_rect.centery - ret_2_text.get_height()),
-                )
-                self.ctx.display.blit(
-                    ret_3_text,
-                    (right_zone.centerx - ret_3_text.get_width(), bet_rect.centery - ret_3_text.get_height()),
+    @override
+    def render_dirty(self, overlay: List[Tuple[pg.Surface, Tuple[float, float]]]) -> Optional[List[pg.Rect]]:
+        profiler = self.ctx.profiler
+        scene = self.frame_scene() + overlay
+        last_scene, self.last_scene = self.last_scene, scene
+
+        display = self.ctx.display
+        screen = display.get_rect()
+
+        # An opaque surface over the whole screen (the darkened snapshot behind the bet box) hides everything before it
+        background, visible = self.background, scene
+        for idx, (surface, pos) in enumerate(scene):
+            if pos == (0, 0) and surface.get_size() == screen.size and not surface.get_flags() & pg.SRCALPHA:
+                background, visible = surface, scene[idx + 1 :]
+
+        with profiler.scope("table.diff"):
+            if last_scene is None:
+                dirty = [screen]
+            else:
+                # Anything that appeared, disappeared, moved or changed surface since the last frame. Positions can be
+                # fractional, so the rects are grown by a pixel to cover however the blit rounded them.
+                changed = set(last_scene).symmetric_difference(scene)
+                dirty = [surface.get_rect(topleft=(int(x), int(y))).inflate(2, 2) for surface, (x, y) in changed]
+                if any(rect.contains(screen) for rect in dirty):
+                    dirty = [screen]
+
+        with profiler.scope("table.blit"):
+            if dirty == [screen]:
+                display.blit(background, (0, 0))
+                display.blits(visible, doreturn=False)
+                return dirty
+
+            for rect in dirty:
+                display.set_clip(rect)
+                display.blit(background, rect, rect)
+                display.blits(
+                    [
+                        (surface, pos)
+                        for surface, pos in visible
+                        if rect.colliderect((pos[0] - 1, pos[1] - 1, surface.get_width() + 2, surface.get_height() + 2))
+                    ],
+                    doreturn=False,
                 )
+            display.set_clip(None)
 
-        for player in self.players:
-            # Draw stats text (name and balance)
-            id = player.id
-            if id == -1:
-                # Dealer
-                continue
-
-            name = "Player" if id == 0 else f"Bot {id}"
-            name_text = self.stats_font.render(name, True, (255, 255, 255))
-            bal_text = self.stats_font.render(f"Bal: ${player.balance}", True, (255, 255, 255))
-            rect = self.ctx.zones[f"stat_{id}"]
-            self.ctx.display.blit(name_text, (rect.left + text_pad, rect.top + text_pad))
-            self.ctx.display.blit(bal_text, (rect.left + text_pad, rect.top + text_pad + bal_text.get_height()))
+        return dirty
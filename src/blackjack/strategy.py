@@ -0,0 +1,241 @@
+"""
+Basic strategy tables computed from exact expected values
+
+A `Strategy` is generated once per `Rules` and cached on disk, after which every decision is a single index into a
+1210 byte table. Generation removes the player's two cards and the dealer's upcard from the shoe for every starting
+hand, so the two-card decisions are composition exact; the dealer's draws are exact too (`blackjack.odds`), the
+player's later draws are taken with the probabilities of that shoe. Player decisions assume the dealer has already
+checked for blackjack, as `Table` does before anyone plays.
+
+House rules of this game that are modelled: a bust hand pushes if the dealer busts too (`engine.settle`), split hands
+may be hit again (aces included), a two card 21 on a split hand pays as a blackjack, and split hands are not resplit in
+the EV calculation (the game allows it, the chart ignores it).
+"""
+
+from __future__ import annotations
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from dataclasses import dataclass
+from functools import lru_cache
+import os
+
+from .odds import BUST, RANKS, best_total, dealer_outcomes, given_no_blackjack
+from .util import cache_dir
+
+HIT, STAND, DOUBLE, SPLIT = 0, 1, 2, 3
+"""Decision codes stored in the tables"""
+
+HARD, SOFT, PAIR, HARD_MULTI, SOFT_MULTI = 0, 1, 2, 3, 4
+"""
+Table kinds
+HARD/SOFT             | first two cards, indexed by total: HIT/STAND/DOUBLE
+PAIR                  | first two cards of the same rank, indexed by rank (ace = 1): SPLIT, or STAND for don't split
+HARD_MULTI/SOFT_MULTI | three or more cards, indexed by total: HIT/STAND
+"""
+
+N_TOTALS = 22
+N_UPCARDS = 11
+"""Upcards are indexed by rank, 1 (ace) to 10. Index 0 is unused."""
+
+_MAGIC = b"BJS3"
+
+
+@dataclass(frozen=True)
+class Rules:
+    n_decks: int = 6
+    hit_soft_17: bool = False
+    double_after_split: bool = True
+
+    @property
+    def key(self) -> str:
+        return f"{self.n_decks}d-{'h17' if self.hit_soft_17 else 's17'}-{'das' if self.double_after_split else 'ndas'}"
+
+    def shoe(self) -> List[int]:
+        """Count of every rank in a full shoe, indexed by rank (index 0 unused)"""
+        return [0] + [4 * self.n_decks] * 9 + [16 * self.n_decks]
+
+
+def index(kind: int, total: int, upcard: int) -> int:
+    return (kind * N_TOTALS + total) * N_UPCARDS + upcard
+
+
+class Strategy:
+    def __init__(self, rules: Rules, table: bytes) -> None:
+        self.rules = rules
+        self.table = table
+        """Decision codes laid out as [kind][total][upcard], see `index`"""
+
+    def decide(self, total: int, is_soft: bool, first_two: bool, upcard: int) -> int:
+        """HIT/STAND/DOUBLE for a hand that is not (or can't be) split. upcard | rank of the dealer upcard, ace = 1"""
+        if total > 21:
+            return STAND
+        if first_two:
+            return self.table[index(SOFT if is_soft else HARD, total, upcard)]
+        return self.table[index(SOFT_MULTI if is_soft else HARD_MULTI, total, upcard)]
+
+    def should_split(self, rank: int, upcard: int) -> bool:
+        return self.table[index(PAIR, rank, upcard)] == SPLIT
+
+    def chart(self) -> str:
+        """Human readable chart, for eyeballing against a published one"""
+        letters = "HSDP"
+        upcards = [*range(2, 11), 1]
+        lines = []
+        for name, kind, totals in [
+            ("Hard", HARD, range(5, 21)),
+            ("Soft", SOFT, range(13, 21)),
+            ("Pair", PAIR, [*range(2, 11), 1]),
+        ]:
+            lines.append(f"{name:>4} " + " ".join(f"{'A' if u == 1 else u:>2}" for u in upcards))
+            for total in totals:
+                row = [letters[self.table[index(kind, total, u)]] for u in upcards]
+                if kind == PAIR:
+                    row = ["P" if c == "P" else "-" for c in row]
+                label = ("A" if total == 1 else str(total)) if kind == PAIR else str(total)
+                lines.append(f"{label:>4} " + " ".join(f"{c:>2}" for c in row))
+        return "\n".join(lines)
+
+
+def _stand_ev(dealer: Sequence[float]) -> Callable[[int], float]:
+    def ev(total: int) -> float:
+        if total > 21:
+            # A bust only loses if the dealer doesn't bust as well
+            return dealer[BUST] - 1.0
+        win = dealer[BUST] + sum(dealer[t - 17] for t in range(17, 22) if t < total)
+        lose = sum(dealer[t - 17] for t in range(17, 22) if t > total)
+        return win - lose
+
+    return ev
+
+
+class _Evaluator:
+    """EVs of every decision for one shoe composition and dealer upcard"""
+
+    def __init__(self, counts: List[int], upcard: int, rules: Rules) -> None:
+        n = sum(counts)
+        self.p = [c / n for c in counts]
+        self.rules = rules
+        self.stand = _stand_ev(given_no_blackjack(dealer_outcomes(counts, upcard, rules.hit_soft_17)))
+        self.multi: Dict[Tuple[int, bool], Tuple[float, int]] = {}
+
+    def best_multi(self, hard: int, has_ace: bool) -> Tuple[float, int]:
+        """(EV, HIT/STAND) of the best play when only hitting and standing are allowed"""
+        if (hard, has_ace) in self.multi:
+            return self.multi[(hard, has_ace)]
+
+        total, _ = best_total(hard, has_ace)
+        if total > 21:
+            result = (self.stand(total), STAND)
+        else:
+            stand = self.stand(total)
+            hit = sum(self.p[r] * self.best_multi(hard + r, has_ace or r == 1)[0] for r in RANKS if self.p[r] > 0)
+            result = (hit, HIT) if hit > stand else (stand, STAND)
+
+        self.multi[(hard, has_ace)] = result
+        return result
+
+    def two_card(self, hard: int, has_ace: bool, can_double: bool = True) -> List[float]:
+        """EV of [HIT, STAND, DOUBLE] (DOUBLE is -inf if not allowed)"""
+        total, _ = best_total(hard, has_ace)
+        hit = sum(self.p[r] * self.best_multi(hard + r, has_ace or r == 1)[0] for r in RANKS if self.p[r] > 0)
+        double = float("-inf")
+        if can_double:
+            double = 2 * sum(self.p[r] * self.stand(best_total(hard + r, has_ace or r == 1)[0]) for r in RANKS)
+        return [hit, self.stand(total), double]
+
+    def split(self, rank: int) -> float:
+        """EV of splitting a pair of `rank` into two hands which each draw one card and are then played"""
+        ev = 0.0
+        for r in RANKS:
+            if self.p[r] == 0:
+                continue
+            hard, has_ace = rank + r, rank == 1 or r == 1
+            if best_total(hard, has_ace)[0] == 21:
+                # A two card 21 on a split hand pays as a blackjack in this game
+                ev += self.p[r] * 1.5
+            else:
+                ev += self.p[r] * max(self.two_card(hard, has_ace, self.rules.double_after_split))
+        return 2 * ev
+
+
+def generate(rules: Rules) -> Strategy:
+    table = bytearray(5 * N_TOTALS * N_UPCARDS)
+    shoe = rules.shoe()
+
+    for upcard in RANKS:
+        counts = shoe.copy()
+        counts[upcard] -= 1
+
+        evaluator = _Evaluator(counts, upcard, rules)
+        for total in range(N_TOTALS):
+            table[index(HARD_MULTI, total, upcard)] = evaluator.best_multi(total, False)[1]
+            table[index(SOFT_MULTI, total, upcard)] = evaluator.best_multi(total - 10, True)[1] if total >= 12 else HIT
+        # Totals a first two cards can't make fall back to the hit/stand decision
+        for total in range(N_TOTALS):
+            table[index(HARD, total, upcard)] = table[index(HARD_MULTI, total, upcard)]
+            table[index(SOFT, total, upcard)] = table[index(SOFT_MULTI, total, upcard)]
+
+        # Weighted EV of every action per (kind, total), summed over the two card combinations making that total
+        sums: Dict[Tuple[int, int], List[float]] = {}
+        for c1 in RANKS:
+            for c2 in range(c1, 11):
+                weight = counts[c1] * (counts[c2] - (c1 == c2)) * (1 if c1 == c2 else 2)
+                if weight <= 0:
+                    continue
+
+                combo = counts.copy()
+                combo[c1] -= 1
+                combo[c2] -= 1
+                exact = _Evaluator(combo, upcard, rules)
+
+                hard, has_ace = c1 + c2, c1 == 1
+                total, soft = best_total(hard, has_ace)
+                if total == 21:
+                    continue  # Blackjack, no decision
+
+                evs = exact.two_card(hard, has_ace)
+                acc = sums.setdefault((SOFT if soft else HARD, total), [0.0, 0.0, 0.0])
+                for i in range(3):
+                    acc[i] += weight * evs[i]
+
+                if c1 == c2:
+                    table[index(PAIR, c1, upcard)] = SPLIT if exact.split(c1) > max(evs) else STAND
+
+        for (kind, total), evs in sums.items():
+            table[index(kind, total, upcard)] = max(range(3), key=lambda i: evs[i])
+
+    return Strategy(rules, bytes(table))
+
+
+def cache_path(rules: Rules) -> str:
+    return os.path.join(cache_dir(), f"strategy-{rules.key}.bin")
+
+
+@lru_cache(maxsize=None)
+def load(rules: Rules = Rules()) -> Strategy:
+    """Reads the strategy for `rules` from the cache, generating and caching it first if needed"""
+    path = cache_path(rules)
+    size = 5 * N_TOTALS * N_UPCARDS
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        if data[: len(_MAGIC)] == _MAGIC and len(data) == len(_MAGIC) + size:
+            return Strategy(rules, data[len(_MAGIC) :])
+    except OSError:
+        pass
+
+    strategy = generate(rules)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(_MAGIC + strategy.table)
+        os.replace(tmp, path)
+    except OSError:
+        # A read-only home shouldn't stop the game, it just means generating again next time
+        pass
+    return strategy
+
+
+if __name__ == "__main__":
+    print(load().chart())
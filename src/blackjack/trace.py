@@ -0,0 +1,103 @@
+"""
+Session timelines in the Chrome Trace Event format, for chrome://tracing, https://ui.perfetto.dev or speedscope
+
+Enabled with BLACKJACK_TRACE=yes, which writes log/traces/trace-<time>.json. It records:
+
+- every frame and every `Profiler` scope in it
+- `GamePhase` and `TurnPhase` spans of the table
+- the flight of every `Movable`, from launch to arrival
+- asset loading
+
+Events are buffered, and written to the file at least every `FLUSH_INTERVAL` in the JSON array format. Its closing
+bracket is optional, so a trace cut short by a crash still opens, missing at most its last second.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, TextIO
+
+from time import perf_counter
+import atexit
+import json
+import os
+import time
+
+FLUSH_EVERY = 4096
+"""Most events buffered between writes. Writing shows up in the trace as its own `trace.flush` span."""
+FLUSH_INTERVAL = 1.0
+"""Longest an event stays buffered, in seconds"""
+
+TRACKS = {"frames": 1, "game phase": 2, "turn phase": 3, "movables": 4, "loading": 5}
+"""Thread ids the events are grouped by in a viewer"""
+
+
+def default_path() -> str:
+    return os.path.join("log", "traces", time.strftime("trace-%Y%m%d-%H%M%S.json"))
+
+
+class Tracer:
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or default_path()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.file: Optional[TextIO] = open(self.path, "w")
+        self.file.write("[\n")
+        self.first = True
+
+        self.origin = self.flushed = perf_counter()
+        self.pid = os.getpid()
+        self.events: List[Dict[str, Any]] = [
+            {"ph": "M", "name": "thread_name", "pid": self.pid, "tid": tid, "args": {"name": name}}
+            for name, tid in TRACKS.items()
+        ]
+        self.next_id = 0
+        atexit.register(self.close)
+
+    def us(self, seconds: float) -> float:
+        """`perf_counter` seconds -> trace microseconds"""
+        return round((seconds - self.origin) * 1e6, 1)
+
+    def complete(self, name: str, start: float, end: float, track: str = "frames", **args: Any) -> None:
+        """A span from `start` to `end`, both `perf_counter` seconds"""
+        event = {"ph": "X", "name": name, "ts": self.us(start), "dur": round((end - start) * 1e6, 1)}
+        self.emit(event, track, args)
+
+    def instant(self, name: str, track: str = "frames", **args: Any) -> None:
+        self.emit({"ph": "i", "name": name, "ts": self.us(perf_counter()), "s": "t"}, track, args)
+
+    def begin_async(self, name: str, track: str, **args: Any) -> int:
+        """Starts a span that can overlap others on its track, and returns the id to end it with"""
+        self.next_id += 1
+        event = {"ph": "b", "name": name, "cat": track, "id": self.next_id, "ts": self.us(perf_counter())}
+        self.emit(event, track, args)
+        return self.next_id
+
+    def end_async(self, name: str, track: str, id: int) -> None:
+        self.emit({"ph": "e", "name": name, "cat": track, "id": id, "ts": self.us(perf_counter())}, track, {})
+
+    def emit(self, event: Dict[str, Any], track: str, args: Dict[str, Any], may_flush: bool = True) -> None:
+        event["pid"], event["tid"] = self.pid, TRACKS[track]
+        if args:
+            event["args"] = args
+        self.events.append(event)
+        if may_flush and (len(self.events) >= FLUSH_EVERY or perf_counter() - self.flushed > FLUSH_INTERVAL):
+            self.flush()
+
+    def flush(self) -> None:
+        if self.file is None or not self.events:
+            return
+        start = perf_counter()
+        events, self.events = self.events, []
+        self.file.write(("" if self.first else ",\n") + ",\n".join(json.dumps(event) for event in events))
+        self.file.flush()
+        self.first = False
+        self.flushed = perf_counter()
+        # Kept for the next write, which mustn't be triggered by it
+        event = {"ph": "X", "name": "trace.flush", "ts": self.us(start), "dur": round((self.flushed - start) * 1e6, 1)}
+        self.emit(event, "frames", {"events": len(events)}, may_flush=False)
+
+    def close(self) -> None:
+        if self.file is None:
+            return
+        self.flush()
+        self.file.write("\n]\n")
+        self.file.close()
+        self.file = None
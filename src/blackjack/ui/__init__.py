@@ -1,4 +1,7 @@
 from .lib import UIState, UIObject
+from .dispatch import Dispatcher, HitIndex
 from .fade_overlay import FadeOverlay
 from .bet_box import BetBox
 from .turn_buttons import TurnButton
+from .text import TextCache
+from .hud import ProfilerHud
@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, List, Tuple
 
 if TYPE_CHECKING:
     from ..app import App
 
 from .lib import UIState, UIObject
+from .dispatch import Dispatcher
 from importlib import resources as impresources
 import pygame as pg
 
@@ -31,13 +32,16 @@ class BetBox(UIObject):
         self.sub_font = pg.font.Font(
             str(impresources.files("blackjack").joinpath("fonts/KozGoPro-Light.otf")), self.rect.height // 4
         )
-        self.text = self.bet_font.render("", True, (255, 255, 255))
+        self.text = ctx.text_cache.render(self.bet_font, "", (255, 255, 255))
 
-        self.min_bet_text = self.sub_font.render(f"Min bet: {self.min_bet}", True, (200, 200, 200))
-        self.max_bet_text = self.sub_font.render(f"Max bet: {self.max_bet}", True, (200, 200, 200))
+        self.min_bet_text = ctx.text_cache.render(self.sub_font, f"Min bet: {self.min_bet}", (200, 200, 200))
+        self.max_bet_text = ctx.text_cache.render(self.sub_font, f"Max bet: {self.max_bet}", (200, 200, 200))
 
         super().__init__(ctx, target_state)
 
+    def subscribe(self, dispatcher: Dispatcher) -> None:
+        dispatcher.subscribe(pg.KEYDOWN, self.handle_key_update, self.target_state)
+
     def handle_key_update(self, event: pg.event.Event) -> None:
         if (key := event.key) in (codes := [pg.K_1, pg.K_2, pg.K_3, pg.K_4, pg.K_5, pg.K_6, pg.K_7, pg.K_8, pg.K_9]):
             self.bet_val += str(codes.index(key) + 1)
@@ -52,11 +56,10 @@ class BetBox(UIObject):
         if event.key == pg.K_RETURN:
             if len(self.bet_val) > 0:
                 if self.min_bet <= int(self.bet_val) <= self.max_bet:
-                    from blackjack.state.table import Table, Player
+                    from blackjack.state.table import Table
 
                     assert type(self.ctx.state) == Table
-                    player = self.ctx.state.filter_players(lambda player: type(player) == Player)[0]
-                    player.round_bets[0] = int(self.bet_val)
+                    self.ctx.state.player.round_bets[0] = int(self.bet_val)
                     self.bet_val = ""
 
         # Max bet check
@@ -76,13 +79,18 @@ class BetBox(UIObject):
             return (0, 255, 0)
 
     def update(self) -> None:
-        self.text = self.bet_font.render(" " + self.bet_val, True, self.get_bet_text_colour())
+        self.text = self.ctx.text_cache.render(self.bet_font, " " + self.bet_val, self.get_bet_text_colour())
+
+    def blits(self) -> List[Tuple[pg.Surface, Tuple[float, float]]]:
+        return [
+            (self.inp_surface, self.rect.topleft),
+            (self.text, (self.rect.x, self.rect.y + self.rect.height * 0.25)),
+            (self.min_bet_text, (self.rect.x, self.rect.top - self.min_bet_text.get_height())),
+            (
+                self.max_bet_text,
+                (self.rect.right - self.max_bet_text.get_width(), self.rect.top - self.max_bet_text.get_height()),
+            ),
+        ]
 
     def render(self) -> None:
-        self.ctx.display.blit(self.inp_surface, self.rect)
-        self.ctx.display.blit(self.text, (self.rect.x, self.rect.y + self.rect.height * 0.25))
-        self.ctx.display.blit(self.min_bet_text, (self.rect.x, self.rect.top - self.min_bet_text.get_height()))
-        self.ctx.display.blit(
-            self.max_bet_text,
-            (self.rect.right - self.max_bet_text.get_width(), self.rect.top - self.max_bet_text.get_height()),
-        )
+        self.ctx.display.blits(self.blits(), doreturn=False)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .lib import UIObject
+
+from .lib import UIState
+import pygame as pg
+
+Handler = Callable[[pg.event.Event], None]
+
+HIT_CELL_SIZE = 128
+"""Side of a `HitIndex` cell in pixels, around the size of a turn button"""
+
+
+class HitIndex:
+    """
+    Circular hit areas bucketed into a uniform grid of square cells. A point is only tested against the areas
+    overlapping its cell, with squared distances, so the cost of a hit test doesn't grow with the number of widgets.
+    """
+
+    def __init__(self, cell_size: int = HIT_CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Tuple[UIObject, float, float, float]]] = {}
+        """(column, row) -> [(target, centre x, centre y, radius squared)]"""
+
+    def add(self, target: UIObject, center: Tuple[float, float], radius: float) -> None:
+        cx, cy = center
+        size = self.cell_size
+        entry = (target, cx, cy, radius * radius)
+        for col in range(int((cx - radius) // size), int((cx + radius) // size) + 1):
+            for row in range(int((cy - radius) // size), int((cy + radius) // size) + 1):
+                self.cells.setdefault((col, row), []).append(entry)
+
+    def hit(self, pos: Tuple[float, float]) -> Optional[UIObject]:
+        """The first area added that contains `pos`, if any"""
+        x, y = pos
+        for target, cx, cy, r2 in self.cells.get((int(x // self.cell_size), int(y // self.cell_size)), ()):
+            dx, dy = x - cx, y - cy
+            if dx * dx + dy * dy <= r2:
+                return target
+        return None
+
+
+class Dispatcher:
+    """
+    Routes every event to the handlers subscribed to its type, in the current `UIState` or in any state, with a single
+    dictionary lookup each. Mouse motion and clicks in a state with hit areas only reach the widget under the cursor:
+    it's told when the cursor enters or leaves it, and gets the clicks made on it.
+    """
+
+    def __init__(self) -> None:
+        self.handlers: Dict[Tuple[Optional[UIState], int], List[Handler]] = {}
+        self.hit_indexes: Dict[UIState, HitIndex] = {}
+        self.hovered: Optional[UIObject] = None
+
+    def subscribe(self, event_type: int, handler: Handler, ui_state: Optional[UIState] = None) -> None:
+        """Calls `handler` with every event of `event_type` while in `ui_state`, or in any state if None"""
+        self.handlers.setdefault((ui_state, event_type), []).append(handler)
+
+    def add_hit_area(self, target: UIObject, center: Tuple[float, float], radius: float) -> None:
+        """Makes the circle a hit area of `target`, active while in its `target_state`"""
+        ui_state = target.target_state
+        if ui_state not in self.hit_indexes:
+            index = self.hit_indexes[ui_state] = HitIndex()
+            self.subscribe(pg.MOUSEMOTION, lambda event: self.hover(index.hit(event.pos)), ui_state)
+            self.subscribe(pg.MOUSEBUTTONDOWN, lambda event: self.click(index.hit(event.pos), event), ui_state)
+        self.hit_indexes[ui_state].add(target, center, radius)
+
+    def hover(self, target: Optional[UIObject]) -> None:
+        if target is self.hovered:
+            return
+        if self.hovered is not None:
+            self.hovered.handle_mouse_leave()
+        if target is not None:
+            target.handle_mouse_enter()
+        self.hovered = target
+
+    def click(self, target: Optional[UIObject], event: pg.event.Event) -> None:
+        self.hover(target)
+        if target is not None:
+            target.handle_mouse_click(event)
+
+    def dispatch(self, ui_state: UIState, event: pg.event.Event) -> None:
+        for handler in self.handlers.get((None, event.type), ()):
+            handler(event)
+        for handler in self.handlers.get((ui_state, event.type), ()):
+            handler(event)
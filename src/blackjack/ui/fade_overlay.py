@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from ..app import App
@@ -9,16 +9,48 @@ import pygame as pg
 
 
 class FadeOverlay(UIObject):
+    """
+    Darkens the table behind the bet box. Rather than blending the whole screen every frame, the darkened table is
+    kept as an opaque snapshot, taken again only when the table's scene changes (a card still landing).
+    """
+
     def __init__(self, ctx: App, target_state: UIState) -> None:
         self.rect = pg.rect.Rect(0, 0, ctx.display.get_width(), ctx.display.get_height())
         s = pg.Surface((self.rect.width, self.rect.height), pg.SRCALPHA)
         s.fill((0, 0, 0, 200))
         self.surface = s
 
+        # Two buffers taken in turns, so that a new snapshot is a different surface to the scene diff
+        self.buffers = (pg.Surface(self.rect.size).convert(), pg.Surface(self.rect.size).convert())
+        self.snapshot: Optional[pg.Surface] = None
+        self.below: Optional[List[Tuple[pg.Surface, Tuple[float, float]]]] = None
+        """The table scene `snapshot` was taken of"""
+
         super().__init__(ctx, target_state)
 
+    def blits(self) -> Optional[List[Tuple[pg.Surface, Tuple[float, float]]]]:
+        from blackjack.state.table import Table
+
+        table = self.ctx.state
+        if type(table) != Table:
+            return None
+
+        below = table.frame_scene()
+        if self.snapshot is None or below != self.below:
+            snapshot = self.buffers[self.snapshot is self.buffers[0]]
+            snapshot.blit(table.background, (0, 0))
+            snapshot.blits(below, doreturn=False)
+            snapshot.blit(self.surface, (0, 0))
+            self.snapshot, self.below = snapshot, below
+
+        return [(self.snapshot, (0, 0))]
+
     def update(self) -> None:
         pass
 
     def render(self) -> None:
+        """
+        The full redraw fallback (BLACKJACK_DIRTY_RECTS=no): blends the fade over the whole screen every frame, as the
+        reference the snapshot of `blits` is drawn to match
+        """
         self.ctx.display.blit(self.surface, self.rect)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, List, Tuple
+
+if TYPE_CHECKING:
+    from ..app import App
+
+from importlib import resources as impresources
+import pygame as pg
+
+HUD_REFRESH_MS = 250
+"""How often the HUD's numbers are redrawn, slow enough to read and to keep it out of the profile"""
+
+
+class ProfilerHud:
+    """
+    FPS, p50/p99 frame times and the slowest scopes of `App.profiler`, in the top left corner of every state.
+    Toggled with F3 along with the profiler itself.
+    """
+
+    def __init__(self, ctx: App) -> None:
+        self.ctx = ctx
+        self.font = pg.font.Font(
+            str(impresources.files("blackjack").joinpath("fonts/KozGoPro-Light.otf")), ctx.display.get_height() // 60
+        )
+        self.panel = pg.Surface((1, 1), pg.SRCALPHA)
+        self.drawn_at = -HUD_REFRESH_MS
+
+    def build_panel(self) -> pg.Surface:
+        summary = self.ctx.profiler.summary()
+        lines = [
+            f"{summary['fps']:.1f} fps   p50 {summary['p50_ms']:.2f} ms   p99 {summary['p99_ms']:.2f} ms",
+            *(f"{name}  {ms:.3f} ms" for name, ms in summary["scopes"]),
+        ]
+        texts = [self.font.render(line, True, (255, 255, 255)) for line in lines]
+
+        pad = self.font.get_height() // 3
+        panel = pg.Surface(
+            (max(t.get_width() for t in texts) + 2 * pad, sum(t.get_height() for t in texts) + 2 * pad), pg.SRCALPHA
+        )
+        panel.fill((0, 0, 0, 180))
+        y = pad
+        for text in texts:
+            panel.blit(text, (pad, y))
+            y += text.get_height()
+        return panel
+
+    def blits(self) -> List[Tuple[pg.Surface, Tuple[float, float]]]:
+        if not self.ctx.profiler.enabled:
+            return []
+
+        now = pg.time.get_ticks()
+        if now - self.drawn_at >= HUD_REFRESH_MS:
+            self.panel = self.build_panel()
+            self.drawn_at = now
+        return [(self.panel, (10, 10))]
+
+    def render(self) -> None:
+        self.ctx.display.blits(self.blits(), doreturn=False)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from ..app import App
+    from .dispatch import Dispatcher
 
 from abc import ABC, abstractmethod
 from enum import Enum, auto
@@ -22,6 +23,25 @@ class UIObject(ABC):
         self.ctx = ctx
         self.target_state = target_state
 
+    def subscribe(self, dispatcher: Dispatcher) -> None:
+        """Registers the handlers and hit areas of the object, called once when it's added to the app"""
+
+    def handle_mouse_enter(self) -> None:
+        """"""
+
+    def handle_mouse_leave(self) -> None:
+        """"""
+
+    def handle_mouse_click(self, event: pg.event.Event) -> None:
+        """"""
+
+    def blits(self) -> Optional[List[Tuple[pg.Surface, Tuple[float, float]]]]:
+        """
+        What `render` draws as a list of blits, which the state can redraw partially with its own scene (see
+        `State.render_dirty`), or None if the object can only be drawn with `render` over a full frame
+        """
+        return None
+
     @abstractmethod
     def update(self) -> None:
         """"""
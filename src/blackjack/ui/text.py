@@ -0,0 +1,46 @@
+from __future__ import annotations
+from typing import Optional, Tuple
+
+from collections import OrderedDict
+import pygame as pg
+
+from ..profiler import Profiler
+
+Colour = Tuple[int, int, int]
+
+
+class TextCache:
+    """
+    Rendered text surfaces keyed by (font, string, colour), evicting the least recently used past `maxsize`.
+    Shared through `App.text_cache` so that a label is only rasterized when its string or colour changes.
+    """
+
+    def __init__(self, maxsize: int = 512, profiler: Optional[Profiler] = None) -> None:
+        self.maxsize = maxsize
+        self.profiler = profiler or Profiler()
+        """Times every rasterization as `text.render`"""
+        self.surfaces: OrderedDict[Tuple[pg.font.Font, str, Colour], pg.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pg.font.Font, text: str, colour: Colour) -> pg.Surface:
+        key = (font, text, colour)
+        if (surface := self.surfaces.get(key)) is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        with self.profiler.scope("text.render"):
+            surface = self.surfaces[key] = font.render(text, True, colour)
+        if len(self.surfaces) > self.maxsize:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
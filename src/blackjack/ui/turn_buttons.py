@@ -1,46 +1,38 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 if TYPE_CHECKING:
     from ..app import App
 
-from enum import Enum, auto
 from .lib import UIState, UIObject
-from ..util import in_radial_distance
+from .dispatch import Dispatcher
+from ..engine import ActionType
 import pygame as pg
-from loguru import logger
 from importlib import resources as impresources
 
 
-class ActionType(Enum):
-    Hit = auto()
-    Stand = auto()
-    Split = auto()
-    Double = auto()
-
-    @staticmethod
-    def get_colour(action_type: ActionType) -> Tuple[int, int, int]:
-        match action_type:
-            case ActionType.Hit:
-                return (50, 193, 44)  # 32c12c
-            case ActionType.Stand:
-                return (212, 12, 96)  # d40c60
-            case ActionType.Split:
-                return (82, 110, 255)  # 526eff
-            case ActionType.Double:
-                return (255, 207, 72)  # ffcf48
-
-    @staticmethod
-    def get_left_offset(action_type: ActionType, button_radius: int) -> int:
-        match action_type:
-            case ActionType.Hit:
-                return button_radius * 10
-            case ActionType.Stand:
-                return button_radius * 8
-            case ActionType.Split:
-                return button_radius * 6
-            case ActionType.Double:
-                return button_radius * 4
+def get_action_colour(action_type: ActionType) -> Tuple[int, int, int]:
+    match action_type:
+        case ActionType.Hit:
+            return (50, 193, 44)  # 32c12c
+        case ActionType.Stand:
+            return (212, 12, 96)  # d40c60
+        case ActionType.Split:
+            return (82, 110, 255)  # 526eff
+        case ActionType.Double:
+            return (255, 207, 72)  # ffcf48
+
+
+def get_action_left_offset(action_type: ActionType, button_radius: int) -> int:
+    match action_type:
+        case ActionType.Hit:
+            return button_radius * 10
+        case ActionType.Stand:
+            return button_radius * 8
+        case ActionType.Split:
+            return button_radius * 6
+        case ActionType.Double:
+            return button_radius * 4
 
 
 class TurnButton(UIObject):
@@ -57,8 +49,7 @@ class TurnButton(UIObject):
         self.rect.center = ctx.display.get_rect().center
         self.rect.centery -= ctx.display.get_rect().height // 5
 
-        self.colour = ActionType.get_colour(action_type)
-        self.rect.x -= ActionType.get_left_offset(action_type, self.radius)
+        self.rect.x -= get_action_left_offset(action_type, self.radius)
 
         self.text_font = pg.font.Font(
             str(impresources.files("blackjack").joinpath("fonts/KozGoPro-Bold.otf")), self.rect.height // 5
@@ -66,17 +57,43 @@ class TurnButton(UIObject):
 
         super().__init__(ctx, target_state)
 
-    def handle_mouse_hover(self, event: pg.event.Event) -> None:
-        if not self.is_disabled:
-            self.colour = (
-                (255, 255, 255)
-                if in_radial_distance(self.rect.center, self.radius, event.pos)
-                else ActionType.get_colour(self.action_type)
-            )
+        self.faces: Dict[str, pg.Surface] = {
+            "normal": self.build_face(get_action_colour(action_type)),
+            "hovered": self.build_face((255, 255, 255)),
+            "disabled": self.build_face((100, 100, 100)),
+        }
+        """Every look of the button, rasterized once so that drawing it is a single blit"""
+
+    def build_face(self, colour: Tuple[int, int, int]) -> pg.Surface:
+        face = pg.Surface(self.rect.size, pg.SRCALPHA)
+        face.fill((0, 0, 0, 0))
+        centre = (self.rect.width // 2, self.rect.height // 2)
+        pg.draw.circle(face, colour, centre, self.rect.width / 2.25)
+
+        text = self.ctx.text_cache.render(self.text_font, self.action_type.name, (0, 0, 0))
+        face.blit(text, (centre[0] - text.get_width() // 2, centre[1] - text.get_height() // 2))
+        return face.convert_alpha()
+
+    @property
+    def face(self) -> pg.Surface:
+        if self.is_disabled:
+            return self.faces["disabled"]
+        if self.is_hovered:
+            return self.faces["hovered"]
+        return self.faces["normal"]
+
+    def subscribe(self, dispatcher: Dispatcher) -> None:
+        # The -5 is an app specific correction constant and has no mathematical significance
+        dispatcher.add_hit_area(self, self.rect.center, self.radius - 5)
+
+    def handle_mouse_enter(self) -> None:
+        self.is_hovered = True
+
+    def handle_mouse_leave(self) -> None:
+        self.is_hovered = False
 
     def handle_mouse_click(self, event: pg.event.Event) -> None:
-        if self.colour == (255, 255, 255):
-            # Is hovered
+        if not self.is_disabled:
             self.is_clicked = True
 
     def update(self) -> None:
@@ -84,11 +101,8 @@ class TurnButton(UIObject):
 
         assert type(self.ctx.state) == Table
 
-        if self.is_disabled:
-            self.colour = (100, 100, 100)
-
         player_id, hand_idx = self.ctx.state.current_turn
-        player = self.ctx.state.filter_players(lambda player: player.id == player_id)[0]
+        player = self.ctx.state.player_by_id[player_id]
         target_hand = player.hands[hand_idx]
 
         # Enable all buttons after Movables have finished moving, but...
@@ -100,12 +114,11 @@ class TurnButton(UIObject):
             elif self.action_type == ActionType.Double:
                 self.is_disabled = not target_hand.allowed_to_double()
 
+    def blits(self) -> List[Tuple[pg.Surface, Tuple[float, float]]]:
+        return [(self.face, self.rect.topleft)]
+
     def render(self) -> None:
-        pg.draw.circle(self.ctx.display, self.colour, self.rect.center, self.rect.width / 2.25)
-        text = self.text_font.render(self.action_type.name, True, (0, 0, 0))
-        self.ctx.display.blit(
-            text, (self.rect.centerx - text.get_width() // 2, self.rect.centery - text.get_height() // 2)
-        )
+        self.ctx.display.blit(self.face, self.rect)
 
     def onclick(self) -> None:
         pass
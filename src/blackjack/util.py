@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Generic, List, Tuple, TypeVar
 import math
+import os
 
 T = TypeVar("T", covariant=True)
 E = TypeVar("E", covariant=True)
@@ -21,6 +22,14 @@ class Err(Generic[E]):
 Result = Ok[T] | Err[E]
 
 
+def cache_dir() -> str:
+    """Where generated data (strategy tables...) is cached. Overridable with BLACKJACK_CACHE_DIR"""
+    if (override := os.environ.get("BLACKJACK_CACHE_DIR")) is not None:
+        return override
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "blackjack")
+
+
 def get_evenly_spaced_points(w: float, x: float, s: int) -> List[float]:
     """
     Where you want to evenly space s intervals of length x on an interval of length w
@@ -77,6 +86,8 @@ class Vec2:
         return math.sqrt(math.pow(self.x, 2) + math.pow(self.y, 2))
 
     def unit(self) -> Vec2:
-        """Returns the unit vector"""
+        """Returns the unit vector, or the zero vector for the zero vector"""
         modulus = math.sqrt(math.pow(self.x, 2) + math.pow(self.y, 2))
+        if modulus == 0:
+            return Vec2(0, 0)
         return Vec2(self.x / modulus, self.y / modulus)
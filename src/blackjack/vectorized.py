@@ -0,0 +1,317 @@
+"""
+NumPy batch backend for the simulator: plays one round on thousands of independent tables at once.
+
+Requires numpy (`pip install blackjack-amiyuki[sim]`). The rules mirror `blackjack.engine.play_round` card for card:
+given the same shoe order and bets, every table ends a round with exactly the same hands, results and returns as the
+object engine would.
+
+Cards are int8 values: 2-10 for number and face cards, 1 for an ace. A hand is tracked as counters only (hard total
+with aces counted as 1, ace count, number of cards, first two card values), so the soft total is one vector op.
+"""
+
+from __future__ import annotations
+from typing import Optional
+
+import hashlib
+
+import numpy as np
+
+from .sim import SimStats
+from .strategy import (
+    DOUBLE,
+    HARD,
+    HARD_MULTI,
+    HIT,
+    N_TOTALS,
+    N_UPCARDS,
+    PAIR,
+    SOFT,
+    SOFT_MULTI,
+    SPLIT,
+    Strategy,
+    load as load_strategy,
+)
+
+HANDS = 4
+"""Hands per seat, as `Player.hands`"""
+ACE = 1
+
+_ONE_DECK = np.array([v for v in [2, 3, 4, 5, 6, 7, 8, 9, 10, ACE, 10, 10, 10] for _ in range(4)], dtype=np.int8)
+
+
+def soft_totals(totals: np.ndarray, aces: np.ndarray) -> np.ndarray:
+    """The value `Hand.calculate_value` would return: one ace counts 11 if that does not bust the hand"""
+    return np.where((aces > 0) & (totals + 10 <= 21), totals + 10, totals)
+
+
+def numpy_seed(seed: Optional[int | str]) -> Optional[int]:
+    """Maps the string seeds of `sim.worker_seed` onto integers for `np.random.default_rng`"""
+    if seed is None or isinstance(seed, int):
+        return seed
+    return int.from_bytes(hashlib.sha512(seed.encode()).digest()[:16], "big")
+
+
+class BatchShoe:
+    def __init__(self, n_tables: int, n_decks: int, rng: np.random.Generator) -> None:
+        self.rng = rng
+        self.cards = rng.permuted(np.tile(np.tile(_ONE_DECK, n_decks), (n_tables, 1)), axis=1)
+        """(n_tables, 52 * n_decks) int8, dealt from index 0 upwards"""
+        self.pos = np.zeros(n_tables, dtype=np.intp)
+
+    def draw(self, mask: np.ndarray) -> np.ndarray:
+        """Pops the next card of every table in `mask`, reshuffling shoes that have run out. 0 for other tables."""
+        if (exhausted := mask & (self.pos >= self.cards.shape[1])).any():
+            self.cards[exhausted] = self.rng.permuted(self.cards[exhausted], axis=1)
+            self.pos[exhausted] = 0
+
+        rows = np.flatnonzero(mask)
+        out = np.zeros(len(mask), dtype=np.int8)
+        out[rows] = self.cards[rows, self.pos[rows]]
+        self.pos[rows] += 1
+        return out
+
+
+class BatchTable:
+    """
+    Per-hand state arrays are shaped (n_tables, n_bots, HANDS). Bots are indexed by seat like `play_round`'s `bots`.
+    """
+
+    def __init__(self, n_tables: int, n_bots: int, shoe: BatchShoe, strategy: Optional[Strategy] = None) -> None:
+        self.n_tables = n_tables
+        self.n_bots = n_bots
+        self.shoe = shoe
+        strategy = strategy if strategy is not None else load_strategy()
+        self.strategy_table = np.frombuffer(strategy.table, dtype=np.uint8).reshape(-1, N_TOTALS, N_UPCARDS)
+        """[kind][total][upcard] decision codes of `Bot.strategy`"""
+
+        shape = (n_tables, n_bots, HANDS)
+        self.totals = np.zeros(shape, dtype=np.int16)
+        self.aces = np.zeros(shape, dtype=np.int8)
+        self.n_cards = np.zeros(shape, dtype=np.int8)
+        self.first = np.zeros(shape, dtype=np.int8)
+        self.second = np.zeros(shape, dtype=np.int8)
+        self.is_doubled = np.zeros(shape, dtype=bool)
+        self.is_done = np.zeros(shape, dtype=bool)
+        self.is_bust = np.zeros(shape, dtype=bool)
+        self.round_bets = np.zeros(shape, dtype=np.int64)
+        self.result = np.zeros(shape, dtype=np.int8)
+        self.net_return = np.zeros(shape, dtype=np.int64)
+        self.balance = np.full((n_tables, n_bots), 100000, dtype=np.int64)
+
+        self.dealer_totals = np.zeros(n_tables, dtype=np.int16)
+        self.dealer_aces = np.zeros(n_tables, dtype=np.int8)
+        self.dealer_n_cards = np.zeros(n_tables, dtype=np.int8)
+        self.dealer_upcard = np.zeros(n_tables, dtype=np.int8)
+
+    def _reset(self) -> None:
+        for arr in (self.totals, self.aces, self.n_cards, self.first, self.second, self.round_bets):
+            arr[:] = 0
+        for arr in (self.is_doubled, self.is_done, self.is_bust):
+            arr[:] = False
+        self.result[:] = 0
+        self.net_return[:] = 0
+        self.dealer_totals[:] = 0
+        self.dealer_aces[:] = 0
+        self.dealer_n_cards[:] = 0
+
+    def _add_card(self, mask: np.ndarray, seat: int, hand: np.ndarray | int) -> None:
+        """Deals one card onto hand[t] of `seat` for every table t in `mask`"""
+        card = self.shoe.draw(mask)
+        rows = np.flatnonzero(mask)
+        cols = hand[rows] if isinstance(hand, np.ndarray) else hand
+        card = card[rows]
+
+        n = self.n_cards[rows, seat, cols]
+        self.first[rows, seat, cols] = np.where(n == 0, card, self.first[rows, seat, cols])
+        self.second[rows, seat, cols] = np.where(n == 1, card, self.second[rows, seat, cols])
+        self.totals[rows, seat, cols] += card
+        self.aces[rows, seat, cols] += card == ACE
+        self.n_cards[rows, seat, cols] += 1
+
+    def _add_dealer_card(self, mask: np.ndarray) -> None:
+        card = self.shoe.draw(mask)
+        self.dealer_totals += np.where(mask, card, 0)
+        self.dealer_aces += mask & (card == ACE)
+        self.dealer_n_cards += mask
+
+    def _play_hand(self, active: np.ndarray, seat: int, h: int) -> None:
+        """`Bot.decide` and the action bookkeeping, repeated until every table in `active` stands on this hand"""
+        pending = active.copy()
+        while pending.any():
+            totals, aces = self.totals[:, seat, h], self.aces[:, seat, h]
+            n_cards = self.n_cards[:, seat, h]
+            value = soft_totals(totals, aces)
+            empty_hand = n_cards == 0
+
+            bust = pending & ~empty_hand & (value > 21)
+            self.is_bust[bust, seat, h] = True
+            self.is_done[bust, seat, h] = True
+
+            deciding = pending & ~empty_hand & ~bust & ~self.is_done[:, seat, h]
+            two_cards = n_cards == 2
+            has_free = (self.n_cards[:, seat, :] == 0).any(axis=1)
+            first = self.first[:, seat, h]
+
+            split = (
+                deciding
+                & two_cards
+                & (first == self.second[:, seat, h])
+                & has_free
+                & (self.strategy_table[PAIR, first, self.dealer_upcard] == SPLIT)
+            )
+            soft = (aces > 0) & (totals <= 11)
+            kind = np.where(
+                two_cards,
+                np.where(soft, SOFT, HARD),
+                np.where(soft, SOFT_MULTI, HARD_MULTI),
+            )
+            decision = self.strategy_table[kind, np.minimum(value, 21), self.dealer_upcard]
+
+            double = deciding & ~split & (decision == DOUBLE)
+            hit = deciding & ~split & (decision == HIT)
+            stand = deciding & ~split & ~double & ~hit
+            self.is_done[stand, seat, h] = True
+
+            if hit.any():
+                self._add_card(hit, seat, h)
+
+            if double.any():
+                self.is_doubled[double, seat, h] = True
+                self.is_done[double, seat, h] = True
+                self.balance[double, seat] -= self.round_bets[double, seat, h]
+                self.round_bets[double, seat, h] *= 2
+                self._add_card(double, seat, h)
+
+            if split.any():
+                free = np.argmax(self.n_cards[:, seat, :] == 0, axis=1)
+                rows = np.flatnonzero(split)
+                free_rows = free[rows]
+                pair_card = first[rows]
+
+                for cols in (h, free_rows):
+                    self.n_cards[rows, seat, cols] = 1
+                    self.totals[rows, seat, cols] = pair_card
+                    self.aces[rows, seat, cols] = pair_card == ACE
+                    self.first[rows, seat, cols] = pair_card
+                    self.second[rows, seat, cols] = 0
+
+                self.round_bets[rows, seat, free_rows] = self.round_bets[rows, seat, 0]
+                self.balance[rows, seat] -= self.round_bets[rows, seat, 0]
+
+                self._add_card(split, seat, h)
+                self._add_card(split, seat, free)
+
+            pending = hit | double | split
+
+    def play_round(self, bets: np.ndarray) -> None:
+        """
+        Plays one round on every table, the same way `engine.play_round` does
+
+        bets | (n_tables, n_bots) initial bet of every bot
+        """
+        self._reset()
+        everyone = np.ones(self.n_tables, dtype=bool)
+
+        # Burn card
+        self.shoe.draw(everyone)
+
+        self.round_bets[:, :, 0] = bets
+        self.balance -= bets
+
+        for _ in range(2):
+            self._add_dealer_card(everyone)
+            for seat in range(self.n_bots):
+                self._add_card(everyone, seat, 0)
+            if self.dealer_n_cards[0] == 1:
+                self.dealer_upcard[:] = self.dealer_totals
+
+        dealer_bj = (self.dealer_n_cards == 2) & (soft_totals(self.dealer_totals, self.dealer_aces) == 21)
+        active = ~dealer_bj
+        for seat in reversed(range(self.n_bots)):
+            for h in range(HANDS):
+                self._play_hand(active, seat, h)
+
+        while (hitting := soft_totals(self.dealer_totals, self.dealer_aces) < 17).any():
+            self._add_dealer_card(hitting)
+
+        self._settle(dealer_bj)
+
+    def _settle(self, dealer_bj: np.ndarray) -> None:
+        """`engine.settle` for every non-empty hand, then pays the net returns into the balances"""
+        dealer_value = soft_totals(self.dealer_totals, self.dealer_aces)[:, None, None]
+        dealer_bust = dealer_value > 21
+        dealer_bj = dealer_bj[:, None, None]
+
+        value = soft_totals(self.totals, self.aces)
+        self.is_bust |= value > 21
+        bust = self.is_bust
+        bj = (self.n_cards == 2) & (value == 21)
+        bet = self.round_bets
+
+        # Evaluated from the last rule to the first, so that earlier rules take precedence as in `engine.settle`
+        result = np.where(dealer_value < value, 1, np.where(dealer_value == value, 2, 0))
+        result = np.where(dealer_bust & ~bust, 1, result)
+        result = np.where(~dealer_bust & bust, 0, result)
+        result = np.where(dealer_bust & bust, 2, result)
+        result = np.where(~dealer_bj & bj, 3, result)
+        result = np.where(dealer_bj & ~bj, 0, result)
+        result = np.where(dealer_bj & bj, 2, result)
+
+        net_return = np.select([result == 1, result == 2, result == 3], [2 * bet, bet, (5 * bet + 1) // 2], 0)
+        # 3 only marks a blackjack payout (ceil(2.5 * bet)), it is a win
+        result = np.where(result == 3, 1, result)
+
+        dealt = self.n_cards > 0
+        self.result[:] = np.where(dealt, result, 0)
+        self.net_return[:] = np.where(dealt, net_return, 0)
+        self.balance += self.net_return.sum(axis=2)
+
+    def record(self, stats: SimStats, tables: int) -> None:
+        """Adds the settled hands of the first `tables` tables to `stats`"""
+        dealt = self.n_cards[:tables] > 0
+        result = self.result[:tables]
+
+        stats.rounds += tables
+        stats.hands += int(dealt.sum())
+        stats.wins += int((dealt & (result == 1)).sum())
+        stats.draws += int((dealt & (result == 2)).sum())
+        stats.losses += int((dealt & (result == 0)).sum())
+        stats.wagered += int(self.round_bets[:tables][dealt].sum())
+        stats.returned += int(self.net_return[:tables].sum())
+
+
+def simulate_vectorized(
+    rounds: int,
+    n_bots: int = 4,
+    n_decks: int = 6,
+    seed: Optional[int | str] = None,
+    sample_every: int = 1000,
+    n_tables: int = 4096,
+) -> SimStats:
+    """
+    Plays `rounds` rounds spread over `n_tables` independent tables (fewer if there are not that many rounds).
+    Every table contributes one balance trajectory, sampled every `sample_every` of its own rounds.
+    """
+    rng = np.random.default_rng(numpy_seed(seed))
+    n_tables = max(1, min(n_tables, rounds))
+
+    table = BatchTable(n_tables, n_bots, BatchShoe(n_tables, n_decks, rng))
+    stats = SimStats()
+    trajectories = [[tuple(int(b) for b in row)] for row in table.balance]
+
+    step = 0
+    while stats.rounds < rounds:
+        tables = min(n_tables, rounds - stats.rounds)
+        # The last batch may need fewer rounds than there are tables: the others play it too, but it is rolled back
+        unrecorded = table.balance[tables:].copy()
+        table.play_round(rng.integers(100, 5000 + 1, size=(n_tables, n_bots)))
+        table.record(stats, tables)
+        table.balance[tables:] = unrecorded
+
+        step += 1
+        if step % sample_every == 0:
+            for trajectory, row in zip(trajectories[:tables], table.balance[:tables]):
+                trajectory.append(tuple(int(b) for b in row))
+
+    stats.trajectories.extend(trajectories)
+    return stats
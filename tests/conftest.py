@@ -0,0 +1,13 @@
+import pytest
+from typing import Iterator
+from blackjack.strategy import load
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Keeps the strategy tables (and atlas pixels) the tests generate out of the developer's ~/.cache/blackjack"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("BLACKJACK_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+        load.cache_clear()
+        yield
+    load.cache_clear()
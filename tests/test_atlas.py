@@ -0,0 +1,40 @@
+import mmap
+import os
+import pytest
+from pathlib import Path
+from blackjack import atlas
+from blackjack.state.loading import AssetLoader
+
+
+def test_shipped_atlas_is_current():
+    index = atlas.read_index()
+
+    assert index is not None
+    keys = {os.path.splitext(os.path.basename(path))[0] for path in AssetLoader.all_assets()}
+    assert set(index["sprites"]) == keys
+
+
+def test_packed_sprites_do_not_overlap():
+    index = atlas.read_index()
+    assert index is not None
+    rects = list(index["sprites"].values())
+
+    for i, (x, y, w, h) in enumerate(rects):
+        assert x + w <= index["size"][0] and y + h <= index["size"][1]
+        for x2, y2, w2, h2 in rects[i + 1 :]:
+            assert x + w <= x2 or x2 + w2 <= x or y + h <= y2 or y2 + h2 <= y
+
+
+def test_raw_cache_round_trip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("BLACKJACK_CACHE_DIR", str(tmp_path))
+    index = atlas.read_index()
+    assert index is not None
+
+    decoded = atlas.load_pixels(index)
+    assert not isinstance(decoded, mmap.mmap)
+    assert os.path.exists(atlas.raw_cache_path(index))
+
+    mapped = atlas.load_pixels(index)
+    assert isinstance(mapped, mmap.mmap)
+    assert mapped[:] == decoded
+    mapped.close()
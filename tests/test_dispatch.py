@@ -0,0 +1,57 @@
+import pygame as pg
+from blackjack.ui import Dispatcher, HitIndex, UIState
+
+
+class Widget:
+    def __init__(self, target_state: UIState) -> None:
+        self.target_state = target_state
+        self.is_hovered = False
+        self.clicks = 0
+
+    def handle_mouse_enter(self) -> None:
+        self.is_hovered = True
+
+    def handle_mouse_leave(self) -> None:
+        self.is_hovered = False
+
+    def handle_mouse_click(self, event: pg.event.Event) -> None:
+        self.clicks += 1
+
+
+def test_hit_index_uses_the_circle_not_the_cell():
+    index = HitIndex(cell_size=100)
+    a, b = Widget(UIState.Turn), Widget(UIState.Turn)
+    index.add(a, (150, 150), 60)  # spans 4 cells
+    index.add(b, (400, 150), 10)
+
+    assert index.hit((95, 150)) is a
+    assert index.hit((195, 195)) is None  # in a cell of `a`, outside its circle
+    assert index.hit((405, 145)) is b
+    assert index.hit((-50, -50)) is None
+
+
+def test_dispatch_by_state_and_hover():
+    dispatcher = Dispatcher()
+    keys = []
+    dispatcher.subscribe(pg.KEYDOWN, lambda event: keys.append(("any", event.key)))
+    dispatcher.subscribe(pg.KEYDOWN, lambda event: keys.append(("bet", event.key)), UIState.Bet)
+
+    dispatcher.dispatch(UIState.Normal, pg.event.Event(pg.KEYDOWN, key=pg.K_1))
+    dispatcher.dispatch(UIState.Bet, pg.event.Event(pg.KEYDOWN, key=pg.K_2))
+    assert keys == [("any", pg.K_1), ("any", pg.K_2), ("bet", pg.K_2)]
+
+    left, right = Widget(UIState.Turn), Widget(UIState.Turn)
+    dispatcher.add_hit_area(left, (100, 100), 40)
+    dispatcher.add_hit_area(right, (200, 100), 40)
+
+    dispatcher.dispatch(UIState.Turn, pg.event.Event(pg.MOUSEMOTION, pos=(110, 90)))
+    assert (left.is_hovered, right.is_hovered) == (True, False)
+    dispatcher.dispatch(UIState.Turn, pg.event.Event(pg.MOUSEMOTION, pos=(190, 100)))
+    assert (left.is_hovered, right.is_hovered) == (False, True)
+
+    # Outside of their state the widgets see nothing
+    dispatcher.dispatch(UIState.Bet, pg.event.Event(pg.MOUSEBUTTONDOWN, pos=(100, 100), button=1))
+    dispatcher.dispatch(UIState.Turn, pg.event.Event(pg.MOUSEBUTTONDOWN, pos=(150, 100), button=1))
+    dispatcher.dispatch(UIState.Turn, pg.event.Event(pg.MOUSEBUTTONDOWN, pos=(100, 100), button=1))
+    assert (left.clicks, right.clicks) == (1, 0)
+    assert left.is_hovered and not right.is_hovered
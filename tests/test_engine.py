@@ -0,0 +1,79 @@
+import pytest
+import random
+from typing import List
+from blackjack.engine import Bot, Card, Dealer, Deck, Hand, ActionType, bare_card, play_round, settle, split
+
+from . import FromFixture
+
+
+def ValCard(value: int) -> Card:
+    """Returns a card which only focuses on the value"""
+    return Card(value, "", "")
+
+
+def HandOf(*values: int) -> Hand[Card]:
+    hand: Hand[Card] = Hand()
+    hand.cards.extend(ValCard(v) for v in values)
+    return hand
+
+
+@pytest.fixture
+def deck() -> Deck[Card]:
+    deck = Deck(n_decks=6, card_type=bare_card, rng=random.Random(7))
+    deck.new_shuffled_deck()
+    return deck
+
+
+@pytest.mark.parametrize(
+    "player, dealer, dealer_bj, expected_result, expected_return",
+    [
+        ([10, 9], [10, 8], False, 1, 200),
+        ([10, 8], [10, 8], False, 2, 100),
+        ([10, 7], [10, 8], False, 0, 0),
+        ([-1, 10], [10, 8], False, 1, 250),
+        ([-1, 10], [-1, 10], True, 2, 100),
+        ([10, 10], [-1, 10], True, 0, 0),
+        ([10, 5, 10], [10, 6, 10], False, 2, 100),
+        ([10, 5, 10], [10, 7], False, 0, 0),
+        ([10, 7], [10, 6, 10], False, 1, 200),
+    ],
+)
+def test_settle(
+    player: List[int], dealer: List[int], dealer_bj: bool, expected_result: int, expected_return: int
+) -> None:
+    hand, dealer_hand = HandOf(*player), HandOf(*dealer)
+    dealer_hand.is_blackjack = dealer_bj
+
+    settle(hand, dealer_hand, 100)
+    assert (hand.result, hand.net_return) == (expected_result, expected_return)
+
+
+def test_split_bookkeeping(deck: FromFixture[Deck[Card]]) -> None:
+    bot: Bot[Card] = Bot(0)
+    bot.round_bets[0] = 100
+    bot.hands[0].cards.extend([ValCard(8), ValCard(8)])
+
+    dealer: Dealer[Card] = Dealer(-1)
+    dealer.hands[0].cards.extend([ValCard(6), ValCard(10)])
+
+    assert bot.decide(0, dealer) == ActionType.Split
+    free_idx, moved, _, _ = split(bot, 0, deck)
+
+    assert free_idx == 1
+    assert bot.hands[1].cards[0] is moved
+    assert [len(h.cards) for h in bot.hands] == [2, 2, 0, 0]
+    assert bot.round_bets[:2] == [100, 100]
+    assert bot.balance == 100000 - 100
+
+
+def test_round_conserves_money(deck: FromFixture[Deck[Card]]) -> None:
+    dealer: Dealer[Card] = Dealer(-1)
+    bots: List[Bot[Card]] = [Bot(i) for i in range(4)]
+
+    for _ in range(200):
+        before = sum(bot.balance for bot in bots)
+        play_round(dealer, bots, deck)
+
+        wagered = sum(sum(bot.round_bets) for bot in bots)
+        returned = sum(hand.net_return for bot in bots for hand in bot.hands)
+        assert sum(bot.balance for bot in bots) == before - wagered + returned
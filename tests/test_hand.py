@@ -1,5 +1,6 @@
 import pytest
 from typing import List
+from blackjack.engine import CARDS, CARD_CODES
 from blackjack.state.table import Hand, Card
 
 from . import FromFixture
@@ -29,3 +30,26 @@ def ValCard(value: int) -> Card:
 def test_expected_value(hand: FromFixture[Hand], cards: List[Card], expected_value: int):
     hand.cards.extend(cards)
     assert hand.calculate_value() == expected_value
+
+
+def test_same_interned_card_twice(hand: FromFixture[Hand]):
+    ace = CARDS[CARD_CODES["ace_of_spades"]]
+    hand.cards.extend([ace, ace])
+    assert hand.calculate_value() == 12
+
+
+def test_counters_follow_split(hand: FromFixture[Hand]):
+    hand.cards.extend([ValCard(-1), ValCard(-1)])
+    assert (hand.calculate_value(), hand.is_soft()) == (12, True)
+
+    hand.cards.remove(hand.cards[1])
+    assert (hand.cards.hard_total, hand.cards.n_aces) == (1, 1)
+
+    hand.cards.append(ValCard(10))
+    assert hand.is_natural()
+
+    hand.cards.append(ValCard(10))
+    assert (hand.calculate_value(), hand.is_soft(), hand.is_over()) == (21, False, False)
+
+    hand.cards.append(ValCard(5))
+    assert hand.is_over()
@@ -0,0 +1,101 @@
+import math
+from typing import List, Tuple
+import pygame as pg
+import pytest
+import blackjack.app
+from blackjack import App
+from blackjack.engine import CARD_CODES, CARDS
+from blackjack.headless import Autoplayer, drive
+from blackjack.state.loading import Loading
+from blackjack.state.table import DealtCard, GamePhase, Table, TurnPhase
+from blackjack.ui import UIState
+
+
+def test_autoplayer_finishes_rounds_offscreen():
+    app = App(Loading, headless=True, resolution=(800, 600), animation_speed=math.inf)
+    assert app.display.get_size() == (800, 600)
+
+    phases = []
+    drive(app, Autoplayer(seed=3), 600, on_frame=lambda app: phases.append(getattr(app.state, "game_phase", None)))
+
+    assert isinstance(app.state, Table)
+    assert phases.count(GamePhase.Bet) < len(phases) / 2
+    assert GamePhase.EndRound in phases and GamePhase.Play in phases
+
+
+def reach_player_action(seed: int) -> Tuple[App, Table]:
+    """Plays until the player's hand waits for a turn button"""
+    app = App(Loading, headless=True, resolution=(800, 600), animation_speed=math.inf)
+    autoplayer = Autoplayer(seed=seed)
+
+    def bet_only(app: App) -> List[pg.event.Event]:
+        return autoplayer(app) if app.ui_state == UIState.Bet else []
+
+    for _ in range(2000):
+        drive(app, bet_only, 1)
+        table = app.state
+        if isinstance(table, Table) and app.ui_state == UIState.Turn and table.awaits_action():
+            return app, table
+    raise AssertionError("the player never got a turn")
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [("10_of_clubs", "king_of_clubs", "5_of_clubs"), ("ace_of_clubs", "king_of_clubs")],
+    ids=["bust", "blackjack"],
+)
+def test_finished_hand_moves_on_without_idling(keys: Tuple[str, ...]):
+    app, table = reach_player_action(seed=3)
+    assert table.is_idle()
+
+    hand = table.player.hands[table.current_turn[1]]
+    hand.cards.clear()
+    hand.cards.extend(DealtCard(CARDS[CARD_CODES[key]]) for key in keys)
+
+    for _ in range(10):
+        if table.turn_phase == TurnPhase.Dealer:
+            break
+        assert not table.is_idle()
+        app.tick()
+    assert table.turn_phase == TurnPhase.Dealer
+
+
+def reach_bet() -> Tuple[App, Table]:
+    """Plays until the bet box waits for a bet, with every card in place"""
+    app = App(Loading, headless=True, resolution=(800, 600), animation_speed=math.inf)
+    for _ in range(600):
+        drive(app, lambda app: [], 1)
+        table = app.state
+        if isinstance(table, Table) and app.ui_state == UIState.Bet and len(table.movables) == 0:
+            return app, table
+    raise AssertionError("the table never asked for a bet")
+
+
+def test_bet_frame_builds_the_scene_once(monkeypatch: pytest.MonkeyPatch):
+    app, table = reach_bet()
+    calls: List[int] = []
+    scene = table.scene
+
+    def counted_scene() -> List[Tuple[pg.Surface, Tuple[float, float]]]:
+        calls.append(app.frame)
+        return scene()
+
+    monkeypatch.setattr(table, "scene", counted_scene)
+
+    app.render()
+    app.render()
+    assert calls == [app.frame - 1, app.frame]
+
+
+def test_full_redraw_matches_dirty_rects(monkeypatch: pytest.MonkeyPatch):
+    app, table = reach_bet()
+    table.last_scene = None
+    app.render()
+    assert app.dirty_rects is not None
+    dirty = pg.image.tobytes(app.display, "RGB")
+
+    # BLACKJACK_DIRTY_RECTS=no: the table, then the fade and the bet box blended over it, every frame
+    monkeypatch.setattr(blackjack.app, "DIRTY_RECTS", "no")
+    app.render()
+    assert app.dirty_rects is None
+    assert pg.image.tobytes(app.display, "RGB") == dirty
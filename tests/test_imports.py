@@ -0,0 +1,27 @@
+import os
+import subprocess
+import sys
+
+PURE_LOGIC = ["blackjack", "blackjack.engine", "blackjack.sim", "blackjack.odds", "blackjack.log", "blackjack.trace"]
+
+
+def run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "BLACKJACK_ENABLE_LOGGING": "yes"}
+    return subprocess.run([sys.executable, *flags, "-c", code], capture_output=True, text=True, check=True, env=env)
+
+
+def test_pure_logic_imports_without_pygame():
+    stderr = run(f"import {', '.join(PURE_LOGIC)}", "-X", "importtime").stderr
+    imported = [line.split("|")[-1].strip() for line in stderr.splitlines() if line.startswith("import time:")]
+    assert set(PURE_LOGIC) <= set(imported)
+    assert not [name for name in imported if name.split(".")[0] == "pygame"]
+
+
+def test_importing_the_game_sets_nothing_up():
+    code = "import pygame, blackjack.app, blackjack.state.table; print(pygame.get_init(), blackjack.log.logger.writer)"
+    assert run(code).stdout.split()[-2:] == ["False", "None"]
+
+
+def test_app_is_imported_on_first_use():
+    code = "import sys, blackjack; print('blackjack.app' in sys.modules, blackjack.App.__module__)"
+    assert run(code).stdout.split()[-2:] == ["False", "blackjack.app"]
@@ -12,3 +12,13 @@ def assets() -> AssetLoader:
 def test_expected_assets(assets: FromFixture[AssetLoader]):
     # 52 cards + 1 back + 1 front
     assert assets.expected_files == 55
+
+
+def test_collects_every_asset():
+    assets = AssetLoader(use_atlas=False)
+    images = {}
+    while assets.pending:
+        images.update(assets.collect())
+
+    assert len(images) == assets.expected_files
+    assert assets.elapsed is not None
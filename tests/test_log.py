@@ -0,0 +1,81 @@
+from pathlib import Path
+import threading
+import time
+from blackjack import log
+from blackjack.log import LogWriter, Logger
+
+
+class Loud:
+    """Counts how often it is formatted"""
+
+    formatted = 0
+
+    def __format__(self, spec: str) -> str:
+        Loud.formatted += 1
+        return "loud"
+
+
+def test_disabled_formats_nothing():
+    logger = Logger()
+    logger.debug("{}", Loud())
+    assert Loud.formatted == 0
+
+
+def test_lines_are_written_in_the_background(tmp_path: Path):
+    path = tmp_path / "game.log"
+    logger = Logger()
+    logger.writer = LogWriter(str(path), flush_interval=60, batch_size=2)
+    logger.debug("Bot {} Hit!", 3)
+    logger.info("{:.1f}s", 1.25)
+
+    # Woken by the full batch, long before the flush interval
+    deadline = time.perf_counter() + 5
+    while logger.writer.written < 2 and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    assert logger.writer.written == 2
+    logger.writer.stop()
+
+    debug, info = [line.split(" | ", 1)[1] for line in path.read_text().splitlines()]
+    assert debug.startswith("DEBUG | test_log.py:test_lines_are_written_in_the_background:")
+    assert debug.endswith(" -> Bot 3 Hit!") and info.startswith("INFO | ") and info.endswith(" -> 1.2s")
+
+
+def test_full_queue_drops_and_says_so(tmp_path: Path):
+    path = tmp_path / "game.log"
+    writer = LogWriter(str(path), flush_interval=60, capacity=2)
+    logger = Logger()
+    logger.writer = writer
+    for n in range(5):
+        logger.warning("{}", n)
+    logger.error("{} {}", 1)
+    writer.stop()
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 3 and lines[-1] == "4 log records dropped, the writer fell behind"
+
+
+def test_setup_replaces_the_writer(tmp_path: Path):
+    first = log.setup(True, str(tmp_path / "a.log"))
+    second = log.setup(True, str(tmp_path / "b.log"))
+    assert first is not None and first.stopped and log.logger.writer is second
+    assert log.setup(False) is None and second is not None and second.stopped and log.logger.writer is None
+
+
+def test_drops_from_many_threads_are_all_counted(tmp_path: Path):
+    path = tmp_path / "game.log"
+    writer = LogWriter(str(path), flush_interval=0.001, capacity=0)
+    logger = Logger()
+    logger.writer = writer
+
+    def spam() -> None:
+        for n in range(20_000):
+            logger.debug("{}", n)
+
+    threads = [threading.Thread(target=spam) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.stop()
+
+    assert sum(int(line.split()[0]) for line in path.read_text().splitlines()) == 4 * 20_000
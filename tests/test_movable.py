@@ -0,0 +1,50 @@
+import math
+from blackjack.engine import CARDS
+from blackjack.state.table import DealtCard, Movable, Movables
+from blackjack.util import Vec2
+
+
+def card_at(x: float, y: float) -> DealtCard:
+    card = DealtCard(CARDS[0])
+    card.pos = Vec2(x, y)
+    return card
+
+
+def test_ticks_and_interpolation():
+    movables = Movables()
+    movables.append(movable := Movable(card_at(0, 0), dest=Vec2(100, 0), speed=1200))
+
+    # 1200 px/s at 120 ticks/s is 10 px per tick, whatever the frame rate the ticks are run at
+    ticks = 0
+    while len(movables):
+        movables.step(1 / 120)
+        ticks += 1
+        if ticks == 3:
+            assert movable.interpolated_pos(0.5) == (25, 0)
+    assert ticks == 10
+    assert movable.is_done()
+
+
+def test_arrivals_retire_in_launch_order():
+    movables = Movables()
+    cards = [card_at(0, 0), card_at(50, 50), card_at(0, 0)]
+    movables.append(Movable(cards[0], dest=Vec2(1000, 0), speed=600))
+    movables.append(Movable(cards[1], dest=Vec2(50, 50), speed=600))  # Already there
+    movables.append(Movable(cards[2], dest=Vec2(5, 0), speed=600))
+
+    assert movables.step(1 / 120) == [cards[1], cards[2]]
+    assert len(movables) == 1
+    assert movables.step(1 / 120, math.inf) == [cards[0]]
+    assert (cards[0].pos.x, cards[0].pos.y) == (1000, 0)
+
+
+def test_shared_start_position():
+    first, second = card_at(0, 0), card_at(0, 0)
+    first.pos = second.pos = Vec2(0, 0)
+    movables = Movables()
+    movables.append(Movable(first, dest=Vec2(100, 0), speed=1200))
+    movables.append(Movable(second, dest=Vec2(0, 100), speed=1200))
+
+    movables.step(1 / 120)
+    assert (first.pos.x, first.pos.y) == (10, 0)
+    assert (second.pos.x, second.pos.y) == (0, 10)
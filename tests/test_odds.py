@@ -0,0 +1,47 @@
+import pytest
+from blackjack.odds import BLACKJACK, BUST, cache_info, dealer_outcomes, full_shoe, given_no_blackjack
+
+
+def shoe_without(*ranks: int) -> list:
+    counts = list(full_shoe(6))
+    for rank in ranks:
+        counts[rank] -= 1
+    return counts
+
+
+@pytest.mark.parametrize("upcard", range(1, 11))
+def test_distribution_sums_to_one(upcard: int) -> None:
+    assert sum(dealer_outcomes(shoe_without(upcard), upcard)) == pytest.approx(1.0)
+
+
+def test_known_values() -> None:
+    assert dealer_outcomes(shoe_without(6), 6)[BUST] == pytest.approx(0.4228, abs=1e-4)
+    assert dealer_outcomes(shoe_without(1), 1)[BLACKJACK] == pytest.approx(96 / 311)
+    assert given_no_blackjack(dealer_outcomes(shoe_without(10), 10))[BLACKJACK] == 0.0
+
+
+def test_composition_exact() -> None:
+    # Only tens left: a 6 upcard makes 16 and must draw a ten
+    counts = [0] * 11
+    counts[10] = 5
+    assert dealer_outcomes(counts, 6)[BUST] == 1.0
+
+    # One 5 and one ten left: whichever comes first, the other makes 21. The 5 can't be drawn twice.
+    counts[10], counts[5] = 1, 1
+    assert dealer_outcomes(counts, 6) == pytest.approx((0, 0, 0, 0, 1, 0, 0))
+
+
+def test_hit_soft_17() -> None:
+    # Ace up with a 6 and a 4 left: S17 stands on A,6 while H17 draws the 4
+    counts = [0] * 11
+    counts[6], counts[4] = 1, 1
+    assert dealer_outcomes(counts, 1) == pytest.approx((0.5, 0, 0, 0, 0.5, 0, 0))
+    assert dealer_outcomes(counts, 1, hit_soft_17=True) == pytest.approx((0, 0, 0, 0, 1, 0, 0))
+
+
+def test_repeated_queries_hit_the_cache() -> None:
+    counts = shoe_without(9, 9, 9, 7)
+    dealer_outcomes(counts, 7)
+    misses = cache_info().misses
+    dealer_outcomes(counts, 7)
+    assert cache_info().misses == misses
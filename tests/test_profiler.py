@@ -0,0 +1,37 @@
+import json
+from pathlib import Path
+from blackjack.profiler import NULL_SCOPE, Profiler
+
+
+def test_disabled_records_nothing():
+    profiler = Profiler()
+    assert profiler.scope("update") is NULL_SCOPE
+    with profiler.scope("update"):
+        pass
+    profiler.next_frame()
+    profiler.next_frame()
+    assert len(profiler.frames) == 0 and profiler.summary()["frames"] == 0
+
+
+def test_scopes_add_up_per_frame_in_a_ring_buffer(tmp_path: Path):
+    profiler = Profiler(enabled=True, capacity=3)
+    for _ in range(5):
+        profiler.next_frame()
+        for _ in range(4):
+            with profiler.scope("tick"):
+                pass
+        with profiler.scope("render"):
+            pass
+    profiler.next_frame()
+
+    assert len(profiler.frames) == 3
+    for frame, scopes in profiler.frames:
+        assert set(scopes) == {"tick", "render"}
+        assert scopes["tick"] + scopes["render"] <= frame
+
+    summary = profiler.summary(top=1)
+    assert summary["frames"] == 3 and summary["p50_ms"] <= summary["p99_ms"]
+    assert len(summary["scopes"]) == 1
+
+    dumped = json.loads(Path(profiler.dump(str(tmp_path / "profile.json"))).read_text())
+    assert len(dumped["frames"]) == 3 and dumped["summary"]["frames"] == 3
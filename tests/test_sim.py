@@ -0,0 +1,26 @@
+from blackjack.sim import SimStats, simulate, simulate_parallel
+
+
+def test_simulate_is_deterministic_for_a_seed():
+    a, b = simulate(300, seed="x"), simulate(300, seed="x")
+    assert a == b
+    assert a != simulate(300, seed="y")
+
+
+def test_parallel_is_bit_identical_for_seed_and_workers():
+    a = simulate_parallel(400, workers=2, seed=11, sample_every=50)
+    b = simulate_parallel(400, workers=2, seed=11, sample_every=50)
+    assert a == b
+    assert a.rounds == 400
+    assert len(a.trajectories) == 2
+    assert len(a.trajectories[0]) == 200 // 50 + 1
+
+
+def test_merge_sums_counters():
+    a, b = simulate(100, seed=1), simulate(50, seed=2)
+    merged = SimStats()
+    merged.merge(a)
+    merged.merge(b)
+    assert merged.rounds == 150
+    assert merged.wagered == a.wagered + b.wagered
+    assert merged.trajectories == a.trajectories + b.trajectories
@@ -0,0 +1,66 @@
+import pytest
+from pathlib import Path
+from blackjack.odds import BUST, dealer_outcomes, given_no_blackjack
+from blackjack.strategy import DOUBLE, HIT, STAND, Rules, Strategy, _Evaluator, cache_path, generate, load
+
+
+@pytest.fixture(scope="module")
+def strategy() -> Strategy:
+    return generate(Rules())
+
+
+@pytest.mark.parametrize(
+    "total, is_soft, first_two, upcard, expected",
+    [
+        (16, False, True, 10, HIT),
+        (17, False, True, 4, STAND),
+        (12, False, True, 2, HIT),
+        (11, False, True, 6, DOUBLE),
+        (11, False, False, 6, HIT),
+        (17, True, True, 4, DOUBLE),
+        (18, True, False, 9, HIT),
+        (18, True, True, 7, STAND),
+        # A bust pushes if the dealer busts as well, so stiff hands hit far more than in the usual charts
+        (12, False, True, 4, HIT),
+        (13, False, False, 6, HIT),
+        (17, False, False, 8, HIT),
+    ],
+)
+def test_known_decisions(
+    strategy: Strategy, total: int, is_soft: bool, first_two: bool, upcard: int, expected: int
+) -> None:
+    assert strategy.decide(total, is_soft, first_two, upcard) == expected
+
+
+def test_known_splits(strategy: Strategy) -> None:
+    assert all(strategy.should_split(8, up) for up in range(1, 11))
+    assert all(strategy.should_split(1, up) for up in range(1, 11))
+    assert [up for up in range(1, 11) if strategy.should_split(10, up)] == [6]
+    assert not any(strategy.should_split(5, up) for up in range(1, 11))
+
+
+def test_cache_round_trip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, strategy: Strategy) -> None:
+    monkeypatch.setenv("BLACKJACK_CACHE_DIR", str(tmp_path))
+    load.cache_clear()
+    try:
+        assert load().table == strategy.table
+        assert Path(cache_path(Rules())).parent == tmp_path
+
+        load.cache_clear()
+        Path(cache_path(Rules())).write_bytes(b"garbage")
+        assert load().table == strategy.table
+    finally:
+        load.cache_clear()
+
+
+def test_bust_pushes_when_the_dealer_busts_too() -> None:
+    rules = Rules()
+    counts = rules.shoe()
+    counts[6] -= 1
+    dealer_bust = given_no_blackjack(dealer_outcomes(counts, 6, rules.hit_soft_17))[BUST]
+    evaluator = _Evaluator(counts, 6, rules)
+
+    assert 0.4 < dealer_bust < 0.45
+    assert evaluator.stand(22) == pytest.approx(dealer_bust - 1)
+    ev, action = evaluator.best_multi(25, False)
+    assert ev == pytest.approx(dealer_bust - 1) and action == STAND
@@ -0,0 +1,19 @@
+import pygame as pg
+from blackjack.ui import TextCache
+
+
+def test_hits_misses_and_eviction():
+    pg.font.init()
+    font = pg.font.Font(None, 12)
+    cache = TextCache(maxsize=2)
+
+    a = cache.render(font, "a", (255, 255, 255))
+    assert cache.render(font, "a", (255, 255, 255)) is a
+    assert cache.render(font, "a", (0, 0, 0)) is not a
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # "a" in white was used least recently, so it is the one evicted
+    cache.render(font, "b", (255, 255, 255))
+    assert len(cache) == 2
+    assert cache.render(font, "a", (255, 255, 255)) is not a
+    assert cache.misses == 4
@@ -0,0 +1,46 @@
+import json
+import pytest
+from pathlib import Path
+from blackjack.engine import CARDS
+from blackjack.profiler import Profiler
+from blackjack.state.table import DealtCard, Movable, Movables
+from blackjack import trace
+from blackjack.trace import TRACKS, Tracer
+from blackjack.util import Vec2
+
+
+def test_frames_scopes_and_flights(tmp_path: Path):
+    tracer = Tracer(str(tmp_path / "trace.json"))
+    profiler = Profiler(tracer=tracer)
+    movables = Movables(tracer)
+
+    card = DealtCard(CARDS[0])
+    card.pos = Vec2(0, 0)
+    movables.append(Movable(card, dest=Vec2(30, 0), speed=1200))
+    for _ in range(4):
+        profiler.next_frame()
+        with profiler.scope("update.state"):
+            movables.step(1 / 120)
+    profiler.next_frame()
+    tracer.close()
+
+    events = json.loads((tmp_path / "trace.json").read_text())
+    spans = [e for e in events if e["ph"] == "X"]
+    assert [e["name"] for e in spans].count("frame") == 4
+    assert [e["name"] for e in spans].count("update.state") == 4
+    assert all(e["dur"] >= 0 for e in spans)
+
+    flight = [e for e in events if e["ph"] in "be"]
+    assert [e["ph"] for e in flight] == ["b", "e"] and flight[0]["id"] == flight[1]["id"]
+    assert flight[0]["tid"] == TRACKS["movables"] and flight[0]["args"]["sprite"] == card.image_key
+
+
+def test_unclosed_trace_has_everything_but_the_last_interval(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(trace, "FLUSH_INTERVAL", 0.0)
+    tracer = Tracer(str(tmp_path / "trace.json"))
+    tracer.instant("crash")
+
+    # What a crash would leave behind: a file without its closing bracket, which viewers accept
+    events = json.loads((tmp_path / "trace.json").read_text() + "]")
+    assert "crash" in [e["name"] for e in events]
+    tracer.close()
@@ -0,0 +1,61 @@
+import pytest
+import random
+from array import array
+from typing import List
+
+np = pytest.importorskip("numpy")
+
+from blackjack.engine import CARD_CODES, Bot, Card, Dealer, Deck, bare_card, play_round
+from blackjack.vectorized import ACE, BatchShoe, BatchTable, simulate_vectorized, soft_totals
+
+
+def card_key(value: int) -> str:
+    return f"{'ace' if value == ACE else value}_of_spades"
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_batch_round_matches_object_engine(seed: int):
+    n_tables, n_bots = 300, 4
+    shoe = BatchShoe(n_tables, 6, np.random.default_rng(seed))
+    shoes = shoe.cards.copy()
+
+    bets = np.empty((n_tables, n_bots), dtype=np.int64)
+    for t in range(n_tables):
+        bet_rng = random.Random(t)
+        bets[t] = [bet_rng.randrange(100, 5001) for _ in range(n_bots)]
+
+    table = BatchTable(n_tables, n_bots, shoe)
+    table.play_round(bets)
+
+    for t in range(n_tables):
+        bet_rng = random.Random(t)
+        dealer: Dealer[Card] = Dealer(-1)
+        bots: List[Bot[Card]] = [Bot(i, rng=bet_rng) for i in range(n_bots)]
+        deck = Deck(n_decks=6, card_type=bare_card)
+        # The object deck pops from the end of its shoe
+        deck._shoe = array("b", [CARD_CODES[card_key(v)] for v in reversed(shoes[t])])
+        play_round(dealer, bots, deck)
+
+        for seat, bot in enumerate(bots):
+            assert bot.balance == table.balance[t, seat]
+            for h, hand in enumerate(bot.hands):
+                assert len(hand.cards) == table.n_cards[t, seat, h]
+                assert hand.calculate_value() == soft_totals(table.totals, table.aces)[t, seat, h]
+                assert (hand.result, hand.net_return) == (table.result[t, seat, h], table.net_return[t, seat, h])
+
+
+def test_simulate_vectorized_counts_exact_rounds():
+    stats = simulate_vectorized(1000, seed="a", n_tables=300)
+    assert stats.rounds == 1000
+    assert stats.wins + stats.draws + stats.losses == stats.hands
+    assert stats == simulate_vectorized(1000, seed="a", n_tables=300)
+
+
+def test_partial_last_batch_only_counts_recorded_rounds():
+    # 3 batches of 4 tables, of which only 2 play the last round
+    stats = simulate_vectorized(10, seed="b", sample_every=1, n_tables=4)
+    assert stats.rounds == 10
+    assert [len(trajectory) for trajectory in stats.trajectories] == [4, 4, 3, 3]
+
+    net = sum(sum(t[-1]) - sum(t[0]) for t in stats.trajectories)
+    assert net == stats.returned - stats.wagered
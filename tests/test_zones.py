@@ -0,0 +1,29 @@
+import pygame as pg
+from blackjack.state.table import HAND_CORNERS, PRECOMPUTED_SLOTS, ZoneGrid
+
+
+def zones() -> dict:
+    out = {"deck": pg.Rect(900, 10, 50, 70), "burn": pg.Rect(10, 10, 50, 70), "hand_dealer": pg.Rect(400, 50, 60, 40)}
+    for seat in range(4):
+        for i, corner in enumerate(HAND_CORNERS):
+            out[f"hand_{corner}_{seat}"] = pg.Rect(seat * 200 + i * 10, 300 + i * 5, 60, 40)
+        out[f"bet_{seat}"] = pg.Rect(seat * 200, 400, 120, 30)
+        out[f"stat_{seat}"] = pg.Rect(seat * 200, 450, 120, 30)
+    return out
+
+
+def test_grid_matches_named_zones():
+    named = zones()
+    grid = ZoneGrid(named, 4)
+
+    for seat in range(4):
+        for hand, corner in enumerate(HAND_CORNERS):
+            x, y = named[f"hand_{corner}_{seat}"].topleft
+            assert (grid.card(seat, hand, 0).x, grid.card(seat, hand, 0).y) == (x, y)
+            assert (grid.card(seat, hand, 3).x, grid.card(seat, hand, 3).y) == (x + 60, y + 30)
+        assert grid.bets[seat] == named[f"bet_{seat}"]
+
+    # The dealer is seat -1, and slots past the precomputed ones carry on along the same diagonal
+    x, y = named["hand_dealer"].topleft
+    far = grid.card(-1, 0, PRECOMPUTED_SLOTS + 2)
+    assert (far.x, far.y) == (x + (PRECOMPUTED_SLOTS + 2) * 20, y + (PRECOMPUTED_SLOTS + 2) * 10)